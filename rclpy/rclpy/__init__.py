@@ -70,7 +70,12 @@ def init(*, args: List[str] = None, context: Context = None) -> None:
     context = get_default_context() if context is None else context
     # imported locally to avoid loading extensions on module import
     from rclpy.impl.implementation_singleton import rclpy_implementation
-    return rclpy_implementation.rclpy_init(args if args is not None else sys.argv, context.handle)
+    from rclpy.impl.rcutils_logger import _invalidate_effective_levels
+    ret = rclpy_implementation.rclpy_init(
+        args if args is not None else sys.argv, context.handle)
+    # Logger levels may have been set from the command line arguments
+    _invalidate_effective_levels()
+    return ret
 
 
 # The global spin functions need an executor to do the work
@@ -111,7 +116,8 @@ def create_node(
     namespace: str = None,
     use_global_arguments: bool = True,
     start_parameter_services: bool = True,
-    initial_parameters: List[Parameter] = None
+    initial_parameters: List[Parameter] = None,
+    shared_time_source: bool = False
 ) -> 'Node':
     """
     Create an instance of :class:`.Node`.
@@ -126,6 +132,8 @@ def create_node(
         arguments.
     :param start_parameter_services: ``False`` if the node should not create parameter services.
     :param initial_parameters: A list of :class:`.Parameter` to be set during node creation.
+    :param shared_time_source: ``True`` if the node should share a single clock topic
+        subscription with the other nodes of its context that set this flag.
     :return: An instance of the newly created node.
     """
     # imported locally to avoid loading extensions on module import
@@ -134,7 +142,8 @@ def create_node(
         node_name, context=context, cli_args=cli_args, namespace=namespace,
         use_global_arguments=use_global_arguments,
         start_parameter_services=start_parameter_services,
-        initial_parameters=initial_parameters)
+        initial_parameters=initial_parameters,
+        shared_time_source=shared_time_source)
 
 
 def spin_once(node: 'Node', *, executor: 'Executor' = None, timeout_sec: float = None) -> None:
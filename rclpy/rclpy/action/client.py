@@ -31,6 +31,13 @@ from rclpy.waitable import NumberOfEntities, Waitable
 from unique_identifier_msgs.msg import UUID
 
 
+_TERMINAL_GOAL_STATUSES = (
+    GoalStatus.STATUS_SUCCEEDED,
+    GoalStatus.STATUS_CANCELED,
+    GoalStatus.STATUS_ABORTED,
+)
+
+
 class ClientGoalHandle():
     """Goal handle for working with Action Clients."""
 
@@ -171,6 +178,8 @@ class ActionClient(Waitable):
         self._pending_cancel_requests = {}
         # key: result request sequence number, value: Future for result response
         self._pending_result_requests = {}
+        # key: Future for a pending goal, cancel or result request, value: its sequence number
+        self._pending_request_sequence_numbers = {}
         # key: UUID in bytes, value: callback function
         self._feedback_callbacks = {}
 
@@ -193,16 +202,11 @@ class ActionClient(Waitable):
         :return: The sequence number associated with the removed future, or
             None if the future was not found in the list.
         """
-        for seq, req_future in list(pending_requests.items()):
-            if future == req_future:
-                try:
-                    del pending_requests[seq]
-                except KeyError:
-                    pass
-                else:
-                    self.remove_future(future)
-                    return seq
-        return None
+        seq = self._pending_request_sequence_numbers.pop(future, None)
+        if seq is None or pending_requests.pop(seq, None) is None:
+            return None
+        self.remove_future(future)
+        return seq
 
     def _remove_pending_goal_request(self, future):
         seq = self._remove_pending_request(future, self._pending_goal_requests)
@@ -306,24 +310,30 @@ class ActionClient(Waitable):
             if goal_uuid in self._feedback_callbacks:
                 await await_or_execute(self._feedback_callbacks[goal_uuid], feedback_msg)
 
-        if 'status' in taken_data:
-            # Update the status of all goal handles maintained by this Action Client
+        if 'status' in taken_data and self._goal_handles:
+            # Update the status of the goal handles maintained by this Action Client,
+            # stopping once all of them have been seen
+            num_unseen = len(self._goal_handles)
             for status_msg in taken_data['status'].status_list:
                 goal_uuid = bytes(status_msg.goal_info.goal_id.uuid)
-                status = status_msg.status
-
-                if goal_uuid in self._goal_handles:
-                    goal_handle = self._goal_handles[goal_uuid]()
-                    if goal_handle is not None:
-                        goal_handle._status = status
-                        # Remove "done" goals from the list
-                        if (GoalStatus.STATUS_SUCCEEDED == status or
-                                GoalStatus.STATUS_CANCELED == status or
-                                GoalStatus.STATUS_ABORTED == status):
-                            del self._goal_handles[goal_uuid]
-                    else:
-                        # Weak reference is None
+                goal_handle_ref = self._goal_handles.get(goal_uuid)
+                if goal_handle_ref is None:
+                    continue
+
+                goal_handle = goal_handle_ref()
+                if goal_handle is not None:
+                    status = status_msg.status
+                    goal_handle._status = status
+                    # Remove "done" goals from the list
+                    if status in _TERMINAL_GOAL_STATUSES:
                         del self._goal_handles[goal_uuid]
+                else:
+                    # Weak reference is None
+                    del self._goal_handles[goal_uuid]
+
+                num_unseen -= 1
+                if num_unseen == 0:
+                    break
 
     def get_num_entities(self):
         """Return number of each type of entity used in the wait set."""
@@ -400,6 +410,33 @@ class ActionClient(Waitable):
         if not isinstance(goal, self._action_type.Goal):
             raise TypeError()
 
+        return self._send_goal_request(goal, feedback_callback, goal_uuid)
+
+    def send_goals_async(self, goals, feedback_callback=None):
+        """
+        Send several goals and asynchronously get the results.
+
+        This is equivalent to calling :meth:`send_goal_async` for each goal, but avoids
+        repeating the per call overhead.
+
+        :param goals: The goal requests.
+        :type goals: iterable of action_type.Goal
+        :param feedback_callback: Callback function for feedback associated with any of the goals.
+        :type feedback_callback: function
+        :return: a list of Future instances to goal handles, in the same order as the goals.
+        :rtype: list of :class:`rclpy.task.Future` instances
+        :raises: TypeError if the type of any of the passed goals isn't an instance of
+          the Goal type of the provided action when the service was
+          constructed.
+        """
+        goals = list(goals)
+        goal_type = self._action_type.Goal
+        if not all(isinstance(goal, goal_type) for goal in goals):
+            raise TypeError()
+
+        return [self._send_goal_request(goal, feedback_callback, None) for goal in goals]
+
+    def _send_goal_request(self, goal, feedback_callback, goal_uuid):
         request = self._action_type.Impl.SendGoalService.Request()
         request.goal_id = self._generate_random_uuid() if goal_uuid is None else goal_uuid
         request.goal = goal
@@ -416,6 +453,7 @@ class ActionClient(Waitable):
 
         future = Future()
         self._pending_goal_requests[sequence_number] = future
+        self._pending_request_sequence_numbers[future] = sequence_number
         self._sequence_number_to_goal_id[sequence_number] = request.goal_id
         future.add_done_callback(self._remove_pending_goal_request)
         # Add future so executor is aware
@@ -471,6 +509,7 @@ class ActionClient(Waitable):
 
         future = Future()
         self._pending_cancel_requests[sequence_number] = future
+        self._pending_request_sequence_numbers[future] = sequence_number
         future.add_done_callback(self._remove_pending_cancel_request)
         # Add future so executor is aware
         self.add_future(future)
@@ -525,6 +564,7 @@ class ActionClient(Waitable):
 
         future = Future()
         self._pending_result_requests[sequence_number] = future
+        self._pending_request_sequence_numbers[future] = sequence_number
         future.add_done_callback(self._remove_pending_result_request)
         # Add future so executor is aware
         self.add_future(future)
@@ -12,9 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import deque
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 import functools
+import inspect
 import threading
+import time
 
 from action_msgs.msg import GoalInfo, GoalStatus
 
@@ -22,7 +27,8 @@ from rclpy.executors import await_or_execute
 from rclpy.impl.implementation_singleton import rclpy_action_implementation as _rclpy_action
 from rclpy.qos import qos_profile_action_status_default
 from rclpy.qos import qos_profile_default, qos_profile_services_default
-from rclpy.task import Future
+from rclpy.serialization import serialize_message
+from rclpy.task import Future, Task
 from rclpy.type_support import check_for_type_support
 from rclpy.waitable import NumberOfEntities, Waitable
 
@@ -41,6 +47,13 @@ class CancelResponse(Enum):
     ACCEPT = 2
 
 
+class AdmissionPolicy(Enum):
+    """What to do with a new goal when the goal execution workers and queue are full."""
+
+    REJECT = 1
+    PREEMPT_OLDEST = 2
+
+
 class GoalEvent(Enum):
     """Goal events that cause state transitions."""
 
@@ -51,6 +64,9 @@ class GoalEvent(Enum):
     CANCELED = 5
 
 
+_TERMINAL_GOAL_EVENTS = (GoalEvent.SUCCEED, GoalEvent.ABORT, GoalEvent.CANCELED)
+
+
 class ServerGoalHandle:
     """Goal handle for working with Action Servers."""
 
@@ -73,6 +89,9 @@ class ServerGoalHandle:
         self._goal_info = goal_info
         self._goal_request = goal_request
         self._cancel_requested = False
+        # Newest feedback held back by the feedback rate limit, if any
+        self._pending_feedback = None
+        self._last_feedback_time = None
         self._result_future = Future()
         action_server.add_future(self._result_future)
         self._lock = threading.Lock()
@@ -110,20 +129,32 @@ class ServerGoalHandle:
             return _rclpy_action.rclpy_action_goal_handle_get_status(self._handle)
 
     def _update_state(self, event):
+        finished = False
         with self._lock:
             # Ignore updates for already destructed goal handles
             if self._handle is None:
                 return
 
+            # Send rate limited feedback before the goal finishes
+            if event in _TERMINAL_GOAL_EVENTS and self._pending_feedback is not None:
+                self._publish_feedback_message(self._pending_feedback)
+                self._pending_feedback = None
+
             # Update state
             _rclpy_action.rclpy_action_update_goal_state(self._handle, event.value)
 
             # Publish state change
-            _rclpy_action.rclpy_action_publish_status(self._action_server._handle)
+            self._action_server._publish_status()
 
             # If it's a terminal state, then also notify the action server
             if not _rclpy_action.rclpy_action_goal_handle_is_active(self._handle):
+                self._action_server._result_store.mark_completed(bytes(self.goal_id.uuid))
                 self._action_server.notify_goal_done()
+                finished = True
+
+        if finished:
+            # A goal that finished before it was executed no longer takes a worker slot
+            self._action_server._release_admitted_goal(bytes(self.goal_id.uuid))
 
     def execute(self, execute_callback=None):
         # It's possible that there has been a request to cancel the goal prior to executing.
@@ -134,23 +165,57 @@ class ServerGoalHandle:
         self._action_server.notify_execute(self, execute_callback)
 
     def publish_feedback(self, feedback):
+        """
+        Publish feedback for this goal.
+
+        If the action server limits the feedback rate, then feedback published less than one
+        period after the previous one is held back, and only the newest held back feedback is
+        published once the period has passed or the goal reaches a terminal state.
+
+        :param feedback: The user defined feedback message.
+        """
         if not isinstance(feedback, self._action_server.action_type.Feedback):
             raise TypeError()
 
+        period = self._action_server._feedback_publish_period
         with self._lock:
             # Ignore for already destructed goal handles
             if self._handle is None:
                 return
 
-            # Populate the feedback message with metadata about this goal
-            # and the user defined message
-            feedback_message = self._action_server.action_type.Impl.FeedbackMessage()
-            feedback_message.goal_id = self.goal_id
-            feedback_message.feedback = feedback
+            if period is not None:
+                now = time.monotonic()
+                if (
+                    self._last_feedback_time is not None and
+                    now - self._last_feedback_time < period
+                ):
+                    if self._pending_feedback is None:
+                        self._action_server._schedule_feedback_flush(self)
+                    self._pending_feedback = feedback
+                    return
+                self._last_feedback_time = now
+                self._pending_feedback = None
+
+            self._publish_feedback_message(feedback)
+
+    def _flush_feedback(self):
+        with self._lock:
+            if self._handle is None or self._pending_feedback is None:
+                return
+            self._last_feedback_time = time.monotonic()
+            self._publish_feedback_message(self._pending_feedback)
+            self._pending_feedback = None
+
+    def _publish_feedback_message(self, feedback):
+        # Populate the feedback message with metadata about this goal
+        # and the user defined message
+        feedback_message = self._action_server.action_type.Impl.FeedbackMessage()
+        feedback_message.goal_id = self.goal_id
+        feedback_message.feedback = feedback
 
-            # Publish
-            _rclpy_action.rclpy_action_publish_feedback(
-                self._action_server._handle, feedback_message)
+        # Publish
+        _rclpy_action.rclpy_action_publish_feedback(
+            self._action_server._handle, feedback_message)
 
     def succeed(self):
         self._update_state(GoalEvent.SUCCEED)
@@ -171,6 +236,120 @@ class ServerGoalHandle:
         self._action_server.remove_future(self._result_future)
 
 
+class ResultStore:
+    """
+    A bounded store for the results of goals that reached a terminal state.
+
+    An action server keeps the result of a finished goal around so that it can answer result
+    requests until the goal expires.
+    A result store bounds the memory this takes by evicting the least recently used results
+    when there are more than a maximum number of them, or when their total serialized size
+    exceeds a maximum number of bytes.
+    Result requests for an evicted goal are answered as if the goal had expired.
+
+    The store also keeps an index of finished goals ordered by completion time, which the
+    action server uses to size goal expiration.
+
+    :param max_results: Maximum number of results to keep, or ``None`` for no limit.
+    :param max_bytes: Maximum total serialized size of the results to keep, or ``None`` for no
+        limit. Results are only serialized to measure their size if this is set.
+    """
+
+    def __init__(self, *, max_results=None, max_bytes=None):
+        if max_results is not None and max_results < 1:
+            raise ValueError('max_results must be at least 1 or None')
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError('max_bytes must be at least 1 or None')
+        self._max_results = max_results
+        self._max_bytes = max_bytes
+        # key: UUID in bytes, value: 2-tuple of result response and its serialized size
+        self._results = OrderedDict()
+        # key: UUID in bytes, value: completion time, in order of completion
+        self._completed = OrderedDict()
+        self._lock = threading.Lock()
+        self.num_bytes = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._results)
+
+    def __contains__(self, goal_id):
+        with self._lock:
+            return goal_id in self._results
+
+    @property
+    def num_completed(self):
+        """Get the number of goals that reached a terminal state and have not expired."""
+        with self._lock:
+            return len(self._completed)
+
+    def mark_completed(self, goal_id):
+        """
+        Record that a goal reached a terminal state.
+
+        :param goal_id: The goal UUID in bytes.
+        """
+        with self._lock:
+            self._completed.setdefault(goal_id, time.monotonic())
+
+    def add(self, goal_id, result_response):
+        """
+        Store the result of a goal, evicting other results if the store is full.
+
+        :param goal_id: The goal UUID in bytes.
+        :param result_response: The response to send for result requests for the goal.
+        :return: List of UUIDs in bytes of the goals whose results were evicted.
+        """
+        num_bytes = 0
+        if self._max_bytes is not None:
+            num_bytes = len(serialize_message(result_response))
+        evicted = []
+        with self._lock:
+            previous = self._results.pop(goal_id, None)
+            if previous is not None:
+                self.num_bytes -= previous[1]
+            self._results[goal_id] = (result_response, num_bytes)
+            self.num_bytes += num_bytes
+            while len(self._results) > 1 and (
+                (self._max_results is not None and len(self._results) > self._max_results) or
+                (self._max_bytes is not None and self.num_bytes > self._max_bytes)
+            ):
+                evicted_id, (_, evicted_bytes) = self._results.popitem(last=False)
+                self.num_bytes -= evicted_bytes
+                self.evictions += 1
+                evicted.append(evicted_id)
+        return evicted
+
+    def get(self, goal_id):
+        """
+        Get the stored result of a goal.
+
+        :param goal_id: The goal UUID in bytes.
+        :return: The result response, or ``None`` if there is no result stored for the goal.
+        """
+        with self._lock:
+            entry = self._results.get(goal_id)
+            if entry is None:
+                return None
+            self._results.move_to_end(goal_id)
+            return entry[0]
+
+    def expire(self, goal_id):
+        """
+        Forget an expired goal.
+
+        :param goal_id: The goal UUID in bytes.
+        """
+        with self._lock:
+            self._completed.pop(goal_id, None)
+            entry = self._results.pop(goal_id, None)
+            if entry is not None:
+                self.num_bytes -= entry[1]
+                self.expirations += 1
+
+
 def default_handle_accepted_callback(goal_handle):
     """Execute the goal."""
     goal_handle.execute()
@@ -205,7 +384,14 @@ class ActionServer(Waitable):
         cancel_service_qos_profile=qos_profile_services_default,
         feedback_pub_qos_profile=qos_profile_default,
         status_pub_qos_profile=qos_profile_action_status_default,
-        result_timeout=900
+        result_timeout=900,
+        take_batch_size=64,
+        status_publish_period=None,
+        feedback_publish_period=None,
+        result_store=None,
+        max_concurrent_goals=None,
+        goal_queue_size=0,
+        admission_policy=AdmissionPolicy.REJECT
     ):
         """
         Constructor.
@@ -230,13 +416,54 @@ class ActionServer(Waitable):
         :param status_pub_qos_profile: QoS profile for the status publisher.
         :param result_timeout: How long in seconds a result is kept by the server after a goal
             reaches a terminal state.
+        :param take_batch_size: The maximum number of goal, cancel and result requests of each
+            kind that are taken and processed each time the action server is woken up.
+        :param status_publish_period: Window in seconds over which goal state transitions are
+            coalesced into a single status message.
+            If 0, then status is published at most once per executor cycle.
+            If None, then status is published on every goal state transition.
+        :param feedback_publish_period: Minimum time in seconds between feedback messages of a
+            goal. Feedback published more often is coalesced, keeping only the newest.
+            If None, then all feedback is published.
+        :param result_store: Store bounding the results kept for finished goals.
+            If None, then results are kept until they expire.
+        :param max_concurrent_goals: Number of goals executed at the same time by a dedicated
+            pool of worker threads.
+            If None, then goals are executed as tasks of the node's executor without any limit.
+            Execute callbacks that are coroutines run as tasks of the node's executor, but still
+            count against this limit.
+        :param goal_queue_size: Number of goals that may wait for a free worker, in the order
+            they were executed.
+            Only used if `max_concurrent_goals` is set.
+        :param admission_policy: What to do with new goals that are accepted by the goal callback
+            while all workers are busy and the queue is full.
+            :attr:`AdmissionPolicy.REJECT` rejects the new goal.
+            :attr:`AdmissionPolicy.PREEMPT_OLDEST` requests the oldest executing goal that is not
+            canceling yet to be canceled, and queues the new goal to take its worker once it
+            finishes. If every executing goal is already canceling, then the new goal is rejected.
+            Preemption does not call the cancel callback, so the preempted goal is always
+            requested to cancel and its execute callback has to handle the request.
+            Goals that were accepted but not executed yet count as queued.
+            Only used if `max_concurrent_goals` is set.
         """
+        if take_batch_size < 1:
+            raise ValueError('take_batch_size must be a positive integer')
+        if status_publish_period is not None and status_publish_period < 0:
+            raise ValueError('status_publish_period must not be negative')
+        if feedback_publish_period is not None and feedback_publish_period <= 0:
+            raise ValueError('feedback_publish_period must be positive')
+        if max_concurrent_goals is not None and max_concurrent_goals < 1:
+            raise ValueError('max_concurrent_goals must be at least 1 or None')
+        if goal_queue_size < 0:
+            raise ValueError('goal_queue_size must not be negative')
+
         if callback_group is None:
             callback_group = node.default_callback_group
 
         super().__init__(callback_group)
 
         self._lock = threading.Lock()
+        self._take_batch_size = take_batch_size
 
         self.register_handle_accepted_callback(handle_accepted_callback)
         self.register_goal_callback(goal_callback)
@@ -264,6 +491,43 @@ class ActionServer(Waitable):
         # key: UUID in bytes, value: GoalHandle
         self._goal_handles = {}
 
+        if result_store is None:
+            result_store = ResultStore()
+        self._result_store = result_store
+
+        self._max_concurrent_goals = max_concurrent_goals
+        self._goal_queue_size = goal_queue_size
+        self._admission_policy = admission_policy
+        self._goal_pool = None
+        if max_concurrent_goals is not None:
+            self._goal_pool = ThreadPoolExecutor(max_concurrent_goals)
+        self._goal_pool_lock = threading.Lock()
+        # key: UUID in bytes, value: GoalHandle executing in the pool, in order of execution
+        self._executing_goals = OrderedDict()
+        # 2-tuples of execute callback and GoalHandle waiting for a worker
+        self._queued_goals = deque()
+        # UUIDs in bytes of goals that were admitted and are not executing or queued yet
+        self._admitted_goals = set()
+        # UUIDs in bytes of executing goals that were asked to cancel to make room for a new goal
+        self._preempted_goals = set()
+
+        self._publish_timer_lock = threading.Lock()
+        self._status_publish_pending = False
+        self._status_timer = None
+        if status_publish_period is not None:
+            self._status_timer = node.create_timer(
+                status_publish_period, self._status_timer_callback, callback_group)
+            self._status_timer.cancel()
+
+        self._feedback_publish_period = feedback_publish_period
+        # key: UUID in bytes, value: GoalHandle with feedback waiting for the feedback timer
+        self._feedback_flush_goals = {}
+        self._feedback_timer = None
+        if feedback_publish_period is not None:
+            self._feedback_timer = node.create_timer(
+                feedback_publish_period, self._feedback_timer_callback, callback_group)
+            self._feedback_timer.cancel()
+
         callback_group.add_entity(self)
         self._node.add_waitable(self)
 
@@ -273,7 +537,7 @@ class ActionServer(Waitable):
         goal_info = GoalInfo()
         goal_info.goal_id = goal_uuid
 
-        self._node.get_logger().debug('New goal request with ID: {0}'.format(goal_uuid.uuid))
+        self._node.get_logger().debug('New goal request with ID: {0}', goal_uuid.uuid)
 
         # Check if goal ID is already being tracked by this action server
         with self._lock:
@@ -289,9 +553,14 @@ class ActionServer(Waitable):
             else:
                 accepted = GoalResponse.ACCEPT == response
 
+        if accepted and not self._admit_goal(bytes(goal_uuid.uuid)):
+            self._node.get_logger().debug(
+                'All goal execution workers are busy: {0}', goal_uuid.uuid)
+            accepted = False
+
         if accepted:
             # Stamp time of acceptance
-            goal_info.stamp = self._node.get_clock().now().to_msg()
+            goal_info.stamp = self._node.get_clock().now_msg()
 
             # Create a goal handle
             try:
@@ -300,6 +569,7 @@ class ActionServer(Waitable):
             except RuntimeError as e:
                 self._node.get_logger().error(
                     'Failed to accept new goal with ID {0}: {1}'.format(goal_uuid.uuid, e))
+                self._release_admitted_goal(bytes(goal_uuid.uuid))
                 accepted = False
             else:
                 self._goal_handles[bytes(goal_uuid.uuid)] = goal_handle
@@ -315,17 +585,17 @@ class ActionServer(Waitable):
         )
 
         if not accepted:
-            self._node.get_logger().debug('New goal rejected: {0}'.format(goal_uuid.uuid))
+            self._node.get_logger().debug('New goal rejected: {0}', goal_uuid.uuid)
             return
 
-        self._node.get_logger().debug('New goal accepted: {0}'.format(goal_uuid.uuid))
+        self._node.get_logger().debug('New goal accepted: {0}', goal_uuid.uuid)
 
         # Provide the user a reference to the goal handle
         await await_or_execute(self._handle_accepted_callback, goal_handle)
 
     async def _execute_goal(self, execute_callback, goal_handle):
         goal_uuid = goal_handle.goal_id.uuid
-        self._node.get_logger().debug('Executing goal with ID {0}'.format(goal_uuid))
+        self._node.get_logger().debug('Executing goal with ID {0}', goal_uuid)
 
         # Execute user callback
         execute_result = await await_or_execute(execute_callback, goal_handle)
@@ -337,7 +607,7 @@ class ActionServer(Waitable):
             goal_handle.abort()
 
         self._node.get_logger().debug(
-            'Goal with ID {0} finished with state {1}'.format(goal_uuid, goal_handle.status))
+            'Goal with ID {0} finished with state {1}', goal_uuid, goal_handle.status)
 
         # Set result
         result_response = self._action_type.Impl.GetResultService.Response()
@@ -345,10 +615,92 @@ class ActionServer(Waitable):
         result_response.result = execute_result
         goal_handle._result_future.set_result(result_response)
 
+        # Forget the goal handles of results evicted to make room
+        for evicted_uuid in self._result_store.add(bytes(goal_uuid), result_response):
+            self._forget_goal_handle(evicted_uuid)
+
+    def _forget_goal_handle(self, goal_uuid):
+        goal_handle = self._goal_handles.pop(goal_uuid, None)
+        if goal_handle is None:
+            return
+        # Release the result held by the result future. The rcl goal handle must not be
+        # destroyed here, since it is owned by the rcl action server until the goal expires.
+        self.remove_future(goal_handle._result_future)
+
+    def _admit_goal(self, goal_uuid):
+        if self._goal_pool is None:
+            return True
+
+        with self._goal_pool_lock:
+            # Goals that were preempted hand their slot over to the goal that preempted them
+            num_goals = (
+                len(self._admitted_goals) + len(self._executing_goals) +
+                len(self._queued_goals) - len(self._preempted_goals))
+            if num_goals >= self._max_concurrent_goals + self._goal_queue_size:
+                if AdmissionPolicy.PREEMPT_OLDEST != self._admission_policy:
+                    return False
+                # Oldest executing goal that has not been asked to cancel yet
+                oldest_goal_handle = next(
+                    (goal_handle for goal_handle in self._executing_goals.values()
+                     if goal_handle.status == GoalStatus.STATUS_EXECUTING),
+                    None)
+                if oldest_goal_handle is None:
+                    return False
+                # Preemption bypasses the cancel callback, which may not reject it
+                self._preempted_goals.add(bytes(oldest_goal_handle.goal_id.uuid))
+                self._node.get_logger().debug(
+                    'Preempting goal with ID {0}', oldest_goal_handle.goal_id.uuid)
+                oldest_goal_handle._update_state(GoalEvent.CANCEL_GOAL)
+            self._admitted_goals.add(goal_uuid)
+        return True
+
+    def _release_admitted_goal(self, goal_uuid):
+        with self._goal_pool_lock:
+            self._admitted_goals.discard(goal_uuid)
+
+    def _start_goal(self, execute_callback, goal_handle):
+        # Called with the goal pool lock held
+        self._executing_goals[bytes(goal_handle.goal_id.uuid)] = goal_handle
+        if inspect.iscoroutinefunction(execute_callback):
+            # Coroutines wait for futures that are completed by the executor, so they run as
+            # tasks of the executor, while still taking a worker slot
+            task = self._node.executor.create_task(
+                self._execute_goal, execute_callback, goal_handle)
+            task.add_done_callback(lambda task: self._finish_goal(task, goal_handle))
+        else:
+            self._goal_pool.submit(self._run_goal, execute_callback, goal_handle)
+
+    def _run_goal(self, execute_callback, goal_handle):
+        # The execute callback is a plain function, so the goal runs to completion in one step
+        task = Task(self._execute_goal, (execute_callback, goal_handle))
+        task()
+        self._finish_goal(task, goal_handle)
+
+    def _finish_goal(self, task, goal_handle):
+        if task.exception() is not None:
+            self._node.get_logger().error(
+                'Goal with ID {0} raised an exception: {1}'.format(
+                    goal_handle.goal_id.uuid, task.exception()))
+            if goal_handle.is_active:
+                goal_handle.abort()
+            if not goal_handle._result_future.done():
+                result_response = self._action_type.Impl.GetResultService.Response()
+                result_response.status = goal_handle.status
+                goal_handle._result_future.set_result(result_response)
+
+        # Hand the worker slot to the next queued goal
+        with self._goal_pool_lock:
+            goal_uuid = bytes(goal_handle.goal_id.uuid)
+            del self._executing_goals[goal_uuid]
+            self._preempted_goals.discard(goal_uuid)
+            if not self._queued_goals or self._goal_pool is None:
+                return
+            self._start_goal(*self._queued_goals.popleft())
+
     async def _execute_cancel_request(self, request_header_and_message):
         request_header, cancel_request = request_header_and_message
 
-        self._node.get_logger().debug('Cancel request received: {0}'.format(cancel_request))
+        self._node.get_logger().debug('Cancel request received: {0}', cancel_request)
 
         with self._lock:
             # Get list of goals that are requested to be canceled
@@ -383,12 +735,22 @@ class ActionServer(Waitable):
         goal_uuid = result_request.goal_id.uuid
 
         self._node.get_logger().debug(
-            'Result request received for goal with ID: {0}'.format(goal_uuid))
+            'Result request received for goal with ID: {0}', goal_uuid)
+
+        # If the goal finished, then send the stored result right away
+        result_response = self._result_store.get(bytes(goal_uuid))
+        if result_response is not None:
+            _rclpy_action.rclpy_action_send_result_response(
+                self._handle,
+                request_header,
+                result_response,
+            )
+            return
 
         # If no goal with the requested ID exists, then return UNKNOWN status
         if bytes(goal_uuid) not in self._goal_handles:
             self._node.get_logger().debug(
-                'Sending result response for unknown goal ID: {0}'.format(goal_uuid))
+                'Sending result response for unknown goal ID: {0}', goal_uuid)
             result_response = self._action_type.Impl.GetResultService.Response()
             result_response.status = GoalStatus.STATUS_UNKNOWN
             _rclpy_action.rclpy_action_send_result_response(
@@ -406,7 +768,9 @@ class ActionServer(Waitable):
     async def _execute_expire_goals(self, expired_goals):
         for goal in expired_goals:
             goal_uuid = bytes(goal.goal_id.uuid)
-            del self._goal_handles[goal_uuid]
+            self._result_store.expire(goal_uuid)
+            # The goal handle is already gone if its result was evicted
+            self._forget_goal_handle(goal_uuid)
 
     def _send_result_response(self, request_header, future):
         _rclpy_action.rclpy_action_send_result_response(
@@ -415,10 +779,51 @@ class ActionServer(Waitable):
             future.result(),
         )
 
+    def _publish_status(self):
+        if self._status_timer is None:
+            _rclpy_action.rclpy_action_publish_status(self._handle)
+            return
+
+        # Coalesce with any other transitions that happen before the timer fires
+        with self._publish_timer_lock:
+            if not self._status_publish_pending:
+                self._status_publish_pending = True
+                self._status_timer.reset()
+
+    def _status_timer_callback(self):
+        with self._publish_timer_lock:
+            self._status_timer.cancel()
+            self._status_publish_pending = False
+        # Transitions from here on schedule another publication
+        with self._lock:
+            if self._handle is not None:
+                _rclpy_action.rclpy_action_publish_status(self._handle)
+
+    def _schedule_feedback_flush(self, goal_handle):
+        with self._publish_timer_lock:
+            # Goals still executing in a worker after the action server was destroyed
+            if self._feedback_timer is None:
+                return
+            if not self._feedback_flush_goals:
+                self._feedback_timer.reset()
+            self._feedback_flush_goals[bytes(goal_handle.goal_id.uuid)] = goal_handle
+
+    def _feedback_timer_callback(self):
+        with self._publish_timer_lock:
+            self._feedback_timer.cancel()
+            goal_handles = self._feedback_flush_goals
+            self._feedback_flush_goals = {}
+        for goal_handle in goal_handles.values():
+            goal_handle._flush_feedback()
+
     @property
     def action_type(self):
         return self._action_type
 
+    @property
+    def result_store(self):
+        return self._result_store
+
     # Start Waitable API
     def is_ready(self, wait_set):
         """Return True if one or more entities are ready in the wait set."""
@@ -430,44 +835,53 @@ class ActionServer(Waitable):
         self._is_goal_expired = ready_entities[3]
         return any(ready_entities)
 
+    def _take_requests(self, take_function, request_type):
+        # Take queued requests until there are none left or the batch is full
+        requests = []
+        while len(requests) < self._take_batch_size:
+            taken_data = take_function(self._handle, request_type)
+            # If take fails, then we get (None, None)
+            if not all(taken_data):
+                break
+            requests.append(taken_data)
+        return requests
+
     def take_data(self):
         """Take stuff from lower level so the wait set doesn't immediately wake again."""
         data = {}
         if self._is_goal_request_ready:
             with self._lock:
-                taken_data = _rclpy_action.rclpy_action_take_goal_request(
-                    self._handle,
+                taken_data = self._take_requests(
+                    _rclpy_action.rclpy_action_take_goal_request,
                     self._action_type.Impl.SendGoalService.Request,
                 )
-                # If take fails, then we get (None, None)
-                if all(taken_data):
+                if taken_data:
                     data['goal'] = taken_data
 
         if self._is_cancel_request_ready:
             with self._lock:
-                taken_data = _rclpy_action.rclpy_action_take_cancel_request(
-                    self._handle,
+                taken_data = self._take_requests(
+                    _rclpy_action.rclpy_action_take_cancel_request,
                     self._action_type.Impl.CancelGoalService.Request,
                 )
-                # If take fails, then we get (None, None)
-                if all(taken_data):
+                if taken_data:
                     data['cancel'] = taken_data
 
         if self._is_result_request_ready:
             with self._lock:
-                taken_data = _rclpy_action.rclpy_action_take_result_request(
-                    self._handle,
+                taken_data = self._take_requests(
+                    _rclpy_action.rclpy_action_take_result_request,
                     self._action_type.Impl.GetResultService.Request,
                 )
-                # If take fails, then we get (None, None)
-                if all(taken_data):
+                if taken_data:
                     data['result'] = taken_data
 
         if self._is_goal_expired:
             with self._lock:
+                # Only goals that reached a terminal state can expire
                 data['expired'] = _rclpy_action.rclpy_action_expire_goals(
                     self._handle,
-                    len(self._goal_handles),
+                    max(1, self._result_store.num_completed),
                 )
 
         return data
@@ -479,14 +893,14 @@ class ActionServer(Waitable):
         This will set results for Future objects for any received service responses and
         call any user-defined callbacks (e.g. feedback).
         """
-        if 'goal' in taken_data:
-            await self._execute_goal_request(taken_data['goal'])
+        for goal_request in taken_data.get('goal', ()):
+            await self._execute_goal_request(goal_request)
 
-        if 'cancel' in taken_data:
-            await self._execute_cancel_request(taken_data['cancel'])
+        for cancel_request in taken_data.get('cancel', ()):
+            await self._execute_cancel_request(cancel_request)
 
-        if 'result' in taken_data:
-            await self._execute_get_result_request(taken_data['result'])
+        for result_request in taken_data.get('result', ()):
+            await self._execute_get_result_request(result_request)
 
         if 'expired' in taken_data:
             await self._execute_expire_goals(taken_data['expired'])
@@ -514,8 +928,20 @@ class ActionServer(Waitable):
                 return
             execute_callback = self._execute_callback
 
-        # Schedule user callback for execution
-        self._node.executor.create_task(self._execute_goal, execute_callback, goal_handle)
+        if self._goal_pool is None:
+            # Schedule user callback for execution
+            self._node.executor.create_task(self._execute_goal, execute_callback, goal_handle)
+            return
+
+        # Run the goal in a worker, or queue it if they are all busy
+        with self._goal_pool_lock:
+            self._admitted_goals.discard(bytes(goal_handle.goal_id.uuid))
+            if self._goal_pool is None:
+                return
+            if len(self._executing_goals) < self._max_concurrent_goals:
+                self._start_goal(execute_callback, goal_handle)
+            else:
+                self._queued_goals.append((execute_callback, goal_handle))
 
     def notify_goal_done(self):
         with self._lock:
@@ -600,10 +1026,42 @@ class ActionServer(Waitable):
         self._execute_callback = execute_callback
 
     def destroy(self):
-        """Destroy the underlying action server handle."""
+        """
+        Destroy the underlying action server handle.
+
+        Queued goals are dropped and executing goals are requested to cancel, but this does not
+        wait for the goal execution workers to finish, since it may be called from one of them,
+        from the executor or during garbage collection.
+        Goals still executing afterwards can no longer change their state or publish feedback.
+        """
         if self._handle is None:
             return
 
+        if self._status_timer is not None:
+            # Flush any coalesced status before the timer goes away
+            if self._status_publish_pending:
+                self._status_timer_callback()
+            self._node.destroy_timer(self._status_timer)
+            self._status_timer = None
+
+        if self._goal_pool is not None:
+            # Drop queued goals and ask executing goals to cancel, without waiting for the workers
+            with self._goal_pool_lock:
+                self._queued_goals.clear()
+                self._admitted_goals.clear()
+                executing_goals = list(self._executing_goals.values())
+                goal_pool = self._goal_pool
+                self._goal_pool = None
+            for goal_handle in executing_goals:
+                if goal_handle.status == GoalStatus.STATUS_EXECUTING:
+                    goal_handle._update_state(GoalEvent.CANCEL_GOAL)
+            goal_pool.shutdown(wait=False)
+
+        if self._feedback_timer is not None:
+            self._feedback_timer_callback()
+            self._node.destroy_timer(self._feedback_timer)
+            self._feedback_timer = None
+
         for goal_handle in self._goal_handles.values():
             goal_handle.destroy()
 
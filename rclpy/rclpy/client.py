@@ -15,6 +15,8 @@
 import threading
 import time
 from typing import Dict
+from typing import Set
+from typing import Tuple
 from typing import TypeVar
 
 from rclpy.callback_groups import CallbackGroup
@@ -38,7 +40,9 @@ class Client:
         srv_type: SrvType,
         srv_name: str,
         qos_profile: QoSProfile,
-        callback_group: CallbackGroup
+        callback_group: CallbackGroup,
+        coalesce_requests: bool = False,
+        raw: bool = False
     ) -> None:
         """
         Create a container for a ROS service client.
@@ -55,6 +59,11 @@ class Client:
         :param qos_profile: The quality of service profile to apply the service client.
         :param callback_group: The callback group for the service client. If ``None``, then the
             nodes default callback group is used.
+        :param coalesce_requests: If ``True``, then a request identical to one that is still
+            waiting for a response is not sent again; its future completes with the response to
+            the outstanding request instead.
+        :param raw: If ``True``, then requests are sent and responses are received in serialized
+            form.
         """
         self.node_handle = node_handle
         self.context = context
@@ -64,6 +73,16 @@ class Client:
         self.qos_profile = qos_profile
         # Key is a sequence number, value is an instance of a Future
         self._pending_requests: Dict[int, Future] = {}
+        self.coalesce_requests = coalesce_requests
+        self.raw = raw
+        # Key is a serialized request, value is the Future of the outstanding request
+        self._inflight_requests: Dict[bytes, Future] = {}
+        # Key is the Future of an outstanding request, value is a 2-tuple of the serialized
+        # request and the futures returned to the callers waiting for its response
+        self._coalesced_callers: Dict[Future, Tuple[bytes, Set[Future]]] = {}
+        # Key is a Future returned to a caller, value is the Future of the outstanding request
+        self._coalesced_requests: Dict[Future, Future] = {}
+        self._inflight_lock = threading.Lock()
         self.callback_group = callback_group
         # True when the callback is ready to fire but has not been "taken" by an executor
         self._executor_event = False
@@ -74,14 +93,13 @@ class Client:
 
         Do not call this method in a callback or a deadlock may occur.
 
-        :param request: The service request.
-        :return: The service response.
+        :param request: The service request, or the serialized request if the client is raw.
+        :return: The service response, or the serialized response if the client is raw.
         :raises: TypeError if the type of the passed request isn't an instance
           of the Request type of the provided service when the client was
-          constructed.
+          constructed, or isn't ``bytes`` if the client is raw.
         """
-        if not isinstance(request, self.srv_type.Request):
-            raise TypeError()
+        self._check_request_type(request)
 
         event = threading.Event()
 
@@ -103,8 +121,25 @@ class Client:
 
         This prevents a future from receiving a response and executing its done callbacks.
 
+        If the client coalesces requests, then only the given future stops waiting; the request
+        is dropped once no other caller is waiting for it.
+
         :param future: A future returned from :meth:`call_async`
         """
+        if self._coalesced_requests:
+            with self._inflight_lock:
+                request_future = self._coalesced_requests.pop(future, None)
+                if request_future is not None:
+                    request_key, callers = self._coalesced_callers[request_future]
+                    callers.discard(future)
+                    if callers:
+                        return
+                    del self._coalesced_callers[request_future]
+                    if self._inflight_requests.get(request_key) is request_future:
+                        del self._inflight_requests[request_key]
+            if request_future is not None:
+                future = request_future
+
         for seq, req_future in self._pending_requests.items():
             if future == req_future:
                 try:
@@ -117,17 +152,69 @@ class Client:
         """
         Make a service request and asyncronously get the result.
 
-        :param request: The service request.
+        If the client coalesces requests and an identical request is still waiting for a
+        response, then no new request is sent and the returned future completes with the
+        response to that request.
+        Each call gets its own future, so cancelling one doesn't affect the other callers.
+
+        :param request: The service request, or the serialized request if the client is raw.
         :return: A future that completes when the request does.
         :raises: TypeError if the type of the passed request isn't an instance
           of the Request type of the provided service when the client was
-          constructed.
+          constructed, or isn't ``bytes`` if the client is raw.
         """
-        if not isinstance(request, self.srv_type.Request):
+        self._check_request_type(request)
+
+        if not self.coalesce_requests:
+            return self._send_request(request)
+
+        request_key = request if self.raw else _rclpy.rclpy_serialize(request)
+        future = Future()
+        with self._inflight_lock:
+            request_future = self._inflight_requests.get(request_key)
+            if request_future is None or request_future.done():
+                request_future = self._send_request(request)
+                request_future.add_done_callback(self._complete_coalesced_requests)
+                self._inflight_requests[request_key] = request_future
+                self._coalesced_callers[request_future] = (request_key, set())
+            self._coalesced_callers[request_future][1].add(future)
+            self._coalesced_requests[future] = request_future
+        return future
+
+    def _complete_coalesced_requests(self, request_future: Future) -> None:
+        with self._inflight_lock:
+            entry = self._coalesced_callers.pop(request_future, None)
+            if entry is None:
+                # No caller was waiting for the response any more
+                return
+            request_key, callers = entry
+            if self._inflight_requests.get(request_key) is request_future:
+                del self._inflight_requests[request_key]
+            for future in callers:
+                del self._coalesced_requests[future]
+
+        # Let done callbacks of the callers' futures run on the executor that got the response
+        executor = request_future._executor()
+        for future in callers:
+            if future.cancelled():
+                continue
+            future._set_executor(executor)
+            future.set_result(request_future.result())
+
+    def _check_request_type(self, request: SrvTypeRequest) -> None:
+        if self.raw:
+            if not isinstance(request, bytes):
+                raise TypeError()
+        elif not isinstance(request, self.srv_type.Request):
             raise TypeError()
 
+    def _send_request(self, request: SrvTypeRequest) -> Future:
         with self.handle as capsule:
-            sequence_number = _rclpy.rclpy_send_request(capsule, request)
+            if self.raw:
+                sequence_number = _rclpy.rclpy_send_request(
+                    capsule, request, self.srv_type.Request)
+            else:
+                sequence_number = _rclpy.rclpy_send_request(capsule, request)
         if sequence_number in self._pending_requests:
             raise RuntimeError('Sequence (%r) conflicts with pending request' % sequence_number)
 
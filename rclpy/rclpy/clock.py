@@ -13,7 +13,10 @@
 # limitations under the License.
 
 from enum import IntEnum
+import threading
 
+from builtin_interfaces.msg import Time as TimeMsg
+from rclpy.constants import S_TO_NS
 from rclpy.handle import Handle
 from rclpy.impl.implementation_singleton import rclpy_implementation as _rclpy
 
@@ -144,12 +147,27 @@ class Clock:
 
     def now(self):
         from rclpy.time import Time
+        return Time._from_nanoseconds(self.now_ns(), self.clock_type)
+
+    def now_ns(self):
+        """
+        Get the current time of the clock as an integer number of nanoseconds.
+
+        This is cheaper than :meth:`now` when a :class:`rclpy.time.Time` is not needed.
+
+        :rtype: int
+        """
         with self.handle as clock_capsule:
-            time_handle = _rclpy.rclpy_clock_get_now(clock_capsule)
-        # TODO(dhood): Return a python object from the C extension
-        return Time(
-            nanoseconds=_rclpy.rclpy_time_point_get_nanoseconds(time_handle),
-            clock_type=self.clock_type)
+            return _rclpy.rclpy_clock_get_now_nanoseconds(clock_capsule)
+
+    def now_msg(self):
+        """
+        Get the current time of the clock as a message, e.g. to stamp an outgoing message.
+
+        :rtype: builtin_interfaces.msg.Time
+        """
+        seconds, nanoseconds = divmod(self.now_ns(), S_TO_NS)
+        return TimeMsg(sec=seconds, nanosec=nanoseconds)
 
     def create_jump_callback(self, threshold, *, pre_callback=None, post_callback=None):
         """
@@ -189,6 +207,76 @@ class Clock:
             clock=self, threshold=threshold, pre_callback=pre_callback,
             post_callback=post_callback)
 
+    def sleep_until(self, until, context=None):
+        """
+        Sleep until a time on this clock is reached.
+
+        When the clock is using ROS time, the sleep ends as soon as a time update reaches
+        `until`, however fast simulated time advances.
+        The sleep is interrupted if the context is shut down.
+
+        :param until: The time to sleep until. Must have the same clock type as this clock.
+        :type until: :class:`rclpy.time.Time`
+        :param context: The context whose shutdown interrupts the sleep, or ``None`` for the
+            default context.
+        :return: ``True`` if `until` was reached, or ``False`` if the context was shut down.
+        :raises: ValueError if `until` is for a different type of clock.
+        """
+        from rclpy.utilities import get_default_context
+        if context is None:
+            context = get_default_context()
+        if until.clock_type != self.clock_type:
+            raise ValueError(
+                "Can't sleep until a time with clock type {0} on a clock with type {1}".format(
+                    until.clock_type.name, self.clock_type.name))
+        until_ns = until.nanoseconds
+
+        condition = threading.Condition()
+
+        def wake(*args):
+            with condition:
+                condition.notify_all()
+
+        # Wake up on any change of ROS time, including it being activated or deactivated
+        jump_handle = None
+        if ClockType.ROS_TIME == self.clock_type:
+            threshold = JumpThreshold(
+                min_forward=Duration(nanoseconds=1),
+                min_backward=Duration(nanoseconds=-1),
+                on_clock_change=True)
+            jump_handle = self.create_jump_callback(threshold, post_callback=wake)
+        context.on_shutdown(wake)
+        try:
+            with condition:
+                while context.ok():
+                    remaining_ns = until_ns - self.now_ns()
+                    if remaining_ns <= 0:
+                        return True
+                    if ClockType.ROS_TIME == self.clock_type and self.ros_time_is_active:
+                        # Simulated time only advances with time updates
+                        condition.wait()
+                    else:
+                        condition.wait(remaining_ns / S_TO_NS)
+                return False
+        finally:
+            context._remove_on_shutdown(wake)
+            if jump_handle is not None:
+                jump_handle.unregister()
+
+    def sleep_for(self, rel_time, context=None):
+        """
+        Sleep for a duration of time on this clock.
+
+        This is equivalent to ``clock.sleep_until(clock.now() + rel_time, context)``.
+
+        :param rel_time: The duration to sleep for.
+        :type rel_time: :class:`rclpy.duration.Duration`
+        :param context: The context whose shutdown interrupts the sleep, or ``None`` for the
+            default context.
+        :return: ``True`` if the duration has passed, or ``False`` if the context was shut down.
+        """
+        return self.sleep_until(self.now() + rel_time, context)
+
 
 class ROSClock(Clock):
 
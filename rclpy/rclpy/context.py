@@ -28,6 +28,8 @@ class Context:
         from rclpy.impl.implementation_singleton import rclpy_implementation
         self._handle = rclpy_implementation.rclpy_create_context()
         self._lock = threading.Lock()
+        self._callbacks = []
+        self._callbacks_lock = threading.Lock()
 
     @property
     def handle(self):
@@ -39,16 +41,46 @@ class Context:
         with self._lock:
             return rclpy_implementation.rclpy_ok(self._handle)
 
+    def _call_on_shutdown_callbacks(self):
+        with self._callbacks_lock:
+            callbacks = self._callbacks
+            self._callbacks = []
+        for callback in callbacks:
+            callback()
+
     def shutdown(self):
         # imported locally to avoid loading extensions on module import
         from rclpy.impl.implementation_singleton import rclpy_implementation
         with self._lock:
-            return rclpy_implementation.rclpy_shutdown(self._handle)
+            ret = rclpy_implementation.rclpy_shutdown(self._handle)
+        self._call_on_shutdown_callbacks()
+        return ret
 
     def try_shutdown(self):
         """Shutdown rclpy if not already shutdown."""
         # imported locally to avoid loading extensions on module import
         from rclpy.impl.implementation_singleton import rclpy_implementation
         with self._lock:
-            if rclpy_implementation.rclpy_ok(self._handle):
-                return rclpy_implementation.rclpy_shutdown(self._handle)
+            if not rclpy_implementation.rclpy_ok(self._handle):
+                return None
+            ret = rclpy_implementation.rclpy_shutdown(self._handle)
+        self._call_on_shutdown_callbacks()
+        return ret
+
+    def on_shutdown(self, callback):
+        """
+        Add a callback to be called once when the context is shut down.
+
+        :param callback: A callable taking no arguments.
+        """
+        if not callable(callback):
+            raise TypeError('callback should be a callable, got {}'.format(type(callback)))
+        with self._callbacks_lock:
+            self._callbacks.append(callback)
+
+    def _remove_on_shutdown(self, callback):
+        with self._callbacks_lock:
+            try:
+                self._callbacks.remove(callback)
+            except ValueError:
+                pass
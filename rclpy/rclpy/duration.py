@@ -13,30 +13,38 @@
 # limitations under the License.
 
 import builtin_interfaces
+from rclpy.constants import S_TO_NS
 from rclpy.impl.implementation_singleton import rclpy_implementation as _rclpy
 
+# Durations are stored as signed 64-bit integers in rcl
+_DURATION_MIN_NS = -2**63
+_DURATION_MAX_NS = 2**63 - 1
+
 
 class Duration:
 
+    __slots__ = ('_nanoseconds',)
+
     def __init__(self, *, seconds=0, nanoseconds=0):
-        total_nanoseconds = int(seconds * 1e9)
+        if isinstance(seconds, int):
+            total_nanoseconds = seconds * S_TO_NS
+        else:
+            total_nanoseconds = int(seconds * 1e9)
         total_nanoseconds += int(nanoseconds)
-        try:
-            self._duration_handle = _rclpy.rclpy_create_duration(total_nanoseconds)
-        except OverflowError as e:
-            raise OverflowError(
-                'Total nanoseconds value is too large to store in C time point.') from e
+        if not _DURATION_MIN_NS <= total_nanoseconds <= _DURATION_MAX_NS:
+            raise OverflowError('Total nanoseconds value is too large to store in C duration.')
+        self._nanoseconds = total_nanoseconds
 
     @property
     def nanoseconds(self):
-        return _rclpy.rclpy_duration_get_nanoseconds(self._duration_handle)
+        return self._nanoseconds
 
     def __repr__(self):
-        return 'Duration(nanoseconds={0})'.format(self.nanoseconds)
+        return 'Duration(nanoseconds={0})'.format(self._nanoseconds)
 
     def __eq__(self, other):
         if isinstance(other, Duration):
-            return self.nanoseconds == other.nanoseconds
+            return self._nanoseconds == other._nanoseconds
         # Raise instead of returning NotImplemented to prevent comparison with invalid types,
         # e.g. ints.
         # Otherwise `Duration(nanoseconds=5) == 5` will return False instead of raising, and this
@@ -48,34 +56,34 @@ class Duration:
 
     def __lt__(self, other):
         if isinstance(other, Duration):
-            return self.nanoseconds < other.nanoseconds
+            return self._nanoseconds < other._nanoseconds
         return NotImplemented
 
     def __le__(self, other):
         if isinstance(other, Duration):
-            return self.nanoseconds <= other.nanoseconds
+            return self._nanoseconds <= other._nanoseconds
         return NotImplemented
 
     def __gt__(self, other):
         if isinstance(other, Duration):
-            return self.nanoseconds > other.nanoseconds
+            return self._nanoseconds > other._nanoseconds
         return NotImplemented
 
     def __ge__(self, other):
         if isinstance(other, Duration):
-            return self.nanoseconds >= other.nanoseconds
+            return self._nanoseconds >= other._nanoseconds
         return NotImplemented
 
     def to_msg(self):
-        seconds = int(self.nanoseconds * 1e-9)
-        nanoseconds = int(self.nanoseconds % 1e9)
+        seconds, nanoseconds = divmod(self._nanoseconds, S_TO_NS)
         return builtin_interfaces.msg.Duration(sec=seconds, nanosec=nanoseconds)
 
     @classmethod
     def from_msg(cls, msg):
         if not isinstance(msg, builtin_interfaces.msg.Duration):
             raise TypeError('Must pass a builtin_interfaces.msg.Duration object')
-        return cls(seconds=msg.sec, nanoseconds=msg.nanosec)
+        return cls(nanoseconds=msg.sec * S_TO_NS + msg.nanosec)
 
     def get_c_duration(self):
-        return self._duration_handle
+        """Create a capsule holding an rcl duration with the same value, to pass to rcl."""
+        return _rclpy.rclpy_create_duration(self._nanoseconds)
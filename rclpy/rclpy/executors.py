@@ -34,6 +34,7 @@ from typing import Union
 
 
 from rclpy.client import Client
+from rclpy.clock import ROSClock
 from rclpy.context import Context
 from rclpy.guard_condition import GuardCondition
 from rclpy.handle import InvalidHandle
@@ -43,6 +44,7 @@ from rclpy.signals import SignalHandlerGuardCondition
 from rclpy.subscription import Subscription
 from rclpy.task import Future
 from rclpy.task import Task
+from rclpy.timer import Timer
 from rclpy.timer import WallTimer
 from rclpy.utilities import get_default_context
 from rclpy.utilities import timeout_sec_to_nsec
@@ -140,11 +142,15 @@ class Executor:
     If the executor has any cleanup then it should also define :meth:`shutdown`.
 
     :param context: The context to be associated with, or ``None`` for the default global context.
+    :param fast_forward: If ``True``, then timers using ROS time that are due because simulated
+        time moved past their deadline are executed without waiting for any other work, so that
+        simulations can run faster than real time.
     """
 
-    def __init__(self, *, context: Context = None) -> None:
+    def __init__(self, *, context: Context = None, fast_forward: bool = False) -> None:
         super().__init__()
         self._context = get_default_context() if context is None else context
+        self._fast_forward = fast_forward
         self._nodes: Set[Node] = set()
         self._nodes_lock = RLock()
         # Tasks to be executed (oldest first) 3-tuple Task, Entity, Node
@@ -293,6 +299,15 @@ class Executor:
         """
         raise NotImplementedError
 
+    def _is_ros_timer_due(self, tmr):
+        clock = tmr.clock
+        if not isinstance(clock, ROSClock) or not clock.ros_time_is_active:
+            return False
+        try:
+            return tmr.is_ready()
+        except InvalidHandle:
+            return False
+
     def _take_timer(self, tmr):
         with tmr.handle as capsule:
             _rclpy.rclpy_call_timer(capsule)
@@ -311,7 +326,7 @@ class Executor:
 
     def _take_client(self, client):
         with client.handle as capsule:
-            return _rclpy.rclpy_take_response(capsule, client.srv_type.Response)
+            return _rclpy.rclpy_take_response(capsule, client.srv_type.Response, client.raw)
 
     async def _execute_client(self, client, seq_and_response):
         sequence, response = seq_and_response
@@ -327,7 +342,10 @@ class Executor:
 
     def _take_service(self, srv):
         with srv.handle as capsule:
-            request_and_header = _rclpy.rclpy_take_request(capsule, srv.srv_type.Request)
+            # Requests of services with a response cache are taken serialized, so that cache hits
+            # don't convert them to Python messages
+            request_and_header = _rclpy.rclpy_take_request(
+                capsule, srv.srv_type.Request, srv.raw or srv.response_cache is not None)
         return request_and_header
 
     async def _execute_service(self, srv, request_and_header):
@@ -335,8 +353,25 @@ class Executor:
             return
         (request, header) = request_and_header
         if request:
-            response = await await_or_execute(srv.callback, request, srv.srv_type.Response())
+            cache_key = None
+            if srv.response_cache is not None:
+                cache_key = request
+                response = srv.response_cache.get(cache_key)
+                if response is not None:
+                    srv.send_response(response, header)
+                    return
+                if not srv.raw:
+                    request = _rclpy.rclpy_deserialize(request, srv.srv_type.Request)
+            if srv.raw:
+                response = await await_or_execute(srv.callback, request, header)
+                if response is None:
+                    # The callback will send the response later with Service.send_response
+                    return
+            else:
+                response = await await_or_execute(srv.callback, request, srv.srv_type.Response())
             srv.send_response(response, header)
+            if cache_key is not None:
+                srv.response_cache.put(cache_key, response)
 
     def _take_guard_condition(self, gc):
         gc._executor_triggered = False
@@ -345,8 +380,7 @@ class Executor:
         await await_or_execute(gc.callback)
 
     async def _execute_waitable(self, waitable, data):
-        for future in waitable._futures:
-            future._set_executor(self)
+        waitable._set_executor(self)
         await waitable.execute(data)
 
     def _make_handler(
@@ -447,7 +481,7 @@ class Executor:
             # Gather entities that can be waited on
             subscriptions: List[Subscription] = []
             guards: List[GuardCondition] = []
-            timers: List[WallTimer] = []
+            timers: List[Timer] = []
             clients: List[Client] = []
             services: List[Service] = []
             waitables: List[Waitable] = []
@@ -535,7 +569,11 @@ class Executor:
                     waitable.add_to_wait_set(wait_set)
 
                 # Wait for something to become ready
-                _rclpy.rclpy_wait(wait_set, timeout_nsec)
+                wait_timeout_nsec = timeout_nsec
+                if self._fast_forward and any(self._is_ros_timer_due(tmr) for tmr in timers):
+                    # Simulated time is already past a timer's deadline
+                    wait_timeout_nsec = 0
+                _rclpy.rclpy_wait(wait_set, wait_timeout_nsec)
                 if self._is_shutdown:
                     raise ShutdownException()
 
@@ -644,8 +682,8 @@ class Executor:
 class SingleThreadedExecutor(Executor):
     """Runs callbacks in the thread that calls :meth:`Executor.spin`."""
 
-    def __init__(self, *, context: Context = None) -> None:
-        super().__init__(context=context)
+    def __init__(self, *, context: Context = None, fast_forward: bool = False) -> None:
+        super().__init__(context=context, fast_forward=fast_forward)
 
     def spin_once(self, timeout_sec: float = None) -> None:
         try:
@@ -668,10 +706,18 @@ class MultiThreadedExecutor(Executor):
         will use :func:`multiprocessing.cpu_count`. If that's not implemented the number of threads
         defaults to 1.
     :param context: The context associated with the executor.
+    :param fast_forward: If ``True``, then due timers using ROS time are executed without waiting.
+        See :class:`Executor`.
     """
 
-    def __init__(self, num_threads: int = None, *, context: Context = None) -> None:
-        super().__init__(context=context)
+    def __init__(
+        self,
+        num_threads: int = None,
+        *,
+        context: Context = None,
+        fast_forward: bool = False
+    ) -> None:
+        super().__init__(context=context, fast_forward=fast_forward)
         if num_threads is None:
             try:
                 num_threads = multiprocessing.cpu_count()
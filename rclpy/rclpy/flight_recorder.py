@@ -0,0 +1,306 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Record log messages in a memory-mapped ring file, and decode them.
+
+The ring file keeps the most recent log records in a compact binary form.
+Since it is memory-mapped, the records survive the process crashing.
+Logger names and call sites are stored once, in a dictionary after the ring, and records refer to
+them by id.
+To render a ring file as text, run::
+
+    python3 -m rclpy.flight_recorder path/to/ring_file
+"""
+
+import argparse
+from collections import deque
+from collections import namedtuple
+import mmap
+import struct
+import sys
+import threading
+
+# File header: magic, version, capacity of the ring, total number of bytes ever written to the
+# ring, total number of bytes written before the oldest complete record in the ring, and the size
+# of the dictionary after the ring.
+_MAGIC = b'RCLPYFR\0'
+_VERSION = 1
+_FILE_HEADER = struct.Struct('<8sIQQQQ')
+_FILE_HEADER_SIZE = 64
+
+# Every record starts with its total size and its type.
+_RECORD_PREFIX = struct.Struct('<IB')
+_LOG_RECORD = struct.Struct('<IBBIIq')
+_LOGGER_RECORD = struct.Struct('<IBI')
+_CALL_SITE_RECORD = struct.Struct('<IBII')
+_LOG_RECORD_TYPE = 1
+_LOGGER_RECORD_TYPE = 2
+_CALL_SITE_RECORD_TYPE = 3
+
+_SEVERITY_NAMES = {10: 'DEBUG', 20: 'INFO', 30: 'WARN', 40: 'ERROR', 50: 'FATAL'}
+
+FlightRecord = namedtuple(
+    'FlightRecord',
+    ['timestamp', 'severity', 'name', 'function_name', 'file_path', 'line_number', 'message'])
+
+
+class FlightRecorder:
+    """
+    Write log records to a fixed-size memory-mapped ring file.
+
+    Once the ring is full, new records overwrite the oldest ones.
+    The dictionary of logger names and call sites after the ring only grows when a new logger or
+    call site logs for the first time.
+
+    Use :func:`rclpy.logging.enable_flight_recorder` rather than creating a recorder directly.
+
+    :param path: The path of the ring file, which is overwritten.
+    :param clock: The :class:`rclpy.clock.Clock` to stamp records with.
+    :param size: The capacity of the ring in bytes.
+        Messages longer than an eighth of it are truncated.
+    :param level: The lowest severity of records to write.
+    """
+
+    def __init__(self, path, *, clock, size=16 * 1024 * 1024, level=10):
+        if size < 4096:
+            raise ValueError('size must be at least 4096 bytes')
+        self._path = path
+        self._clock = clock
+        self._capacity = size
+        self.level = level
+        self._max_record_size = size // 8
+        self._file = open(path, 'w+b')
+        self._file.truncate(_FILE_HEADER_SIZE + size)
+        self._mmap = mmap.mmap(self._file.fileno(), _FILE_HEADER_SIZE + size)
+        self._lock = threading.Lock()
+        self._write_position = 0
+        self._record_positions = deque()
+        self._dictionary_size = 0
+        self._logger_ids = {}
+        self._call_site_ids = {}
+        self._write_header()
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def size(self):
+        return self._capacity
+
+    def record(self, severity, name, message, caller_id):
+        """
+        Write a log record.
+
+        :param severity: The severity of the message.
+        :param name: The name of the logger.
+        :param message: The message.
+        :param caller_id: The :class:`rclpy.impl.rcutils_logger.CallerId` of the call site.
+        """
+        timestamp = self._clock.now_ns()
+        message = message.encode('utf-8', 'replace')[:self._max_record_size - _LOG_RECORD.size]
+        with self._lock:
+            if self._mmap is None:
+                return
+            logger_id = self._get_logger_id(name)
+            call_site_id = self._get_call_site_id(caller_id)
+            self._write_ring_record(
+                _LOG_RECORD.pack(
+                    _LOG_RECORD.size + len(message), _LOG_RECORD_TYPE, severity, logger_id,
+                    call_site_id, timestamp) +
+                message)
+
+    def close(self):
+        """Stop recording and close the ring file."""
+        with self._lock:
+            if self._mmap is None:
+                return
+            self._mmap.flush()
+            self._mmap.close()
+            self._mmap = None
+            self._file.close()
+
+    def _get_logger_id(self, name):
+        logger_id = self._logger_ids.get(name)
+        if logger_id is None:
+            logger_id = len(self._logger_ids)
+            encoded_name = name.encode('utf-8', 'replace')
+            self._write_dictionary_record(
+                _LOGGER_RECORD.pack(
+                    _LOGGER_RECORD.size + len(encoded_name), _LOGGER_RECORD_TYPE, logger_id) +
+                encoded_name)
+            self._logger_ids[name] = logger_id
+        return logger_id
+
+    def _get_call_site_id(self, caller_id):
+        call_site_id = self._call_site_ids.get(caller_id)
+        if call_site_id is None:
+            call_site_id = len(self._call_site_ids)
+            location = '{0}\0{1}'.format(caller_id.function_name, caller_id.file_path).encode(
+                'utf-8', 'replace')
+            self._write_dictionary_record(
+                _CALL_SITE_RECORD.pack(
+                    _CALL_SITE_RECORD.size + len(location), _CALL_SITE_RECORD_TYPE,
+                    call_site_id, caller_id.line_number) +
+                location)
+            self._call_site_ids[caller_id] = call_site_id
+        return call_site_id
+
+    def _write_dictionary_record(self, record):
+        # The dictionary is rarely written, so it is appended to the file instead of mapped
+        self._file.seek(_FILE_HEADER_SIZE + self._capacity + self._dictionary_size)
+        self._file.write(record)
+        self._file.flush()
+        self._dictionary_size += len(record)
+
+    def _write_ring_record(self, record):
+        position = self._write_position
+        # Forget the records that are (partially) overwritten, and write the header before the
+        # record, so that the records in the ring according to the header stay intact even if
+        # the process crashes while writing the record
+        record_positions = self._record_positions
+        oldest_valid_position = position + len(record) - self._capacity
+        while record_positions and record_positions[0] < oldest_valid_position:
+            record_positions.popleft()
+        self._write_header()
+
+        offset = position % self._capacity
+        end = offset + len(record)
+        if end <= self._capacity:
+            self._mmap[_FILE_HEADER_SIZE + offset:_FILE_HEADER_SIZE + end] = record
+        else:
+            # Wrap around the end of the ring
+            split = self._capacity - offset
+            self._mmap[_FILE_HEADER_SIZE + offset:] = record[:split]
+            self._mmap[_FILE_HEADER_SIZE:_FILE_HEADER_SIZE + end - self._capacity] = \
+                record[split:]
+        record_positions.append(position)
+        self._write_position = position + len(record)
+        self._write_header()
+
+    def _write_header(self):
+        oldest_position = (
+            self._record_positions[0] if self._record_positions else self._write_position)
+        _FILE_HEADER.pack_into(
+            self._mmap, 0, _MAGIC, _VERSION, self._capacity, self._write_position,
+            oldest_position, self._dictionary_size)
+
+
+def read_flight_recorder(path):
+    """
+    Read the log records in a ring file written by a :class:`FlightRecorder`.
+
+    Reading stops at the first record that is corrupted, e.g. because the ring file was
+    damaged, keeping the records before it.
+
+    :param path: The path of the ring file.
+    :return: A list of :class:`FlightRecord`, oldest first.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < _FILE_HEADER.size:
+        raise ValueError("'{0}' is not a flight recorder file".format(path))
+    magic, version, capacity, write_position, position, dictionary_size = \
+        _FILE_HEADER.unpack_from(data)
+    if magic != _MAGIC:
+        raise ValueError("'{0}' is not a flight recorder file".format(path))
+    if version != _VERSION:
+        raise ValueError(
+            "'{0}' has unsupported flight recorder version {1}".format(path, version))
+    ring = data[_FILE_HEADER_SIZE:_FILE_HEADER_SIZE + capacity]
+    dictionary = data[_FILE_HEADER_SIZE + capacity:_FILE_HEADER_SIZE + capacity + dictionary_size]
+    if len(ring) != capacity or len(dictionary) != dictionary_size:
+        raise ValueError("'{0}' is truncated".format(path))
+
+    loggers = {}
+    call_sites = {}
+    offset = 0
+    while offset + _RECORD_PREFIX.size <= dictionary_size:
+        size, record_type = _RECORD_PREFIX.unpack_from(dictionary, offset)
+        if size < _RECORD_PREFIX.size or offset + size > dictionary_size:
+            break
+        record = dictionary[offset:offset + size]
+        if record_type == _LOGGER_RECORD_TYPE:
+            _, _, logger_id = _LOGGER_RECORD.unpack_from(record)
+            loggers[logger_id] = record[_LOGGER_RECORD.size:].decode('utf-8', 'replace')
+        elif record_type == _CALL_SITE_RECORD_TYPE:
+            _, _, call_site_id, line_number = _CALL_SITE_RECORD.unpack_from(record)
+            function_name, _, file_path = record[_CALL_SITE_RECORD.size:].decode(
+                'utf-8', 'replace').partition('\0')
+            call_sites[call_site_id] = (function_name, file_path, line_number)
+        offset += size
+
+    def read(position, size):
+        offset = position % capacity
+        if offset + size <= capacity:
+            return ring[offset:offset + size]
+        return ring[offset:] + ring[:offset + size - capacity]
+
+    records = []
+    while position < write_position:
+        size, record_type = _RECORD_PREFIX.unpack(read(position, _RECORD_PREFIX.size))
+        # The ring only holds log records
+        if (
+            record_type != _LOG_RECORD_TYPE or size < _LOG_RECORD.size or
+            position + size > write_position
+        ):
+            break
+        record = read(position, size)
+        _, _, severity, logger_id, call_site_id, timestamp = _LOG_RECORD.unpack_from(record)
+        function_name, file_path, line_number = call_sites.get(
+            call_site_id, ('<unknown>', '<unknown>', 0))
+        records.append(FlightRecord(
+            timestamp=timestamp,
+            severity=severity,
+            name=loggers.get(logger_id, '<unknown>'),
+            function_name=function_name,
+            file_path=file_path,
+            line_number=line_number,
+            message=record[_LOG_RECORD.size:].decode('utf-8', 'replace')))
+        position += size
+    return records
+
+
+def format_flight_record(record):
+    """Format a :class:`FlightRecord` like the default rcutils console output."""
+    seconds, nanoseconds = divmod(record.timestamp, 1000 * 1000 * 1000)
+    return '[{0}] [{1}.{2:09d}] [{3}]: {4}'.format(
+        _SEVERITY_NAMES.get(record.severity, str(record.severity)), seconds, nanoseconds,
+        record.name, record.message)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Render a flight recorder ring file as text.')
+    parser.add_argument('path', help='Path of the ring file')
+    parser.add_argument(
+        '--locations', action='store_true', help='Include the call site of each record')
+    args = parser.parse_args(args)
+
+    try:
+        records = read_flight_recorder(args.path)
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    for record in records:
+        line = format_flight_record(record)
+        if args.locations:
+            line += ' ({0}() at {1}:{2})'.format(
+                record.function_name, record.file_path, record.line_number)
+        print(line)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
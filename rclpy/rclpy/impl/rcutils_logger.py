@@ -17,6 +17,8 @@ from collections import namedtuple
 from collections import OrderedDict
 import inspect
 import os
+import sys
+import threading
 import time
 
 from rclpy.impl.implementation_singleton import rclpy_logging_implementation as _rclpy_logging
@@ -25,6 +27,63 @@ from rclpy.impl.implementation_singleton import rclpy_logging_implementation as
 _internal_callers = []
 # This will cause rclpy filenames to be registered in `_internal_callers` on first logging call.
 _populate_internal_callers = True
+# Whether each filename seen by `_find_caller` is one of `_internal_callers`.
+_is_internal_caller_cache = {}
+_is_internal_caller_cache_num_callers = 0
+
+# Resolved caller ids keyed by the code object and instruction of the call site.
+_MAX_CALLER_IDS = 1024
+_caller_ids = OrderedDict()
+_caller_ids_lock = threading.Lock()
+
+# These are set on first use, since rclpy.logging imports this module.
+# Severities are also stored as module globals because attribute access on enums is slow.
+LoggingSeverity = None
+_DEBUG = None
+_INFO = None
+_WARN = None
+_ERROR = None
+_FATAL = None
+
+# Set by rclpy.logging.enable_async_logging() to output records from a background thread.
+_async_sink = None
+
+# Set by rclpy.logging.enable_flight_recorder() to also write records to a ring file.
+_flight_recorder = None
+
+# Loggers cache their effective level until this changes.
+_effective_levels_generation = 0
+
+
+def _invalidate_effective_levels():
+    """Make all loggers get their effective level again, e.g. after a logger level changed."""
+    global _effective_levels_generation
+    _effective_levels_generation += 1
+
+
+def _import_logging_severity():
+    global LoggingSeverity, _DEBUG, _INFO, _WARN, _ERROR, _FATAL
+    from rclpy.logging import LoggingSeverity
+    _DEBUG = LoggingSeverity.DEBUG
+    _INFO = LoggingSeverity.INFO
+    _WARN = LoggingSeverity.WARN
+    _ERROR = LoggingSeverity.ERROR
+    _FATAL = LoggingSeverity.FATAL
+
+
+def _is_internal_caller(file_path):
+    global _is_internal_caller_cache_num_callers
+    if len(_internal_callers) != _is_internal_caller_cache_num_callers:
+        # Filenames may have been added by third parties since the cache was filled.
+        _is_internal_caller_cache.clear()
+        _is_internal_caller_cache_num_callers = len(_internal_callers)
+    try:
+        return _is_internal_caller_cache[file_path]
+    except KeyError:
+        real_path = os.path.realpath(file_path)
+        is_internal = any(f in real_path for f in _internal_callers)
+        _is_internal_caller_cache[file_path] = is_internal
+        return is_internal
 
 
 def _find_caller(frame):
@@ -43,13 +102,32 @@ def _find_caller(frame):
         ])
         _populate_internal_callers = False
 
-    file_path = os.path.realpath(inspect.getframeinfo(frame).filename)
-    while any(f in file_path for f in _internal_callers):
+    while _is_internal_caller(frame.f_code.co_filename):
         frame = frame.f_back
-        file_path = os.path.realpath(inspect.getframeinfo(frame).filename)
     return frame
 
 
+def _get_caller_id(frame):
+    """
+    Get the id of the first calling frame that is outside of rclpy.
+
+    Resolving the file path of a caller is expensive, so ids are cached by call site.
+    """
+    frame = _find_caller(frame)
+    key = (frame.f_code, frame.f_lasti)
+    with _caller_ids_lock:
+        caller_id = _caller_ids.get(key)
+        if caller_id is not None:
+            _caller_ids.move_to_end(key)
+            return caller_id
+    caller_id = CallerId(frame)
+    with _caller_ids_lock:
+        _caller_ids[key] = caller_id
+        if len(_caller_ids) > _MAX_CALLER_IDS:
+            _caller_ids.popitem(last=False)
+    return caller_id
+
+
 class CallerId(
         namedtuple('CallerId', ['function_name', 'file_path', 'line_number', 'last_index'])):
 
@@ -59,7 +137,7 @@ class CallerId(
         return super(CallerId, cls).__new__(
             cls,
             function_name=frame.f_code.co_name,
-            file_path=os.path.abspath(inspect.getframeinfo(frame).filename),
+            file_path=os.path.abspath(frame.f_code.co_filename),
             line_number=frame.f_lineno,
             last_index=frame.f_lasti,  # To distinguish between two callers on the same line
         )
@@ -219,6 +297,14 @@ class RcutilsLogger:
     def __init__(self, name=''):
         self.name = name
         self.contexts = {}
+        self._effective_level = None
+        self._effective_level_generation = None
+
+    def _update_effective_level(self):
+        # Read the generation first so that a concurrent invalidation isn't lost
+        generation = _effective_levels_generation
+        self._effective_level = _rclpy_logging.rclpy_logging_get_logger_effective_level(self.name)
+        self._effective_level_generation = generation
 
     def get_child(self, name):
         if not name:
@@ -229,22 +315,29 @@ class RcutilsLogger:
         return RcutilsLogger(name=name)
 
     def set_level(self, level):
-        from rclpy.logging import LoggingSeverity
+        if LoggingSeverity is None:
+            _import_logging_severity()
         level = LoggingSeverity(level)
-        return _rclpy_logging.rclpy_logging_set_logger_level(self.name, level)
+        ret = _rclpy_logging.rclpy_logging_set_logger_level(self.name, level)
+        _invalidate_effective_levels()
+        return ret
 
     def get_effective_level(self):
-        from rclpy.logging import LoggingSeverity
-        level = LoggingSeverity(
-            _rclpy_logging.rclpy_logging_get_logger_effective_level(self.name))
-        return level
+        if LoggingSeverity is None:
+            _import_logging_severity()
+        if self._effective_level_generation != _effective_levels_generation:
+            self._update_effective_level()
+        return LoggingSeverity(self._effective_level)
 
     def is_enabled_for(self, severity):
-        from rclpy.logging import LoggingSeverity
+        if LoggingSeverity is None:
+            _import_logging_severity()
         severity = LoggingSeverity(severity)
-        return _rclpy_logging.rclpy_logging_logger_is_enabled_for(self.name, severity)
+        if self._effective_level_generation != _effective_levels_generation:
+            self._update_effective_level()
+        return severity >= self._effective_level
 
-    def log(self, message, severity, **kwargs):
+    def log(self, message, severity, *args, **kwargs):
         r"""
         Log a message with the specified severity.
 
@@ -254,12 +347,21 @@ class RcutilsLogger:
           * a logging filter causes the message to be skipped.
 
         .. note::
-           Logging filters will only be evaluated if the logger is enabled for the message's
-           severity.
+           Logging filters, and the arguments for them, will only be evaluated if the logger is
+           enabled for the message's severity.
+
+        The message can be a format string for ``args``, or a callable taking no arguments that
+        returns the message.
+        Either way, the message is only rendered once it is known that it will be logged, so
+        expensive messages cost nothing when logging is disabled, e.g.::
+
+            logger.debug('Received {0}', msg)
+            logger.debug(lambda: 'Queue contents: {0}'.format(list(queue)))
 
-        :param message str: message to log.
+        :param message str: message to log, or a format string, or a callable returning one.
         :param severity: severity of the message.
         :type severity: :py:class:LoggingSeverity
+        :param args: arguments with which to format the message using :py:meth:`str.format`.
         :keyword name str: name of the logger to use.
         :param \**kwargs: optional parameters for logging filters (see below).
 
@@ -273,22 +375,35 @@ class RcutilsLogger:
               If True, enable the :py:class:SkipFirst: filter.
             * *once* (``bool``) --
               If True, enable the :py:class:Once: filter.
-        :returns: False if a filter caused the message to not be logged; True otherwise.
+        :returns: False if a filter caused the message to not be logged, if the logger is not
+            enabled for the message's severity (even if the flight recorder recorded it), or if
+            asynchronous logging is enabled and the message was dropped; True otherwise.
         :raises: TypeError on invalid filter parameter combinations.
         :raises: ValueError on invalid parameters values.
         :rtype: bool
         """
-        from rclpy.logging import LoggingSeverity
-        severity = LoggingSeverity(severity)
+        if LoggingSeverity is None:
+            _import_logging_severity()
+        if severity.__class__ is not LoggingSeverity:
+            severity = LoggingSeverity(severity)
+
+        # Check the severity first, so that disabled log calls are cheap.
+        if self._effective_level_generation != _effective_levels_generation:
+            self._update_effective_level()
+        recorder = _flight_recorder
+        to_console = severity >= self._effective_level
+        if not to_console and (recorder is None or severity < recorder.level):
+            return False
 
         name = kwargs.pop('name', self.name)
 
         # Infer the requested log filters from the keyword arguments
-        detected_filters = get_filters_from_kwargs(**kwargs)
+        detected_filters = get_filters_from_kwargs(**kwargs) if kwargs else []
 
         # Get/prepare the context corresponding to the caller.
-        caller_id = CallerId()
-        if caller_id not in self.contexts:
+        caller_id = _get_caller_id(sys._getframe(1))
+        context = self.contexts.get(caller_id)
+        if context is None:
             context = {'name': name, 'severity': severity}
             for detected_filter in detected_filters:
                 if detected_filter in supported_filters:
@@ -296,7 +411,6 @@ class RcutilsLogger:
             context['filters'] = detected_filters
             self.contexts[caller_id] = context
         else:
-            context = self.contexts[caller_id]
             # Don't support any changes to the logger.
             if severity != context['severity']:
                 raise ValueError('Logger severity cannot be changed between calls.')
@@ -310,10 +424,6 @@ class RcutilsLogger:
                     raise ValueError(
                         'Logging filter parameters cannot be changed between calls.')
 
-        # Only check filters if the severity is appropriate.
-        if not self.is_enabled_for(severity):
-            return False
-
         # Check if any filter determines the message shouldn't be processed.
         # Note(dhood): even if a message doesn't get logged, a filter might still update its state
         # as if it had been. This matches the behavior of the C logging macros provided by rcutils.
@@ -321,41 +431,63 @@ class RcutilsLogger:
             if not supported_filters[logging_filter].should_log(context):
                 return False
 
+        # Render the message only now that it will be logged.
+        if callable(message):
+            message = message()
+        elif args:
+            message = message.format(*args)
+
+        if recorder is not None and severity >= recorder.level:
+            recorder.record(severity, name, message, caller_id)
+        if not to_console:
+            return False
+
+        sink = _async_sink
+        if sink is not None:
+            return sink.push(
+                severity, name, message,
+                caller_id.function_name, caller_id.file_path, caller_id.line_number)
+
         # Call the relevant function from the C extension.
         _rclpy_logging.rclpy_logging_rcutils_log(
             severity, name, message,
             caller_id.function_name, caller_id.file_path, caller_id.line_number)
         return True
 
-    def debug(self, message, **kwargs):
+    def debug(self, message, *args, **kwargs):
         """Log a message with `DEBUG` severity via :py:classmethod:RcutilsLogger.log:."""
-        from rclpy.logging import LoggingSeverity
-        return self.log(message, LoggingSeverity.DEBUG, **kwargs)
+        if LoggingSeverity is None:
+            _import_logging_severity()
+        return self.log(message, _DEBUG, *args, **kwargs)
 
-    def info(self, message, **kwargs):
+    def info(self, message, *args, **kwargs):
         """Log a message with `INFO` severity via :py:classmethod:RcutilsLogger.log:."""
-        from rclpy.logging import LoggingSeverity
-        return self.log(message, LoggingSeverity.INFO, **kwargs)
+        if LoggingSeverity is None:
+            _import_logging_severity()
+        return self.log(message, _INFO, *args, **kwargs)
 
-    def warning(self, message, **kwargs):
+    def warning(self, message, *args, **kwargs):
         """Log a message with `WARN` severity via :py:classmethod:RcutilsLogger.log:."""
-        from rclpy.logging import LoggingSeverity
-        return self.log(message, LoggingSeverity.WARN, **kwargs)
+        if LoggingSeverity is None:
+            _import_logging_severity()
+        return self.log(message, _WARN, *args, **kwargs)
 
-    def warn(self, message, **kwargs):
+    def warn(self, message, *args, **kwargs):
         """
         Log a message with `WARN` severity via :py:classmethod:RcutilsLogger.log:.
 
         Deprecated in favor of :py:classmethod:RcutilsLogger.warning:.
         """
-        return self.warning(message, **kwargs)
+        return self.warning(message, *args, **kwargs)
 
-    def error(self, message, **kwargs):
+    def error(self, message, *args, **kwargs):
         """Log a message with `ERROR` severity via :py:classmethod:RcutilsLogger.log:."""
-        from rclpy.logging import LoggingSeverity
-        return self.log(message, LoggingSeverity.ERROR, **kwargs)
+        if LoggingSeverity is None:
+            _import_logging_severity()
+        return self.log(message, _ERROR, *args, **kwargs)
 
-    def fatal(self, message, **kwargs):
+    def fatal(self, message, *args, **kwargs):
         """Log a message with `FATAL` severity via :py:classmethod:RcutilsLogger.log:."""
-        from rclpy.logging import LoggingSeverity
-        return self.log(message, LoggingSeverity.FATAL, **kwargs)
+        if LoggingSeverity is None:
+            _import_logging_severity()
+        return self.log(message, _FATAL, *args, **kwargs)
@@ -13,8 +13,15 @@
 # limitations under the License.
 
 
+import atexit
+from collections import deque
 from enum import IntEnum
+import threading
+import traceback
 
+from rclpy.clock import Clock
+from rclpy.clock import ClockType
+from rclpy.flight_recorder import FlightRecorder
 from rclpy.impl.implementation_singleton import rclpy_logging_implementation as _rclpy_logging
 import rclpy.impl.rcutils_logger
 
@@ -34,6 +41,146 @@ class LoggingSeverity(IntEnum):
     FATAL = 50
 
 
+class LogOverflowPolicy(IntEnum):
+    """What an :class:`AsyncLogSink` does with a record when its buffer is full."""
+
+    #: Drop the record and count it in :attr:`AsyncLogSink.num_dropped`.
+    DROP = 1
+    #: Block the caller until the background thread made space for the record.
+    BLOCK = 2
+
+
+class AsyncLogSink:
+    """
+    Output log records from a background thread.
+
+    Log calls only append the record to a bounded buffer, so a slow console or log collector
+    doesn't stall the threads that log.
+    Records keep the time at which they were logged.
+
+    Use :func:`enable_async_logging` rather than creating a sink directly.
+
+    :param capacity: The maximum number of records waiting to be output.
+    :param overflow_policy: What to do with a record when the buffer is full.
+    """
+
+    def __init__(self, *, capacity=1024, overflow_policy=LogOverflowPolicy.DROP):
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1')
+        self._capacity = capacity
+        self._overflow_policy = LogOverflowPolicy(overflow_policy)
+        self._clock = Clock(clock_type=ClockType.SYSTEM_TIME)
+        # Appending to and popping from a deque are atomic, so producers don't take a lock
+        self._records = deque()
+        self._records_available = threading.Event()
+        self._space_available = threading.Event()
+        self._num_dropped = 0
+        self._num_dropped_lock = threading.Lock()
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run, name='rclpy_async_logging', daemon=True)
+        self._thread.start()
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @property
+    def overflow_policy(self):
+        return self._overflow_policy
+
+    @property
+    def num_dropped(self):
+        """Get the number of records that were dropped because the buffer was full."""
+        return self._num_dropped
+
+    def push(self, severity, name, message, function_name, file_name, line_number):
+        """
+        Queue a record to be output by the background thread.
+
+        :return: ``True`` if the record was queued, or ``False`` if it was dropped.
+        """
+        record = (
+            severity, name, message, function_name, file_name, line_number,
+            self._clock.now_ns())
+        if self._stopped:
+            _rclpy_logging.rclpy_logging_rcutils_log(*record)
+            return True
+        records = self._records
+        if len(records) >= self._capacity:
+            if (
+                self._overflow_policy == LogOverflowPolicy.DROP or
+                # The background thread can't make space for its own records
+                threading.current_thread() is self._thread
+            ):
+                with self._num_dropped_lock:
+                    self._num_dropped += 1
+                return False
+            while len(records) >= self._capacity and not self._stopped:
+                self._space_available.clear()
+                if len(records) >= self._capacity:
+                    self._space_available.wait(0.1)
+            if self._stopped:
+                _rclpy_logging.rclpy_logging_rcutils_log(*record)
+                return True
+        records.append(record)
+        # Appending before checking the event ensures the background thread sees the record
+        if not self._records_available.is_set():
+            self._records_available.set()
+        return True
+
+    def flush(self, timeout_sec=None):
+        """
+        Wait until all records queued so far have been output.
+
+        :param timeout_sec: Seconds to wait, or ``None`` to wait forever.
+        :return: ``True`` if all records were output, or ``False`` if the timeout expired.
+        """
+        if self._stopped or threading.current_thread() is self._thread:
+            return not self._records
+        # Records are output in order, so all of them were output once this one is reached
+        flushed = threading.Event()
+        self._records.append(flushed)
+        self._records_available.set()
+        return flushed.wait(timeout_sec)
+
+    def stop(self):
+        """Output all queued records and stop the background thread."""
+        self._stopped = True
+        self._records_available.set()
+        self._space_available.set()
+        if threading.current_thread() is not self._thread:
+            self._thread.join()
+        # Output records that were queued while the thread was stopping
+        self._output_records()
+
+    def _output_records(self):
+        records = self._records
+        while records:
+            try:
+                record = records.popleft()
+            except IndexError:
+                # Another thread took the last record
+                return
+            self._space_available.set()
+            if isinstance(record, threading.Event):
+                record.set()
+                continue
+            try:
+                _rclpy_logging.rclpy_logging_rcutils_log(*record)
+            except Exception:
+                traceback.print_exc()
+
+    def _run(self):
+        while True:
+            self._records_available.wait()
+            # Clear before draining, so records appended while draining aren't missed
+            self._records_available.clear()
+            self._output_records()
+            if self._stopped:
+                return
+
+
 _root_logger = rclpy.impl.rcutils_logger.RcutilsLogger()
 
 
@@ -44,11 +191,18 @@ def get_logger(name):
 
 
 def initialize():
-    return _rclpy_logging.rclpy_logging_initialize()
+    ret = _rclpy_logging.rclpy_logging_initialize()
+    rclpy.impl.rcutils_logger._invalidate_effective_levels()
+    return ret
 
 
 def shutdown():
-    return _rclpy_logging.rclpy_logging_shutdown()
+    sink = rclpy.impl.rcutils_logger._async_sink
+    if sink is not None:
+        sink.flush()
+    ret = _rclpy_logging.rclpy_logging_shutdown()
+    rclpy.impl.rcutils_logger._invalidate_effective_levels()
+    return ret
 
 
 def clear_config():
@@ -59,9 +213,72 @@ def clear_config():
 
 def set_logger_level(name, level):
     level = LoggingSeverity(level)
-    return _rclpy_logging.rclpy_logging_set_logger_level(name, level)
+    ret = _rclpy_logging.rclpy_logging_set_logger_level(name, level)
+    rclpy.impl.rcutils_logger._invalidate_effective_levels()
+    return ret
 
 
 def get_logger_effective_level(name):
     logger_level = _rclpy_logging.rclpy_logging_get_logger_effective_level(name)
     return LoggingSeverity(logger_level)
+
+
+def enable_async_logging(*, capacity=1024, overflow_policy=LogOverflowPolicy.DROP):
+    """
+    Output log records from a background thread instead of the thread that logs them.
+
+    Queued records are output when :func:`shutdown` or :func:`disable_async_logging` is called,
+    and when the interpreter exits.
+
+    :param capacity: The maximum number of records waiting to be output.
+    :param overflow_policy: What to do with a record when the buffer is full.
+    :return: The sink, e.g. to get the number of dropped records.
+    :rtype: AsyncLogSink
+    """
+    disable_async_logging()
+    sink = AsyncLogSink(capacity=capacity, overflow_policy=overflow_policy)
+    rclpy.impl.rcutils_logger._async_sink = sink
+    return sink
+
+
+def disable_async_logging():
+    """Output any queued log records and output future records synchronously again."""
+    sink = rclpy.impl.rcutils_logger._async_sink
+    if sink is not None:
+        rclpy.impl.rcutils_logger._async_sink = None
+        sink.stop()
+
+
+def enable_flight_recorder(path, *, size=16 * 1024 * 1024, level=LoggingSeverity.DEBUG):
+    """
+    Also write log records to a memory-mapped ring file, which survives the process crashing.
+
+    Records at or above ``level`` are recorded even if their logger is not enabled for them, so
+    that detailed history is available after a failure without printing it to the console.
+    Render the ring file with ``python3 -m rclpy.flight_recorder path``.
+
+    :param path: The path of the ring file, which is overwritten.
+    :param size: The capacity of the ring in bytes; once it is full, the oldest records are
+        overwritten.
+    :param level: The lowest severity of records to write.
+    :return: The recorder.
+    :rtype: rclpy.flight_recorder.FlightRecorder
+    """
+    disable_flight_recorder()
+    recorder = FlightRecorder(
+        path, clock=Clock(clock_type=ClockType.SYSTEM_TIME), size=size,
+        level=LoggingSeverity(level))
+    rclpy.impl.rcutils_logger._flight_recorder = recorder
+    return recorder
+
+
+def disable_flight_recorder():
+    """Stop writing log records to the ring file and close it."""
+    recorder = rclpy.impl.rcutils_logger._flight_recorder
+    if recorder is not None:
+        rclpy.impl.rcutils_logger._flight_recorder = None
+        recorder.close()
+
+
+atexit.register(disable_async_logging)
+atexit.register(disable_flight_recorder)
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
 from typing import Callable
+from typing import Dict
 from typing import Iterator
 from typing import List
 from typing import Optional
@@ -37,17 +39,23 @@ from rclpy.guard_condition import GuardCondition
 from rclpy.handle import Handle
 from rclpy.handle import InvalidHandle
 from rclpy.impl.implementation_singleton import rclpy_implementation as _rclpy
+from rclpy.impl.rcutils_logger import _invalidate_effective_levels
 from rclpy.logging import get_logger
 from rclpy.parameter import Parameter
+from rclpy.parameter_file_cache import get_parameter_file_cache
+from rclpy.parameter_index import ParameterIndex
 from rclpy.parameter_service import ParameterService
 from rclpy.publisher import Publisher
 from rclpy.qos import qos_profile_default
 from rclpy.qos import qos_profile_parameter_events
 from rclpy.qos import qos_profile_services_default
 from rclpy.qos import QoSProfile
+from rclpy.rate import Rate
+from rclpy.service import ResponseCache
 from rclpy.service import Service
 from rclpy.subscription import Subscription
 from rclpy.time_source import TimeSource
+from rclpy.timer import Timer
 from rclpy.timer import WallTimer
 from rclpy.type_support import check_for_type_support
 from rclpy.utilities import get_default_context
@@ -83,7 +91,8 @@ class Node:
         namespace: str = None,
         use_global_arguments: bool = True,
         start_parameter_services: bool = True,
-        initial_parameters: List[Parameter] = None
+        initial_parameters: List[Parameter] = None,
+        shared_time_source: bool = False
     ) -> None:
         """
         Constructor.
@@ -99,19 +108,26 @@ class Node:
         :param start_parameter_services: ``False`` if the node should not create parameter
             services.
         :param initial_parameters: A list of parameters to be set during node creation.
+        :param shared_time_source: ``True`` if the node should receive simulated time through a
+            single clock topic subscription shared with the other nodes of its context that set
+            this flag, instead of a subscription of its own.
         """
         self.__handle = None
         self._context = get_default_context() if context is None else context
-        self._parameters: dict = {}
+        self._parameters = ParameterIndex()
         self.__publishers: List[Publisher] = []
         self.__subscriptions: List[Subscription] = []
         self.__clients: List[Client] = []
         self.__services: List[Service] = []
-        self.__timers: List[WallTimer] = []
+        self.__timers: List[Timer] = []
         self.__guards: List[GuardCondition] = []
         self.__waitables: List[Waitable] = []
         self._default_callback_group = MutuallyExclusiveCallbackGroup()
         self._parameters_callback = None
+        # Parameter changes waiting to be published, when parameter events are coalesced
+        self._parameter_event_lock = threading.Lock()
+        self._pending_parameter_changes = {}
+        self._parameter_event_timer = None
 
         namespace = namespace or ''
         if not self._context.ok():
@@ -130,12 +146,21 @@ class Node:
             validate_namespace(namespace)
             # Should not get to this point
             raise RuntimeError('rclpy_create_node failed for unknown reason')
+        # Initializing the first node configures logging, which may set logger levels
+        _invalidate_effective_levels()
         with self.handle as capsule:
             self._logger = get_logger(_rclpy.rclpy_get_node_logger_name(capsule))
+            namespace = _rclpy.rclpy_get_node_namespace(capsule)
+            name = _rclpy.rclpy_get_node_name(capsule)
+        # The name and namespace can't change, so the fully qualified name is only computed once
+        if namespace == '/':
+            self._fully_qualified_name = namespace + name
+        else:
+            self._fully_qualified_name = namespace + '/' + name
 
         # Clock that has support for ROS time.
         self._clock = ROSClock()
-        self._time_source = TimeSource(node=self)
+        self._time_source = TimeSource(node=self, shared=shared_time_source)
         self._time_source.attach_clock(self._clock)
 
         self.__executor_weakref = None
@@ -144,7 +169,10 @@ class Node:
             ParameterEvent, 'parameter_events', qos_profile=qos_profile_parameter_events)
 
         with self.handle as capsule:
-            node_parameters = _rclpy.rclpy_get_node_parameters(Parameter, capsule)
+            parameter_files = _rclpy.rclpy_get_node_parameter_files(capsule)
+        # Nodes of the same context given the same files share their parsed contents
+        node_parameters = get_parameter_file_cache(self._context).get_node_parameters(
+            parameter_files, self._fully_qualified_name)
         # Combine parameters from params files with those from the node constructor and
         # use the set_parameters_atomically API so a parameter event is published.
         if initial_parameters is not None:
@@ -175,7 +203,7 @@ class Node:
         yield from self.__services
 
     @property
-    def timers(self) -> Iterator[WallTimer]:
+    def timers(self) -> Iterator[Timer]:
         """Get timers that have been created on this node."""
         yield from self.__timers
 
@@ -250,6 +278,10 @@ class Node:
         with self.handle as capsule:
             return _rclpy.rclpy_get_node_namespace(capsule)
 
+    def get_fully_qualified_name(self) -> str:
+        """Get the fully qualified name of the node, i.e. its namespace followed by its name."""
+        return self._fully_qualified_name
+
     def get_clock(self) -> Clock:
         """Get the clock used by the node."""
         return self._clock
@@ -280,23 +312,48 @@ class Node:
             return Parameter(name, Parameter.Type.NOT_SET, None)
         return self._parameters[name]
 
+    def get_parameters_by_prefix(self, prefix: str) -> Dict[str, Parameter]:
+        """
+        Get the parameters whose names start with a prefix.
+
+        For example, with the prefix ``'foo'``, the parameters ``'foo.ping'`` and
+        ``'foo.pong.x'`` are returned, while ``'foo'`` and ``'foobar'`` are not.
+
+        :param prefix: The prefix, without a trailing ``'.'``, or ``''`` for all parameters.
+        :return: The parameters, by their names with the prefix and separator removed.
+        """
+        start = len(prefix) + 1 if prefix else 0
+        return {
+            name[start:]: self._parameters[name]
+            for name in self._parameters.names_with_prefix(prefix)}
+
     def set_parameters(self, parameter_list: List[Parameter]) -> List[SetParametersResult]:
         """
         Set parameters for the node.
 
         If a callback was registered previously with :func:`set_parameters_callback`, it will be
-        called prior to setting the parameters for the node.
-        For each successfully set parameter, a :class:`ParameterEvent` message is
-        published.
+        called prior to setting each parameter for the node, with a list of just that parameter.
+        A single :class:`ParameterEvent` message is published for all the parameters that were
+        set successfully.
 
         :param parameter_list: The list of parameters to set.
         :return: A list of SetParametersResult messages.
         """
-        results = []
+        parameter_list = list(parameter_list)
         for param in parameter_list:
             if not isinstance(param, Parameter):
                 raise TypeError("parameter must be instance of type '{}'".format(repr(Parameter)))
-            results.append(self.set_parameters_atomically([param]))
+        results = []
+        changes = []
+        for param in parameter_list:
+            result = self._call_parameters_callback([param])
+            if result.successful:
+                # Set the parameter before calling the callback for the next one, as if they
+                # were set one by one
+                changes.extend(self._store_parameters([param]))
+            results.append(result)
+        if changes:
+            self._publish_parameter_changes(changes)
         return results
 
     def set_parameters_atomically(self, parameter_list: List[Parameter]) -> SetParametersResult:
@@ -310,42 +367,102 @@ class Node:
 
         :param parameter_list: The list of parameters to set.
         """
-        result = None
+        parameter_list = list(parameter_list)
+        result = self._call_parameters_callback(parameter_list)
+        if result.successful:
+            self._publish_parameter_changes(self._store_parameters(parameter_list))
+        return result
+
+    def set_parameter_event_coalescing(self, period_sec: Optional[float]) -> None:
+        """
+        Coalesce the parameter events of parameters set in quick succession.
+
+        Instead of publishing a :class:`ParameterEvent` message every time parameters are set,
+        the changes are collected and published in a single message ``period_sec`` seconds after
+        the first of them, which is less work for the node and its subscribers when parameters
+        change at a high rate.
+        Only the latest value of each parameter is published, and a parameter that was added and
+        deleted again is left out.
+        The message is published from a timer, so the node must be spinning.
+
+        :param period_sec: The longest time that a change waits to be published, or ``None`` to
+            publish changes immediately again, in which case pending changes are published now.
+        """
+        if period_sec is not None and period_sec <= 0:
+            raise ValueError('period_sec must be positive')
+        with self._parameter_event_lock:
+            timer = self._parameter_event_timer
+            self._parameter_event_timer = None
+        if timer is not None:
+            self.destroy_timer(timer)
+        self._publish_pending_parameter_changes()
+        if period_sec is not None:
+            timer = self.create_timer(period_sec, self._publish_pending_parameter_changes)
+            timer.cancel()
+            with self._parameter_event_lock:
+                self._parameter_event_timer = timer
+
+    def _call_parameters_callback(self, parameter_list):
         if self._parameters_callback:
-            result = self._parameters_callback(parameter_list)
-        else:
-            result = SetParametersResult(successful=True)
+            return self._parameters_callback(parameter_list)
+        return SetParametersResult(successful=True)
 
-        if result.successful:
-            parameter_event = ParameterEvent()
-            # Add fully qualified path of node to parameter event
-            if self.get_namespace() == '/':
-                parameter_event.node = self.get_namespace() + self.get_name()
+    def _store_parameters(self, parameter_list):
+        # Return the stored parameters along with whether they had a value before
+        changes = []
+        for param in parameter_list:
+            previous = self._parameters.get(param.name)
+            had_value = previous is not None and Parameter.Type.NOT_SET != previous.type_
+            if Parameter.Type.NOT_SET == param.type_:
+                # Delete any unset parameters regardless of their previous value.
+                # We don't currently store NOT_SET parameters so this is an extra precaution.
+                if previous is not None:
+                    del self._parameters[param.name]
             else:
-                parameter_event.node = self.get_namespace() + '/' + self.get_name()
-            for param in parameter_list:
-                if Parameter.Type.NOT_SET == param.type_:
-                    if Parameter.Type.NOT_SET != self.get_parameter(param.name).type_:
-                        # Parameter deleted. (Parameter had value and new value is not set)
-                        parameter_event.deleted_parameters.append(
-                            param.to_parameter_msg())
-                    # Delete any unset parameters regardless of their previous value.
-                    # We don't currently store NOT_SET parameters so this is an extra precaution.
-                    if param.name in self._parameters:
-                        del self._parameters[param.name]
-                else:
-                    if Parameter.Type.NOT_SET == self.get_parameter(param.name).type_:
-                        #  Parameter is new. (Parameter had no value and new value is set)
-                        parameter_event.new_parameters.append(param.to_parameter_msg())
-                    else:
-                        # Parameter changed. (Parameter had a value and new value is set)
-                        parameter_event.changed_parameters.append(
-                            param.to_parameter_msg())
-                    self._parameters[param.name] = param
-            parameter_event.stamp = self._clock.now().to_msg()
-            self._parameter_event_publisher.publish(parameter_event)
-
-        return result
+                self._parameters[param.name] = param
+            changes.append((param, had_value))
+        return changes
+
+    def _publish_parameter_changes(self, changes):
+        with self._parameter_event_lock:
+            timer = self._parameter_event_timer
+            if timer is not None:
+                pending = self._pending_parameter_changes
+                for param, had_value in changes:
+                    if param.name in pending:
+                        # Keep whether the parameter had a value before the first change
+                        had_value = pending[param.name][1]
+                    pending[param.name] = (param, had_value)
+                if pending and timer.is_canceled():
+                    timer.reset()
+                return
+        self._publish_parameter_event(changes)
+
+    def _publish_pending_parameter_changes(self):
+        with self._parameter_event_lock:
+            if self._parameter_event_timer is not None:
+                self._parameter_event_timer.cancel()
+            changes = list(self._pending_parameter_changes.values())
+            self._pending_parameter_changes.clear()
+        if changes:
+            self._publish_parameter_event(changes)
+
+    def _publish_parameter_event(self, changes):
+        parameter_event = ParameterEvent()
+        parameter_event.node = self._fully_qualified_name
+        for param, had_value in changes:
+            if Parameter.Type.NOT_SET == param.type_:
+                if had_value:
+                    # Parameter deleted. (Parameter had value and new value is not set)
+                    parameter_event.deleted_parameters.append(param.to_parameter_msg())
+            elif had_value:
+                # Parameter changed. (Parameter had a value and new value is set)
+                parameter_event.changed_parameters.append(param.to_parameter_msg())
+            else:
+                #  Parameter is new. (Parameter had no value and new value is set)
+                parameter_event.new_parameters.append(param.to_parameter_msg())
+        parameter_event.stamp = self._clock.now_msg()
+        self._parameter_event_publisher.publish(parameter_event)
 
     def set_parameters_callback(
         self,
@@ -472,7 +589,9 @@ class Node:
         srv_name: str,
         *,
         qos_profile: QoSProfile = qos_profile_services_default,
-        callback_group: CallbackGroup = None
+        callback_group: CallbackGroup = None,
+        coalesce_requests: bool = False,
+        raw: bool = False
     ) -> Client:
         """
         Create a new service client.
@@ -482,6 +601,10 @@ class Node:
         :param qos_profile: The quality of service profile to apply the service client.
         :param callback_group: The callback group for the service client. If ``None``, then the
             nodes default callback group is used.
+        :param coalesce_requests: If ``True``, then identical requests made while one is still
+            outstanding are not sent again, and complete with its response instead.
+        :param raw: If ``True``, then requests are sent and responses are received as serialized
+            ``bytes`` instead of message instances.
         """
         if callback_group is None:
             callback_group = self.default_callback_group
@@ -505,7 +628,7 @@ class Node:
         client = Client(
             self.handle, self.context,
             client_handle, srv_type, srv_name, qos_profile,
-            callback_group)
+            callback_group, coalesce_requests=coalesce_requests, raw=raw)
         self.__clients.append(client)
         callback_group.add_entity(client)
         return client
@@ -517,7 +640,9 @@ class Node:
         callback: Callable[[SrvTypeRequest, SrvTypeResponse], SrvTypeResponse],
         *,
         qos_profile: QoSProfile = qos_profile_services_default,
-        callback_group: CallbackGroup = None
+        callback_group: CallbackGroup = None,
+        response_cache: ResponseCache = None,
+        raw: bool = False
     ) -> Service:
         """
         Create a new service server.
@@ -529,6 +654,13 @@ class Node:
         :param qos_profile: The quality of service profile to apply the service server.
         :param callback_group: The callback group for the service server. If ``None``, then the
             nodes default callback group is used.
+        :param response_cache: A :class:`.ResponseCache` used to answer repeated identical
+            requests without calling ``callback``. If ``None``, then the callback is called for
+            every request.
+        :param raw: If ``True``, then the callback is called with the serialized request
+            (``bytes``) and the request header, and must return the serialized response.
+            If it returns ``None`` then no response is sent, and it may be sent later with
+            :meth:`.Service.send_response`.
         """
         if callback_group is None:
             callback_group = self.default_callback_group
@@ -551,7 +683,8 @@ class Node:
 
         service = Service(
             self.handle, service_handle,
-            srv_type, srv_name, callback, callback_group, qos_profile)
+            srv_type, srv_name, callback, callback_group, qos_profile,
+            response_cache=response_cache, raw=raw)
         self.__services.append(service)
         callback_group.add_entity(service)
         return service
@@ -560,8 +693,9 @@ class Node:
         self,
         timer_period_sec: float,
         callback: Callable,
-        callback_group: CallbackGroup = None
-    ) -> WallTimer:
+        callback_group: CallbackGroup = None,
+        clock: Clock = None
+    ) -> Timer:
         """
         Create a new timer.
 
@@ -572,17 +706,35 @@ class Node:
         :param callback: A user-defined callback function that is called when the timer expires.
         :param callback_group: The callback group for the timer. If ``None``, then the nodes
             default callback group is used.
+        :param clock: The clock the timer measures the period with, e.g. :meth:`get_clock` to
+            follow simulated time. If ``None``, then a steady clock is used.
         """
         timer_period_nsec = int(float(timer_period_sec) * S_TO_NS)
         if callback_group is None:
             callback_group = self.default_callback_group
-        timer = WallTimer(callback, callback_group, timer_period_nsec, context=self.context)
+        if clock is None:
+            timer = WallTimer(callback, callback_group, timer_period_nsec, context=self.context)
+        else:
+            timer = Timer(
+                callback, callback_group, timer_period_nsec, clock, context=self.context)
         timer.handle.requires(self.handle)
 
         self.__timers.append(timer)
         callback_group.add_entity(timer)
         return timer
 
+    def create_rate(self, frequency: float, clock: Clock = None) -> Rate:
+        """
+        Create a Rate object.
+
+        :param frequency: The frequency the Rate runs at (Hz).
+        :param clock: The clock the Rate sleeps on. If ``None``, then the node's clock is used,
+            which follows simulated time if ``use_sim_time`` is set.
+        """
+        if clock is None:
+            clock = self.get_clock()
+        return Rate(frequency, clock=clock, context=self.context)
+
     def create_guard_condition(
         self,
         callback: Callable,
@@ -658,7 +810,7 @@ class Node:
             return True
         return False
 
-    def destroy_timer(self, timer: WallTimer) -> bool:
+    def destroy_timer(self, timer: Timer) -> bool:
         """
         Destroy a timer created by the node.
 
@@ -702,10 +854,16 @@ class Node:
         * :func:`create_guard_condition`
 
         """
+        # Publish parameter changes that are waiting to be coalesced.
+        self.set_parameter_event_coalescing(None)
+
         # Drop extra reference to parameter event publisher.
         # It will be destroyed with other publishers below.
         self._parameter_event_publisher = None
 
+        # Stop receiving clock messages, handing over a shared clock subscription if needed.
+        self._time_source.detach_node()
+
         self.__publishers.clear()
         self.__subscriptions.clear()
         self.__clients.clear()
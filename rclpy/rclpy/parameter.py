@@ -12,13 +12,42 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import array
 from enum import Enum
+import sys
 
 from rcl_interfaces.msg import Parameter as ParameterMsg
 from rcl_interfaces.msg import ParameterDescriptor, ParameterType, ParameterValue
 
 PARAMETER_SEPARATOR_STRING = '.'
 
+# Typecodes of the array.array values accepted for numeric array parameters.
+# 'L' and 'Q' are left out since their values may not fit in an int64.
+_INTEGER_ARRAY_TYPECODES = frozenset('bBhHiIlq')
+_DOUBLE_ARRAY_TYPECODES = frozenset('fd')
+
+
+def _get_ndarray_dtype(value):
+    """Get the dtype of a one-dimensional NumPy array, or None for any other value."""
+    # NumPy is optional; if it wasn't imported, then the value can't be a NumPy array
+    numpy = sys.modules.get('numpy')
+    if numpy is None or not isinstance(value, numpy.ndarray) or value.ndim != 1:
+        return None
+    return value.dtype
+
+
+def _to_array(typecode, value):
+    """Convert the value of a numeric array parameter to an array.array with bulk copies."""
+    if isinstance(value, array.array):
+        if value.typecode == typecode:
+            return value
+        return array.array(typecode, value)
+    if _get_ndarray_dtype(value) is not None:
+        result = array.array(typecode)
+        result.frombytes(sys.modules['numpy'].ascontiguousarray(value, dtype=typecode).tobytes())
+        return result
+    return value
+
 
 class Parameter:
 
@@ -49,12 +78,26 @@ class Parameter:
                 return isinstance(parameter_value, list) and \
                     all(isinstance(v, bytes) and len(v) == 1 for v in parameter_value)
             if Parameter.Type.BOOL_ARRAY == self:
+                dtype = _get_ndarray_dtype(parameter_value)
+                if dtype is not None:
+                    return dtype.kind == 'b'
                 return isinstance(parameter_value, list) and \
                     all(isinstance(v, bool) for v in parameter_value)
             if Parameter.Type.INTEGER_ARRAY == self:
+                # Arrays are checked by the type of their elements instead of each element
+                if isinstance(parameter_value, array.array):
+                    return parameter_value.typecode in _INTEGER_ARRAY_TYPECODES
+                dtype = _get_ndarray_dtype(parameter_value)
+                if dtype is not None:
+                    return dtype.kind == 'i' or (dtype.kind == 'u' and dtype.itemsize < 8)
                 return isinstance(parameter_value, list) and \
                     all(isinstance(v, int) for v in parameter_value)
             if Parameter.Type.DOUBLE_ARRAY == self:
+                if isinstance(parameter_value, array.array):
+                    return parameter_value.typecode in _DOUBLE_ARRAY_TYPECODES
+                dtype = _get_ndarray_dtype(parameter_value)
+                if dtype is not None:
+                    return dtype.kind == 'f' and dtype.itemsize <= 8
                 return isinstance(parameter_value, list) and \
                     all(isinstance(v, float) for v in parameter_value)
             if Parameter.Type.STRING_ARRAY == self:
@@ -125,11 +168,14 @@ class Parameter:
         elif Parameter.Type.BYTE_ARRAY == self.type_:
             parameter_value.byte_array_value = self.value
         elif Parameter.Type.BOOL_ARRAY == self.type_:
-            parameter_value.bool_array_value = self.value
+            if _get_ndarray_dtype(self.value) is not None:
+                parameter_value.bool_array_value = self.value.tolist()
+            else:
+                parameter_value.bool_array_value = self.value
         elif Parameter.Type.INTEGER_ARRAY == self.type_:
-            parameter_value.integer_array_value = self.value
+            parameter_value.integer_array_value = _to_array('q', self.value)
         elif Parameter.Type.DOUBLE_ARRAY == self.type_:
-            parameter_value.double_array_value = self.value
+            parameter_value.double_array_value = _to_array('d', self.value)
         elif Parameter.Type.STRING_ARRAY == self.type_:
             parameter_value.string_array_value = self.value
         return parameter_value
@@ -0,0 +1,338 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from typing import List
+
+from rcl_interfaces.msg import Parameter as ParameterMsg
+from rcl_interfaces.msg import ParameterEvent
+from rcl_interfaces.srv import GetParameters
+from rcl_interfaces.srv import ListParameters
+from rcl_interfaces.srv import SetParameters
+from rclpy.callback_groups import CallbackGroup
+from rclpy.parameter import Parameter
+from rclpy.qos import qos_profile_parameter_events
+from rclpy.qos import qos_profile_parameters
+from rclpy.task import Future
+
+
+class ParameterClient:
+    """
+    Get, set and list the parameters of another node.
+
+    Calls made before the executor next runs the client are batched into a single request per
+    service, e.g. getting parameters from several callbacks sends one ``get_parameters``
+    request for all of them.
+
+    Parameters that were got or set are cached, and the cache is kept up to date with the
+    parameter events that the remote node publishes, so getting parameters again normally
+    completes right away without a service call.
+    Events published before the subscription to them was matched are missed, so call
+    :meth:`invalidate_cache` if the cache may be stale, e.g. after the remote node restarted.
+
+    Requests are sent from a guard condition callback, so the node must be spinning.
+
+    :param node: The node to create the service clients and the subscription with.
+    :param remote_node_name: The fully qualified name of the remote node, e.g. ``'/ns/name'``.
+    :param callback_group: The callback group for the service clients, the subscription and the
+        guard condition. If ``None``, then the node's default callback group is used.
+    :param use_cache: ``False`` to get parameters from the remote node every time.
+    """
+
+    def __init__(
+        self,
+        node,
+        remote_node_name: str,
+        *,
+        callback_group: CallbackGroup = None,
+        use_cache: bool = True
+    ) -> None:
+        if not remote_node_name.startswith('/'):
+            remote_node_name = '/' + remote_node_name
+        self._node = node
+        self._remote_node_name = remote_node_name
+        self._use_cache = use_cache
+        self._lock = threading.Lock()
+
+        self._get_client = node.create_client(
+            GetParameters, remote_node_name + '/get_parameters',
+            qos_profile=qos_profile_parameters, callback_group=callback_group)
+        self._set_client = node.create_client(
+            SetParameters, remote_node_name + '/set_parameters',
+            qos_profile=qos_profile_parameters, callback_group=callback_group)
+        self._list_client = node.create_client(
+            ListParameters, remote_node_name + '/list_parameters',
+            qos_profile=qos_profile_parameters, callback_group=callback_group)
+        self._parameter_event_subscription = None
+        if use_cache:
+            # Nodes publish parameter events in their namespace
+            namespace = remote_node_name.rpartition('/')[0]
+            self._parameter_event_subscription = node.create_subscription(
+                ParameterEvent, namespace + '/parameter_events', self._on_parameter_event,
+                qos_profile=qos_profile_parameter_events, callback_group=callback_group)
+        self._send_guard = node.create_guard_condition(
+            self._send_pending_calls, callback_group=callback_group)
+
+        # key: parameter name, value: Parameter, of type NOT_SET if the parameter is not set
+        self._cache = {}
+        # Incremented by each parameter event, so responses older than an event can be detected
+        self._generation = 0
+        # key: parameter name, value: generation of the last event that changed the parameter
+        self._changed_generations = {}
+        # Responses to requests sent before this generation are not cached
+        self._valid_generation = 0
+
+        # Calls waiting to be sent, with the futures to complete with their results
+        self._pending_gets = []
+        self._pending_sets = []
+        # key: (prefixes, depth), value: list of futures
+        self._pending_lists = {}
+        # Results of get calls answered from the cache before the node had an executor
+        self._cached_gets = []
+        self._send_requested = False
+
+    @property
+    def remote_node_name(self) -> str:
+        return self._remote_node_name
+
+    def wait_for_services(self, timeout_sec: float = None) -> bool:
+        """
+        Wait for the parameter services of the remote node to be available.
+
+        :param timeout_sec: Seconds to wait. If ``None``, then wait forever.
+        :return: ``True`` if the services are available, ``False`` if the timeout expired.
+        """
+        for client in (self._get_client, self._set_client, self._list_client):
+            if not client.wait_for_service(timeout_sec=timeout_sec):
+                return False
+        return True
+
+    def get_parameters_async(self, names: List[str]) -> Future:
+        """
+        Get parameters of the remote node.
+
+        :param names: The names of the parameters to get.
+        :return: A future that completes with a list of :class:`Parameter`, in the order of
+            ``names``, of type ``NOT_SET`` for the parameters that are not set.
+        """
+        names = list(names)
+        future = Future()
+        with self._lock:
+            parameters = None
+            if self._use_cache:
+                parameters = [self._cache.get(name) for name in names]
+                if None in parameters:
+                    parameters = None
+            if parameters is None:
+                self._pending_gets.append((names, future))
+            elif self._node.executor is not None:
+                self._set_result(future, self._node.executor, parameters)
+                return future
+            else:
+                # Complete the future from the executor, so that its done callbacks run
+                self._cached_gets.append((parameters, future))
+        self._request_send()
+        return future
+
+    def set_parameters_async(self, parameters: List[Parameter]) -> Future:
+        """
+        Set parameters of the remote node.
+
+        Each parameter is set on its own, as with :meth:`rclpy.node.Node.set_parameters`.
+
+        :param parameters: The parameters to set, of type ``NOT_SET`` to delete them.
+        :return: A future that completes with a list of
+            :class:`rcl_interfaces.msg.SetParametersResult`, in the order of ``parameters``.
+        """
+        parameters = list(parameters)
+        for parameter in parameters:
+            if not isinstance(parameter, Parameter):
+                raise TypeError("parameter must be instance of type '{}'".format(repr(Parameter)))
+        future = Future()
+        with self._lock:
+            self._pending_sets.append((parameters, future))
+        self._request_send()
+        return future
+
+    def list_parameters_async(
+        self,
+        prefixes: List[str] = None,
+        depth: int = ListParameters.Request.DEPTH_RECURSIVE
+    ) -> Future:
+        """
+        List the parameters of the remote node.
+
+        Identical calls made before the request is sent share a single request.
+
+        :param prefixes: The prefixes to list the parameters under, or ``None`` to list all
+            parameters.
+        :param depth: Only list parameters whose names have fewer separators than this.
+        :return: A future that completes with a
+            :class:`rcl_interfaces.msg.ListParametersResult`.
+        """
+        key = (tuple(prefixes or ()), depth)
+        future = Future()
+        with self._lock:
+            self._pending_lists.setdefault(key, []).append(future)
+        self._request_send()
+        return future
+
+    def invalidate_cache(self) -> None:
+        """Forget the cached parameters, so that they are got from the remote node again."""
+        with self._lock:
+            self._cache.clear()
+            self._changed_generations.clear()
+            self._generation += 1
+            self._valid_generation = self._generation
+
+    def destroy(self) -> None:
+        """Destroy the service clients, subscription and guard condition of the client."""
+        with self._lock:
+            futures = [
+                future
+                for _, future in self._pending_gets + self._pending_sets + self._cached_gets]
+            for list_futures in self._pending_lists.values():
+                futures.extend(list_futures)
+            self._pending_gets = []
+            self._pending_sets = []
+            self._pending_lists = {}
+            self._cached_gets = []
+        for future in futures:
+            future.cancel()
+        self._node.destroy_client(self._get_client)
+        self._node.destroy_client(self._set_client)
+        self._node.destroy_client(self._list_client)
+        if self._parameter_event_subscription is not None:
+            self._node.destroy_subscription(self._parameter_event_subscription)
+        self._node.destroy_guard_condition(self._send_guard)
+
+    def _set_result(self, future, executor, result):
+        # Bind the future when it completes, since the node may have been added to an executor
+        # only after the call was made
+        future._set_executor(executor)
+        future.set_result(result)
+
+    def _set_exception(self, future, executor, exception):
+        future._set_executor(executor)
+        future.set_exception(exception)
+
+    def _request_send(self):
+        with self._lock:
+            if self._send_requested:
+                return
+            self._send_requested = True
+        self._send_guard.trigger()
+
+    def _send_pending_calls(self):
+        with self._lock:
+            gets, self._pending_gets = self._pending_gets, []
+            sets, self._pending_sets = self._pending_sets, []
+            lists, self._pending_lists = self._pending_lists, {}
+            cached_gets, self._cached_gets = self._cached_gets, []
+            self._send_requested = False
+            generation = self._generation
+
+        for parameters, future in cached_gets:
+            self._set_result(future, self._node.executor, parameters)
+
+        if gets:
+            # Parameters requested by several calls are only requested once
+            names = list(dict.fromkeys(name for call_names, _ in gets for name in call_names))
+            self._get_client.call_async(GetParameters.Request(names=names)).add_done_callback(
+                lambda future: self._on_get_response(future, names, gets, generation))
+        if sets:
+            parameters = [p for call_parameters, _ in sets for p in call_parameters]
+            request = SetParameters.Request(
+                parameters=[parameter.to_parameter_msg() for parameter in parameters])
+            self._set_client.call_async(request).add_done_callback(
+                lambda future: self._on_set_response(future, parameters, sets, generation))
+        for (prefixes, depth), futures in lists.items():
+            request = ListParameters.Request(prefixes=list(prefixes), depth=depth)
+            self._list_client.call_async(request).add_done_callback(
+                lambda future, futures=futures: self._on_list_response(future, futures))
+
+    def _cache_parameters(self, parameters, generation):
+        # Called with the lock held, with parameters from a request sent at `generation`
+        if not self._use_cache or generation < self._valid_generation:
+            return
+        changed_generations = self._changed_generations
+        for parameter in parameters:
+            if changed_generations.get(parameter.name, -1) <= generation:
+                self._cache[parameter.name] = parameter
+
+    def _on_get_response(self, response_future, names, calls, generation):
+        executor = response_future._executor()
+        exception = response_future.exception()
+        if exception is None and len(response_future.result().values) != len(names):
+            exception = RuntimeError(
+                "Invalid response from '{}': expected {} values".format(
+                    self._get_client.srv_name, len(names)))
+        if exception is not None:
+            for _, future in calls:
+                self._set_exception(future, executor, exception)
+            return
+
+        parameters = {
+            name: Parameter.from_parameter_msg(ParameterMsg(name=name, value=value))
+            for name, value in zip(names, response_future.result().values)}
+        with self._lock:
+            self._cache_parameters(parameters.values(), generation)
+            if self._use_cache:
+                # Prefer values from events that arrived after the request was sent
+                parameters = {name: self._cache.get(name, parameters[name]) for name in names}
+        for call_names, future in calls:
+            self._set_result(future, executor, [parameters[name] for name in call_names])
+
+    def _on_set_response(self, response_future, parameters, calls, generation):
+        executor = response_future._executor()
+        exception = response_future.exception()
+        if exception is None and len(response_future.result().results) != len(parameters):
+            exception = RuntimeError(
+                "Invalid response from '{}': expected {} results".format(
+                    self._set_client.srv_name, len(parameters)))
+        if exception is not None:
+            for _, future in calls:
+                self._set_exception(future, executor, exception)
+            return
+
+        results = response_future.result().results
+        with self._lock:
+            self._cache_parameters(
+                [p for p, result in zip(parameters, results) if result.successful], generation)
+        start = 0
+        for call_parameters, future in calls:
+            self._set_result(future, executor, results[start:start + len(call_parameters)])
+            start += len(call_parameters)
+
+    def _on_list_response(self, response_future, futures):
+        executor = response_future._executor()
+        exception = response_future.exception()
+        for future in futures:
+            if exception is not None:
+                self._set_exception(future, executor, exception)
+            else:
+                self._set_result(future, executor, response_future.result().result)
+
+    def _on_parameter_event(self, event):
+        if event.node != self._remote_node_name:
+            return
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            for msg in list(event.new_parameters) + list(event.changed_parameters):
+                self._cache[msg.name] = Parameter.from_parameter_msg(msg)
+                self._changed_generations[msg.name] = generation
+            for msg in event.deleted_parameters:
+                self._cache[msg.name] = Parameter(msg.name, Parameter.Type.NOT_SET)
+                self._changed_generations[msg.name] = generation
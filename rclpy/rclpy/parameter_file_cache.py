@@ -0,0 +1,107 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import threading
+from typing import Dict
+from typing import List
+import weakref
+
+from rclpy.impl.implementation_singleton import rclpy_implementation as _rclpy
+from rclpy.parameter import Parameter
+
+# key: Context, value: ParameterFileCache
+_parameter_file_caches = weakref.WeakKeyDictionary()
+_parameter_file_caches_lock = threading.Lock()
+
+
+def get_parameter_file_cache(context):
+    """
+    Get the cache of parsed parameter files shared by all nodes of a context.
+
+    :param context: The context the cache belongs to.
+    :return: The :class:`ParameterFileCache` of the context.
+    """
+    with _parameter_file_caches_lock:
+        cache = _parameter_file_caches.get(context)
+        if cache is None:
+            cache = ParameterFileCache()
+            _parameter_file_caches[context] = cache
+        return cache
+
+
+class ParameterFileCache:
+    """
+    Parsed parameter files, so that nodes given the same files don't parse them again.
+
+    A file is parsed again when its modification time or size changed since it was parsed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # key: path, value: (modification time and size, parameters by node name)
+        self._files = {}
+        self.num_parses = 0
+
+    def get_parameters_by_node_name(self, path: str) -> Dict[str, Dict[str, Parameter]]:
+        """
+        Get the parameters in a parameter file.
+
+        The returned parameters are shared, so they must not be modified.
+
+        :param path: The path of the parameter file.
+        :return: The parameters by their name, by the fully qualified name of their node.
+        :raises RuntimeError: if the file fails to parse.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            # Let the parser report the error
+            return _rclpy.rclpy_parse_parameter_file(Parameter, path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._files.get(path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        parameters_by_node_name = _rclpy.rclpy_parse_parameter_file(Parameter, path)
+        with self._lock:
+            self._files[path] = (version, parameters_by_node_name)
+            self.num_parses += 1
+        return parameters_by_node_name
+
+    def get_node_parameters(self, paths: List[str], node_name: str) -> Dict[str, Parameter]:
+        """
+        Get the parameters of a node from parameter files.
+
+        :param paths: The paths of the parameter files; values in later files take precedence.
+        :param node_name: The fully qualified name of the node.
+        :return: Copies of the node's parameters, by their name.
+        """
+        node_parameters = {}
+        for path in paths:
+            parameters = self.get_parameters_by_node_name(path).get(node_name)
+            if not parameters:
+                continue
+            for name, parameter in parameters.items():
+                value = parameter.value
+                if isinstance(value, list):
+                    # Don't let the node modify the cached value
+                    parameter = Parameter(name, parameter.type_, list(value))
+                node_parameters[name] = parameter
+        return node_parameters
+
+    def clear(self) -> None:
+        """Forget all parsed parameter files."""
+        with self._lock:
+            self._files.clear()
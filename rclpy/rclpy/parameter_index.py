@@ -0,0 +1,164 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import MutableMapping
+from typing import List
+from typing import Tuple
+
+from rclpy.parameter import PARAMETER_SEPARATOR_STRING
+
+
+class _PrefixNode:
+
+    __slots__ = ('names', 'children')
+
+    def __init__(self):
+        # Names of the parameters directly under this prefix
+        self.names = {}
+        # Nodes of the prefixes one level below this prefix, by their last component
+        self.children = {}
+
+
+class ParameterIndex(MutableMapping):
+    """
+    Store parameters by name, indexed by the prefixes of their names.
+
+    This is a mapping from parameter names to parameters, like a :class:`dict`.
+    The components of the names, separated by ``'.'``, are also kept in a prefix tree, so that
+    listing the parameters under a prefix only costs as much as the number of parameters found.
+    """
+
+    def __init__(self):
+        self._parameters = {}
+        self._root = _PrefixNode()
+
+    def __getitem__(self, name):
+        return self._parameters[name]
+
+    def __setitem__(self, name, parameter):
+        if name not in self._parameters:
+            *prefix, last = name.split(PARAMETER_SEPARATOR_STRING)
+            node = self._root
+            for component in prefix:
+                child = node.children.get(component)
+                if child is None:
+                    child = node.children[component] = _PrefixNode()
+                node = child
+            node.names[last] = name
+        self._parameters[name] = parameter
+
+    def __delitem__(self, name):
+        del self._parameters[name]
+        *prefix, last = name.split(PARAMETER_SEPARATOR_STRING)
+        path = [self._root]
+        for component in prefix:
+            path.append(path[-1].children[component])
+        del path[-1].names[last]
+        # Remove the prefixes that no longer have any parameters under them
+        for component, parent, node in zip(reversed(prefix), reversed(path[:-1]), reversed(path)):
+            if node.names or node.children:
+                break
+            del parent.children[component]
+
+    def __contains__(self, name):
+        return name in self._parameters
+
+    def __iter__(self):
+        return iter(self._parameters)
+
+    def __len__(self):
+        return len(self._parameters)
+
+    def _find(self, prefix):
+        node = self._root
+        if prefix:
+            for component in prefix.split(PARAMETER_SEPARATOR_STRING):
+                node = node.children.get(component)
+                if node is None:
+                    return None
+        return node
+
+    def _walk(self, node, prefix, level, depth):
+        # Yield the prefixes and nodes at or below `node`, `level` components deep
+        yield prefix, node
+        if depth is not None and level + 1 >= depth:
+            return
+        for component, child in node.children.items():
+            yield from self._walk(
+                child,
+                prefix + PARAMETER_SEPARATOR_STRING + component if prefix else component,
+                level + 1, depth)
+
+    def names_with_prefix(self, prefix: str) -> List[str]:
+        """
+        Get the names of the parameters under a prefix.
+
+        :param prefix: The prefix, without a trailing separator, or ``''`` for all parameters.
+        :return: The names of the parameters whose names start with ``prefix`` followed by the
+            separator.
+        """
+        node = self._find(prefix)
+        if node is None:
+            return []
+        level = prefix.count(PARAMETER_SEPARATOR_STRING) + 1 if prefix else 0
+        return [
+            name
+            for _, node in self._walk(node, prefix, level, None)
+            for name in node.names.values()]
+
+    def list(self, prefixes: List[str], depth: int = None) -> Tuple[List[str], List[str]]:
+        """
+        List parameter names and their prefixes, as for the ``list_parameters`` service.
+
+        :param prefixes: The prefixes to list the parameters under, or an empty list to list all
+            parameters.
+        :param depth: Only list parameters whose names have fewer separators than this, or
+            ``None`` to list parameters at any depth.
+        :return: The names of the parameters, and the prefixes of those names.
+            If ``prefixes`` is not empty, they are included in the returned prefixes when any
+            parameter is listed under them.
+        """
+        if not prefixes:
+            starts = ['']
+        else:
+            # Skip the prefixes under other requested prefixes, since those are listed already
+            prefixes = [prefix for prefix in prefixes if prefix]
+            starts = [
+                prefix for prefix in sorted(set(prefixes))
+                if not any(
+                    prefix.startswith(other + PARAMETER_SEPARATOR_STRING) for other in prefixes)]
+
+        names = []
+        found_prefixes = []
+        for start_prefix in starts:
+            start = self._find(start_prefix)
+            level = start_prefix.count(PARAMETER_SEPARATOR_STRING) + 1 if start_prefix else 0
+            if start is None or (depth is not None and level >= depth):
+                continue
+            for prefix, node in self._walk(start, start_prefix, level, depth):
+                if node.names:
+                    names.extend(node.names.values())
+                    if prefix:
+                        found_prefixes.append(prefix)
+
+        # Requested prefixes are listed too, when any parameter was found under them
+        found = set(found_prefixes)
+        for prefix in prefixes:
+            if prefix not in found and any(
+                found_prefix.startswith(prefix + PARAMETER_SEPARATOR_STRING)
+                for found_prefix in found_prefixes
+            ):
+                found_prefixes.append(prefix)
+                found.add(prefix)
+        return names, found_prefixes
@@ -14,7 +14,7 @@
 
 from rcl_interfaces.srv import DescribeParameters, GetParameters, GetParameterTypes
 from rcl_interfaces.srv import ListParameters, SetParameters, SetParametersAtomically
-from rclpy.parameter import Parameter, PARAMETER_SEPARATOR_STRING
+from rclpy.parameter import Parameter
 from rclpy.qos import qos_profile_parameters
 from rclpy.validate_topic_name import TOPIC_SEPARATOR_STRING
 
@@ -78,47 +78,14 @@ class ParameterService:
         return response
 
     def _list_parameters_callback(self, request, response):
-        names_with_prefixes = []
-        for name in self._node._parameters.keys():
-            if PARAMETER_SEPARATOR_STRING in name:
-                names_with_prefixes.append(name)
-                continue
-            elif request.prefixes:
-                continue
-            else:
-                response.result.names.append(name)
-        if 1 == request.depth:
-            return response
-
-        if not request.DEPTH_RECURSIVE == request.depth:
-            names_with_prefixes = filter(
-                lambda name:
-                    name.count(PARAMETER_SEPARATOR_STRING) < request.depth, names_with_prefixes
-            )
-        for name in names_with_prefixes:
-            if request.prefixes:
-                for prefix in request.prefixes:
-                    if name.startswith(prefix + PARAMETER_SEPARATOR_STRING):
-                        response.result.names.append(name)
-                        full_prefix = PARAMETER_SEPARATOR_STRING.join(
-                            name.split(PARAMETER_SEPARATOR_STRING)[0:-1])
-                        if full_prefix not in response.result.prefixes:
-                            response.result.prefixes.append(full_prefix)
-                        if prefix not in response.result.prefixes:
-                            response.result.prefixes.append(prefix)
-            else:
-                prefix = PARAMETER_SEPARATOR_STRING.join(
-                    name.split(PARAMETER_SEPARATOR_STRING)[0:-1])
-                if prefix not in response.result.prefixes:
-                    response.result.prefixes.append(prefix)
-                response.result.names.append(name)
-
+        depth = None if request.DEPTH_RECURSIVE == request.depth else request.depth
+        response.result.names, response.result.prefixes = self._node._parameters.list(
+            request.prefixes, depth)
         return response
 
     def _set_parameters_callback(self, request, response):
-        for p in request.parameters:
-            param = Parameter.from_parameter_msg(p)
-            response.results.append(self._node.set_parameters_atomically([param]))
+        response.results = self._node.set_parameters(
+            [Parameter.from_parameter_msg(p) for p in request.parameters])
         return response
 
     def _set_parameters_atomically_callback(self, request, response):
@@ -0,0 +1,91 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+from rclpy.clock import Clock
+from rclpy.constants import S_TO_NS
+from rclpy.context import Context
+from rclpy.duration import Duration
+from rclpy.time import Time
+from rclpy.utilities import get_default_context
+
+
+class Rate:
+    """
+    Run a loop at a fixed frequency.
+
+    Each call to :meth:`sleep` sleeps until the next deadline, where deadlines are a whole
+    number of periods after the rate was created or last reset.
+    Since deadlines don't depend on when :meth:`sleep` is called, the loop does not drift.
+
+    If a deadline has already passed when :meth:`sleep` is called, then the iteration overran
+    the period: :meth:`sleep` returns immediately, the overrun is recorded, and the missed
+    deadlines are skipped.
+
+    :param frequency: The frequency of the loop in Hz.
+    :param clock: The clock to sleep on.
+    :param context: The context whose shutdown interrupts :meth:`sleep`, or ``None`` for the
+        default context.
+    """
+
+    def __init__(self, frequency: float, *, clock: Clock, context: Context = None) -> None:
+        if frequency <= 0:
+            raise ValueError('frequency must be positive')
+        self._period_ns = int(round(S_TO_NS / frequency))
+        if self._period_ns < 1:
+            raise ValueError('frequency is too high')
+        self._clock = clock
+        self._context = get_default_context() if context is None else context
+        self._lock = threading.Lock()
+        self._next_deadline_ns = None
+        self.num_cycles = 0
+        self.num_overruns = 0
+        self._max_overrun_ns = 0
+        self.reset()
+
+    @property
+    def period(self) -> Duration:
+        return Duration(nanoseconds=self._period_ns)
+
+    @property
+    def max_overrun(self) -> Duration:
+        """Get the longest time a call to :meth:`sleep` was made after its deadline."""
+        return Duration(nanoseconds=self._max_overrun_ns)
+
+    def reset(self) -> None:
+        """Start counting periods from now."""
+        with self._lock:
+            self._next_deadline_ns = self._clock.now_ns() + self._period_ns
+
+    def sleep(self) -> bool:
+        """
+        Sleep until the next deadline.
+
+        :return: ``True`` if the deadline was reached, or ``False`` if the context was shut down.
+        """
+        now_ns = self._clock.now_ns()
+        with self._lock:
+            self.num_cycles += 1
+            deadline_ns = self._next_deadline_ns
+            overrun_ns = now_ns - deadline_ns
+            if overrun_ns > 0:
+                self.num_overruns += 1
+                self._max_overrun_ns = max(self._max_overrun_ns, overrun_ns)
+                # Skip the deadlines that were missed
+                self._next_deadline_ns += (overrun_ns // self._period_ns + 1) * self._period_ns
+                return self._context.ok()
+            self._next_deadline_ns += self._period_ns
+        return self._clock.sleep_until(
+            Time(nanoseconds=deadline_ns, clock_type=self._clock.clock_type), self._context)
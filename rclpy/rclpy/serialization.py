@@ -0,0 +1,45 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import TypeVar
+
+from rclpy.impl.implementation_singleton import rclpy_implementation as _rclpy
+from rclpy.type_support import check_for_type_support
+
+# Used for documentation purposes only
+MsgType = TypeVar('MsgType')
+
+
+def serialize_message(message: MsgType) -> bytes:
+    """
+    Serialize a ROS message.
+
+    :param message: The ROS message to serialize.
+    :return: The serialized bytes.
+    """
+    check_for_type_support(type(message))
+    return _rclpy.rclpy_serialize(message)
+
+
+def deserialize_message(serialized_message: bytes, message_type: MsgType) -> MsgType:
+    """
+    Deserialize a ROS message.
+
+    :param serialized_message: The serialized bytes, e.g. as received by a raw subscription,
+        raw service server or raw service client.
+    :param message_type: The type of the serialized ROS message.
+    :return: The deserialized ROS message.
+    """
+    check_for_type_support(message_type)
+    return _rclpy.rclpy_deserialize(serialized_message, message_type)
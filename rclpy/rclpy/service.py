@@ -12,7 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import OrderedDict
+import threading
+import time
 from typing import Callable
+from typing import Optional
 from typing import TypeVar
 
 from rclpy.callback_groups import CallbackGroup
@@ -25,6 +29,91 @@ SrvTypeRequest = TypeVar('SrvTypeRequest')
 SrvTypeResponse = TypeVar('SrvTypeResponse')
 
 
+class ResponseCache:
+    """
+    A bounded cache of service responses keyed by the serialized request.
+
+    A service server created with a response cache answers a request that is byte-for-byte
+    identical to a previously answered one with the stored response, without calling the
+    service callback.
+    This is only appropriate for idempotent services whose responses depend solely on the request.
+
+    Requests to such a service are taken in serialized form and only converted to Python
+    messages when the callback has to be called, so a cache hit costs taking the request and
+    sending the stored response.
+
+    :param max_entries: Maximum number of responses to keep. When full, the least recently used
+        response is evicted.
+    :param ttl_sec: Seconds a response stays valid after it was stored, or ``None`` to keep it
+        until it is evicted or invalidated.
+    """
+
+    def __init__(self, *, max_entries: int = 128, ttl_sec: Optional[float] = None) -> None:
+        if max_entries < 1:
+            raise ValueError('max_entries must be at least 1')
+        if ttl_sec is not None and ttl_sec <= 0:
+            raise ValueError('ttl_sec must be positive or None')
+        self._max_entries = max_entries
+        self._ttl_sec = ttl_sec
+        # key: serialized request, value: 2-tuple of expiry time (or None) and response
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: bytes):
+        """
+        Get the response stored for a serialized request.
+
+        :param key: The serialized request.
+        :return: The cached response, or ``None`` if there is no valid entry for the request.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expiry, response = entry
+                if expiry is None or time.monotonic() < expiry:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return response
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: bytes, response) -> None:
+        """
+        Store the response for a serialized request.
+
+        :param key: The serialized request.
+        :param response: The response to send for identical requests.
+        """
+        expiry = None
+        if self._ttl_sec is not None:
+            expiry = time.monotonic() + self._ttl_sec
+        with self._lock:
+            self._entries[key] = (expiry, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Optional[bytes] = None) -> None:
+        """
+        Drop cached responses.
+
+        :param key: The serialized request to drop the response for. If ``None``, then all
+            cached responses are dropped.
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+
 class Service:
     def __init__(
         self,
@@ -34,7 +123,9 @@ class Service:
         srv_name: str,
         callback: Callable[[SrvTypeRequest, SrvTypeResponse], SrvTypeResponse],
         callback_group: CallbackGroup,
-        qos_profile: QoSProfile
+        qos_profile: QoSProfile,
+        response_cache: Optional[ResponseCache] = None,
+        raw: bool = False
     ) -> None:
         """
         Create a container for a ROS service server.
@@ -51,6 +142,10 @@ class Service:
         :param callback_group: The callback group for the service server. If ``None``, then the
             nodes default callback group is used.
         :param qos_profile: The quality of service profile to apply the service server.
+        :param response_cache: Cache used to answer repeated identical requests without calling
+            the callback, or ``None`` to call the callback for every request.
+        :param raw: If ``True``, then requests are given to the callback in serialized form
+            together with their header, and responses are sent in serialized form.
         """
         self.node_handle = node_handle
         self.__handle = service_handle
@@ -61,17 +156,44 @@ class Service:
         # True when the callback is ready to fire but has not been "taken" by an executor
         self._executor_event = False
         self.qos_profile = qos_profile
+        self.response_cache = response_cache
+        self.raw = raw
+
+    def _serialize_request(self, request: SrvTypeRequest) -> bytes:
+        if self.raw:
+            return request
+        return _rclpy.rclpy_serialize(request)
+
+    def invalidate_cached_responses(self, request: SrvTypeRequest = None) -> None:
+        """
+        Drop responses held in the response cache of this service.
+
+        :param request: Drop only the response to this request. If ``None``, then all cached
+            responses are dropped.
+        """
+        if self.response_cache is None:
+            return
+        if request is None:
+            self.response_cache.invalidate()
+        else:
+            self.response_cache.invalidate(self._serialize_request(request))
 
     def send_response(self, response: SrvTypeResponse, header) -> None:
         """
         Send a service response.
 
-        :param response: The service response.
+        :param response: The service response, or the serialized response if the service is raw.
         :param header: Capsule pointing to the service header from the original request.
         :raises: TypeError if the type of the passed response isn't an instance
           of the Response type of the provided service when the service was
-          constructed.
+          constructed, or isn't ``bytes`` if the service is raw.
         """
+        if self.raw:
+            if not isinstance(response, bytes):
+                raise TypeError()
+            with self.handle as capsule:
+                _rclpy.rclpy_send_response(capsule, response, header, self.srv_type.Response)
+            return
         if not isinstance(response, self.srv_type.Response):
             raise TypeError()
         with self.handle as capsule:
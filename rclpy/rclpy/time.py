@@ -12,14 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from operator import attrgetter
+
 import builtin_interfaces
 from rclpy.clock import ClockType
+from rclpy.constants import S_TO_NS
 from rclpy.duration import Duration
 from rclpy.impl.implementation_singleton import rclpy_implementation as _rclpy
 
+# rcl stores time points as signed 64-bit integers (rcl_time_point_value_t), but times have
+# always been accepted up to the largest unsigned 64-bit integer, since that is how the
+# nanoseconds used to be converted to C
+_TIME_MAX_NS = 2**64 - 1
+
 
 class Time:
 
+    __slots__ = ('_nanoseconds', '_clock_type')
+
     def __init__(self, *, seconds=0, nanoseconds=0, clock_type=ClockType.SYSTEM_TIME):
         if not isinstance(clock_type, ClockType):
             raise TypeError('Clock type must be a ClockType enum')
@@ -27,18 +37,32 @@ class Time:
             raise ValueError('Seconds value must not be negative')
         if nanoseconds < 0:
             raise ValueError('Nanoseconds value must not be negative')
-        total_nanoseconds = int(seconds * 1e9)
+        if isinstance(seconds, int):
+            total_nanoseconds = seconds * S_TO_NS
+        else:
+            total_nanoseconds = int(seconds * 1e9)
         total_nanoseconds += int(nanoseconds)
-        try:
-            self._time_handle = _rclpy.rclpy_create_time_point(total_nanoseconds, clock_type)
-        except OverflowError as e:
-            raise OverflowError(
-                'Total nanoseconds value is too large to store in C time point.') from e
+        if total_nanoseconds > _TIME_MAX_NS:
+            raise OverflowError('Total nanoseconds value is too large to store in C time point.')
+        self._nanoseconds = total_nanoseconds
         self._clock_type = clock_type
 
+    @classmethod
+    def _from_nanoseconds(cls, nanoseconds, clock_type):
+        # Skip the argument conversion of __init__ for values already known to be valid
+        time = cls.__new__(cls)
+        time._nanoseconds = nanoseconds
+        time._clock_type = clock_type
+        return time
+
     @property
     def nanoseconds(self):
-        return _rclpy.rclpy_time_point_get_nanoseconds(self._time_handle)
+        return self._nanoseconds
+
+    @property
+    def _time_handle(self):
+        # Create a capsule holding an rcl time point with the same value, to pass to rcl
+        return _rclpy.rclpy_create_time_point(self._nanoseconds, self._clock_type)
 
     def seconds_nanoseconds(self):
         """
@@ -47,8 +71,7 @@ class Time:
         :returns: 2-tuple seconds and nanoseconds
         :rtype: tuple(int, int)
         """
-        nanoseconds = self.nanoseconds
-        return (int(nanoseconds / 1e9), nanoseconds % 1e9)
+        return divmod(self._nanoseconds, S_TO_NS)
 
     @property
     def clock_type(self):
@@ -56,16 +79,16 @@ class Time:
 
     def __repr__(self):
         return 'Time(nanoseconds={0}, clock_type={1})'.format(
-            self.nanoseconds, self.clock_type.name)
+            self._nanoseconds, self._clock_type.name)
 
     def __add__(self, other):
         if isinstance(other, Duration):
-            try:
-                return Time(
-                    nanoseconds=(self.nanoseconds + other.nanoseconds),
-                    clock_type=self.clock_type)
-            except OverflowError as e:
-                raise OverflowError('Addition leads to overflow in C storage.') from e
+            nanoseconds = self._nanoseconds + other._nanoseconds
+            if nanoseconds > _TIME_MAX_NS:
+                raise OverflowError('Addition leads to overflow in C storage.')
+            if nanoseconds < 0:
+                raise ValueError('Addition leads to negative time.')
+            return Time._from_nanoseconds(nanoseconds, self._clock_type)
         else:
             return NotImplemented
 
@@ -73,28 +96,37 @@ class Time:
         return self.__add__(other)
 
     def __sub__(self, other):
+        """
+        Subtract a time or a duration from this time.
+
+        :param other: A :class:`Time` with the same clock type, or a :class:`Duration`.
+        :return: The :class:`Duration` from ``other`` to this time, which is negative if ``other``
+            is later, or the :class:`Time` that is ``other`` earlier than this time.
+        :raises ValueError: if subtracting a duration leads to a negative time.
+        :raises OverflowError: if the result is too large to store in C.
+        """
         if isinstance(other, Time):
-            if self.clock_type != other.clock_type:
+            if self._clock_type != other._clock_type:
                 raise TypeError("Can't subtract times with different clock types")
             try:
-                return Duration(nanoseconds=(self.nanoseconds - other.nanoseconds))
-            except ValueError as e:
-                raise ValueError('Subtraction leads to negative duration.') from e
+                return Duration(nanoseconds=(self._nanoseconds - other._nanoseconds))
+            except OverflowError as e:
+                raise OverflowError('Subtraction leads to overflow in C storage.') from e
         if isinstance(other, Duration):
-            try:
-                return Time(
-                    nanoseconds=(self.nanoseconds - other.nanoseconds),
-                    clock_type=self.clock_type)
-            except ValueError as e:
-                raise ValueError('Subtraction leads to negative time.') from e
+            nanoseconds = self._nanoseconds - other._nanoseconds
+            if nanoseconds < 0:
+                raise ValueError('Subtraction leads to negative time.')
+            if nanoseconds > _TIME_MAX_NS:
+                raise OverflowError('Subtraction leads to overflow in C storage.')
+            return Time._from_nanoseconds(nanoseconds, self._clock_type)
         else:
             return NotImplemented
 
     def __eq__(self, other):
         if isinstance(other, Time):
-            if self.clock_type != other.clock_type:
+            if self._clock_type != other._clock_type:
                 raise TypeError("Can't compare times with different clock types")
-            return self.nanoseconds == other.nanoseconds
+            return self._nanoseconds == other._nanoseconds
         # Raise instead of returning NotImplemented to prevent comparison with invalid types,
         # e.g. ints.
         # Otherwise `Time(nanoseconds=5) == 5` will return False instead of raising, and this
@@ -106,35 +138,34 @@ class Time:
 
     def __lt__(self, other):
         if isinstance(other, Time):
-            if self.clock_type != other.clock_type:
+            if self._clock_type != other._clock_type:
                 raise TypeError("Can't compare times with different clock types")
-            return self.nanoseconds < other.nanoseconds
+            return self._nanoseconds < other._nanoseconds
         return NotImplemented
 
     def __le__(self, other):
         if isinstance(other, Time):
-            if self.clock_type != other.clock_type:
+            if self._clock_type != other._clock_type:
                 raise TypeError("Can't compare times with different clock types")
-            return self.nanoseconds <= other.nanoseconds
+            return self._nanoseconds <= other._nanoseconds
         return NotImplemented
 
     def __gt__(self, other):
         if isinstance(other, Time):
-            if self.clock_type != other.clock_type:
+            if self._clock_type != other._clock_type:
                 raise TypeError("Can't compare times with different clock types")
-            return self.nanoseconds > other.nanoseconds
+            return self._nanoseconds > other._nanoseconds
         return NotImplemented
 
     def __ge__(self, other):
         if isinstance(other, Time):
-            if self.clock_type != other.clock_type:
+            if self._clock_type != other._clock_type:
                 raise TypeError("Can't compare times with different clock types")
-            return self.nanoseconds >= other.nanoseconds
+            return self._nanoseconds >= other._nanoseconds
         return NotImplemented
 
     def to_msg(self):
-        seconds = int(self.nanoseconds * 1e-9)
-        nanoseconds = int(self.nanoseconds % 1e9)
+        seconds, nanoseconds = divmod(self._nanoseconds, S_TO_NS)
         return builtin_interfaces.msg.Time(sec=seconds, nanosec=nanoseconds)
 
     @classmethod
@@ -142,3 +173,84 @@ class Time:
         if not isinstance(msg, builtin_interfaces.msg.Time):
             raise TypeError('Must pass a builtin_interfaces.msg.Time object')
         return cls(seconds=msg.sec, nanoseconds=msg.nanosec, clock_type=clock_type)
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError('NumPy is required for vectorized stamp conversions') from e
+    return numpy
+
+
+def _stamp_to_nanoseconds(stamp):
+    if isinstance(stamp, Time):
+        return stamp.nanoseconds
+    if isinstance(stamp, builtin_interfaces.msg.Time):
+        return stamp.sec * S_TO_NS + stamp.nanosec
+    return stamp
+
+
+def stamps_to_nanoseconds(stamps):
+    """
+    Convert a sequence of stamps to an array of nanoseconds.
+
+    This converts all stamps in one pass without creating a :class:`Time` for each one.
+
+    :param stamps: Sequence of ``builtin_interfaces.msg.Time`` messages.
+    :return: NumPy ``int64`` array with one element per stamp.
+    """
+    numpy = _import_numpy()
+    if not isinstance(stamps, (list, tuple)):
+        stamps = list(stamps)
+    count = len(stamps)
+    seconds = numpy.fromiter(map(attrgetter('sec'), stamps), dtype=numpy.int64, count=count)
+    nanoseconds = numpy.fromiter(
+        map(attrgetter('nanosec'), stamps), dtype=numpy.int64, count=count)
+    seconds *= S_TO_NS
+    seconds += nanoseconds
+    return seconds
+
+
+def nanoseconds_to_stamps(nanoseconds):
+    """
+    Convert an array of nanoseconds to stamps.
+
+    :param nanoseconds: Array-like of integer nanoseconds, e.g. from
+        :func:`stamps_to_nanoseconds`.
+    :return: List of ``builtin_interfaces.msg.Time`` messages.
+    """
+    numpy = _import_numpy()
+    seconds, remainders = numpy.divmod(numpy.asarray(nanoseconds, dtype=numpy.int64), S_TO_NS)
+    TimeMsg = builtin_interfaces.msg.Time
+    return [
+        TimeMsg(sec=sec, nanosec=nanosec)
+        for sec, nanosec in zip(seconds.tolist(), remainders.tolist())]
+
+
+def stamp_differences(stamps, other):
+    """
+    Get the element-wise differences between stamps in nanoseconds.
+
+    :param stamps: Array of nanoseconds from :func:`stamps_to_nanoseconds`.
+    :param other: Array of nanoseconds of the same length, or a single :class:`Time`,
+        ``builtin_interfaces.msg.Time`` or integer nanoseconds to subtract from every stamp.
+    :return: NumPy ``int64`` array of ``stamps - other``.
+    """
+    numpy = _import_numpy()
+    return numpy.subtract(stamps, _stamp_to_nanoseconds(other), dtype=numpy.int64)
+
+
+def stamps_in_range(stamps, start, end):
+    """
+    Check which stamps are in the half-open interval ``[start, end)``.
+
+    :param stamps: Array of nanoseconds from :func:`stamps_to_nanoseconds`.
+    :param start: The start of the interval as a :class:`Time`, ``builtin_interfaces.msg.Time``
+        or integer nanoseconds.
+    :param end: The end of the interval, in the same forms as ``start``.
+    :return: NumPy boolean array that is ``True`` where a stamp is in the interval.
+    """
+    numpy = _import_numpy()
+    stamps = numpy.asarray(stamps, dtype=numpy.int64)
+    return (stamps >= _stamp_to_nanoseconds(start)) & (stamps < _stamp_to_nanoseconds(end))
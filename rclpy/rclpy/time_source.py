@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
+import weakref
+
 from rcl_interfaces.msg import SetParametersResult
 from rclpy.clock import ClockType
 from rclpy.clock import ROSClock
@@ -21,12 +24,102 @@ import rosgraph_msgs.msg
 
 CLOCK_TOPIC = '/clock'
 
+# key: Context, value: SharedTimeSource
+_shared_time_sources = weakref.WeakKeyDictionary()
+_shared_time_sources_lock = threading.Lock()
+
+
+def get_shared_time_source(context):
+    """
+    Get the time source shared by all nodes of a context that opt in to sharing it.
+
+    :param context: The context the shared time source belongs to.
+    :return: The :class:`SharedTimeSource` of the context.
+    """
+    with _shared_time_sources_lock:
+        shared_time_source = _shared_time_sources.get(context)
+        if shared_time_source is None:
+            shared_time_source = SharedTimeSource()
+            _shared_time_sources[context] = shared_time_source
+        return shared_time_source
+
+
+class SharedTimeSource:
+    """
+    A single subscription to the clock topic serving many time sources.
+
+    Time sources created with ``shared=True`` register here while ROS time is active instead
+    of each subscribing to the clock topic.
+    Each clock message is converted once and the resulting time is set on the clocks of all
+    registered time sources.
+    The subscription is created on the node of one of the registered time sources, and moved to
+    another one if that time source is removed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._time_sources = []
+        # TimeSource whose node owns the clock subscription
+        self._subscribed_time_source = None
+        self._clock_sub = None
+        # Zero time is a special value that means time is uninitialzied
+        self._last_time_set = Time(clock_type=ClockType.ROS_TIME)
+
+    def add_time_source(self, time_source):
+        with self._lock:
+            if time_source in self._time_sources:
+                return
+            self._time_sources.append(time_source)
+            if self._clock_sub is None:
+                self._subscribe(time_source)
+            last_time_set = self._last_time_set
+        if last_time_set.nanoseconds != 0:
+            time_source._set_ros_time(last_time_set)
+
+    def remove_time_source(self, time_source):
+        with self._lock:
+            if time_source not in self._time_sources:
+                return
+            self._time_sources.remove(time_source)
+            if self._subscribed_time_source is time_source:
+                time_source._node.destroy_subscription(self._clock_sub)
+                self._clock_sub = None
+                self._subscribed_time_source = None
+                if self._time_sources:
+                    self._subscribe(self._time_sources[0])
+
+    def _subscribe(self, time_source):
+        self._clock_sub = time_source._node.create_subscription(
+            rosgraph_msgs.msg.Clock,
+            CLOCK_TOPIC,
+            self.clock_callback
+        )
+        self._subscribed_time_source = time_source
+
+    def clock_callback(self, msg):
+        time_from_msg = Time.from_msg(msg.clock)
+        with self._lock:
+            self._last_time_set = time_from_msg
+            time_sources = list(self._time_sources)
+        for time_source in time_sources:
+            time_source._set_ros_time(time_from_msg)
+
 
 class TimeSource:
 
-    def __init__(self, *, node=None):
+    def __init__(self, *, node=None, shared=False):
+        """
+        Create a time source.
+
+        :param node: Node whose ``use_sim_time`` parameter controls the time source.
+        :param shared: If ``True``, then clock messages are received through the
+            :class:`SharedTimeSource` of the node's context instead of a subscription owned by
+            this time source.
+        """
         self._clock_sub = None
         self._node = None
+        self._shared = shared
+        self._shared_time_source = None
         self._associated_clocks = []
         # Zero time is a special value that means time is uninitialzied
         self._last_time_set = Time(clock_type=ClockType.ROS_TIME)
@@ -48,11 +141,17 @@ class TimeSource:
         if enabled:
             self._subscribe_to_clock_topic()
         else:
+            self._unsubscribe_from_shared_time_source()
             if self._clock_sub is not None and self._node is not None:
                 self._node.destroy_subscription(self._clock_sub)
                 self._clock_sub = None
 
     def _subscribe_to_clock_topic(self):
+        if self._shared:
+            if self._shared_time_source is None and self._node is not None:
+                self._shared_time_source = get_shared_time_source(self._node.context)
+                self._shared_time_source.add_time_source(self)
+            return
         if self._clock_sub is None and self._node is not None:
             self._clock_sub = self._node.create_subscription(
                 rosgraph_msgs.msg.Clock,
@@ -83,7 +182,13 @@ class TimeSource:
 
         node.set_parameters_callback(self._on_parameter_event)
 
+    def _unsubscribe_from_shared_time_source(self):
+        if self._shared_time_source is not None:
+            self._shared_time_source.remove_time_source(self)
+            self._shared_time_source = None
+
     def detach_node(self):
+        self._unsubscribe_from_shared_time_source()
         # Remove the subscription to the clock topic.
         if self._clock_sub is not None:
             if self._node is None:
@@ -101,11 +206,13 @@ class TimeSource:
         self._associated_clocks.append(clock)
 
     def clock_callback(self, msg):
-        # Cache the last message in case a new clock is attached.
-        time_from_msg = Time.from_msg(msg.clock)
-        self._last_time_set = time_from_msg
+        self._set_ros_time(Time.from_msg(msg.clock))
+
+    def _set_ros_time(self, time):
+        # Cache the last time in case a new clock is attached.
+        self._last_time_set = time
         for clock in self._associated_clocks:
-            clock.set_ros_time_override(time_from_msg)
+            clock.set_ros_time_override(time)
 
     def _on_parameter_event(self, parameter_list):
         for parameter in parameter_list:
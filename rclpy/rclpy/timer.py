@@ -19,13 +19,23 @@ from rclpy.impl.implementation_singleton import rclpy_implementation as _rclpy
 from rclpy.utilities import get_default_context
 
 
-# TODO(mikaelarguedas) create a Timer or ROSTimer once we can specify custom time sources
-class WallTimer:
+class Timer:
 
-    def __init__(self, callback, callback_group, timer_period_ns, *, context=None):
+    def __init__(self, callback, callback_group, timer_period_ns, clock, *, context=None):
+        """
+        Create a timer.
+
+        :param callback: A user-defined callback function that is called when the timer expires.
+        :param callback_group: The callback group for the timer.
+        :param timer_period_ns: The period of the timer in nanoseconds.
+        :param clock: The clock the timer measures time with.
+            If it is a :class:`ROSClock` using ROS time, then the timer fires as ROS time
+            advances, e.g. when messages are received on the clock topic.
+        :param context: The context to be associated with, or ``None`` for the default global
+            context.
+        """
         self._context = get_default_context() if context is None else context
-        # TODO(sloretz) Allow passing clocks in via timer constructor
-        self._clock = Clock(clock_type=ClockType.STEADY_TIME)
+        self._clock = clock
         with self._clock.handle as clock_capsule:
             self.__handle = Handle(_rclpy.rclpy_create_timer(
                 clock_capsule, self._context.handle, timer_period_ns))
@@ -84,3 +94,11 @@ class WallTimer:
     def time_until_next_call(self):
         with self.handle as capsule:
             return _rclpy.rclpy_time_until_next_call(capsule)
+
+
+class WallTimer(Timer):
+
+    def __init__(self, callback, callback_group, timer_period_ns, *, context=None):
+        super().__init__(
+            callback, callback_group, timer_period_ns, Clock(clock_type=ClockType.STEADY_TIME),
+            context=context)
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import weakref
+
 
 class NumberOfEntities:
 
@@ -56,11 +58,26 @@ class Waitable:
         self.callback_group.add_entity(self)
         # Flag set by executor when a handler has been created but not executed (used by Executor)
         self._executor_event = False
-        # List of Futures that have callbacks needing execution
-        self._futures = []
+        # Set of Futures that have callbacks needing execution
+        self._futures = set()
+        # Weak reference to the executor that last executed this waitable, if any
+        self._executor = None
 
     def add_future(self, future):
-        self._futures.append(future)
+        self._futures.add(future)
+        executor = self._executor() if self._executor is not None else None
+        if executor is not None:
+            future._set_executor(executor)
+
+    def _set_executor(self, executor):
+        """Schedule done callbacks of the futures on an executor (used by Executor)."""
+        if self._executor is not None and self._executor() is executor:
+            # Futures were bound to this executor when they were added
+            return
+        self._executor = weakref.ref(executor)
+        # Iterate over a copy since futures may be added or removed by other threads
+        for future in tuple(self._futures):
+            future._set_executor(executor)
 
     def remove_future(self, future):
         self._futures.remove(future)
@@ -2026,13 +2026,125 @@ rclpy_create_client(PyObject * Py_UNUSED(self), PyObject * args)
   return pyclient;
 }
 
+/// Get the type support of a ROS message type (internal)
+/**
+ * Raises AttributeError if the Python message type is missing the type support attribute
+ *
+ * \param[in] pymsg_type Python message type, or an instance of it
+ * \return pointer to the message type support, or NULL on failure
+ */
+static const rosidl_message_type_support_t *
+_rclpy_get_message_type_support(PyObject * pymsg_type)
+{
+  PyObject * pymetaclass = PyObject_GetAttrString(pymsg_type, "__class__");
+  if (!pymetaclass) {
+    return NULL;
+  }
+  const rosidl_message_type_support_t * ts =
+    (rosidl_message_type_support_t *)get_capsule_pointer(pymetaclass, "_TYPE_SUPPORT");
+  Py_DECREF(pymetaclass);
+  return ts;
+}
+
+/// Serialize a C ROS message into a Python bytes object (internal)
+/**
+ * Raises RuntimeError if the message cannot be serialized
+ *
+ * \param[in] ros_message pointer to the C message to serialize
+ * \param[in] ts type support of the message
+ * \return Python bytes object with the serialized message contents, or NULL on failure
+ */
+static PyObject *
+_rclpy_serialize_to_bytes(const void * ros_message, const rosidl_message_type_support_t * ts)
+{
+  rcl_serialized_message_t msg = rmw_get_zero_initialized_serialized_message();
+  rcutils_allocator_t allocator = rcutils_get_default_allocator();
+  rmw_ret_t ret = rmw_serialized_message_init(&msg, 0u, &allocator);
+  if (ret != RMW_RET_OK) {
+    PyErr_Format(PyExc_RuntimeError,
+      "Failed to initialize serialized message: %s", rmw_get_error_string().str);
+    rmw_reset_error();
+    return NULL;
+  }
+
+  ret = rmw_serialize(ros_message, ts, &msg);
+  if (ret != RMW_RET_OK) {
+    PyErr_Format(PyExc_RuntimeError,
+      "Failed to serialize message: %s", rmw_get_error_string().str);
+    rmw_reset_error();
+    rmw_ret_t r_fini = rmw_serialized_message_fini(&msg);
+    if (r_fini != RMW_RET_OK) {
+      PyErr_Format(PyExc_RuntimeError, "Failed to deallocate message buffer: %d", r_fini);
+    }
+    return NULL;
+  }
+
+  PyObject * python_bytes = PyBytes_FromStringAndSize((char *)(msg.buffer), msg.buffer_length);
+  rmw_ret_t r_fini = rmw_serialized_message_fini(&msg);
+  if (r_fini != RMW_RET_OK) {
+    PyErr_Format(PyExc_RuntimeError, "Failed to deallocate message buffer: %d", r_fini);
+    Py_XDECREF(python_bytes);
+    return NULL;
+  }
+  return python_bytes;
+}
+
+/// Deserialize a Python bytes object into a new C ROS message (internal)
+/**
+ * The returned message must be destroyed with the returned destructor.
+ *
+ * Raises TypeError if pybytes is not a bytes object
+ * Raises RuntimeError if the message cannot be deserialized
+ *
+ * \param[in] pybytes Python bytes object with the serialized message contents
+ * \param[in] pymsg_type Python type of the serialized message
+ * \param[out] destroy_ros_message The destructor function for finalizing the returned message
+ * \return pointer to the deserialized C message, or NULL on failure
+ */
+static void *
+_rclpy_deserialize_from_bytes(
+  PyObject * pybytes, PyObject * pymsg_type, destroy_ros_message_signature ** destroy_ros_message)
+{
+  if (!PyBytes_Check(pybytes)) {
+    PyErr_Format(PyExc_TypeError, "Serialized message must be a bytes object");
+    return NULL;
+  }
+
+  const rosidl_message_type_support_t * ts = _rclpy_get_message_type_support(pymsg_type);
+  if (!ts) {
+    return NULL;
+  }
+
+  void * ros_message = rclpy_create_from_py(pymsg_type, destroy_ros_message);
+  if (!ros_message) {
+    return NULL;
+  }
+
+  // The serialized message borrows the buffer of the bytes object, no copy is made
+  rcl_serialized_message_t msg = rmw_get_zero_initialized_serialized_message();
+  msg.buffer = (void *)PyBytes_AS_STRING(pybytes);
+  msg.buffer_length = (size_t)PyBytes_GET_SIZE(pybytes);
+  msg.buffer_capacity = msg.buffer_length;
+
+  rmw_ret_t ret = rmw_deserialize(&msg, ts, ros_message);
+  if (ret != RMW_RET_OK) {
+    PyErr_Format(PyExc_RuntimeError,
+      "Failed to deserialize message: %s", rmw_get_error_string().str);
+    rmw_reset_error();
+    (**destroy_ros_message)(ros_message);
+    return NULL;
+  }
+  return ros_message;
+}
+
 /// Publish a request message
 /**
  * Raises ValueError if pyclient is not a client capsule
  * Raises RuntimeError if the request could not be sent
  *
  * \param[in] pyclient Capsule pointing to the client
- * \param[in] pyrequest request message to send
+ * \param[in] pyrequest request message to send, or a bytes object with the serialized request
+ * \param[in] pyrequest_type Type of the request, only required if pyrequest is serialized
  * \return sequence_number PyLong object representing the index of the sent request
  */
 static PyObject *
@@ -2040,8 +2152,9 @@ rclpy_send_request(PyObject * Py_UNUSED(self), PyObject * args)
 {
   PyObject * pyclient;
   PyObject * pyrequest;
+  PyObject * pyrequest_type = NULL;
 
-  if (!PyArg_ParseTuple(args, "OO", &pyclient, &pyrequest)) {
+  if (!PyArg_ParseTuple(args, "OO|O", &pyclient, &pyrequest, &pyrequest_type)) {
     return NULL;
   }
   rclpy_client_t * client = (rclpy_client_t *)PyCapsule_GetPointer(pyclient, "rclpy_client_t");
@@ -2050,7 +2163,17 @@ rclpy_send_request(PyObject * Py_UNUSED(self), PyObject * args)
   }
 
   destroy_ros_message_signature * destroy_ros_message = NULL;
-  void * raw_ros_request = rclpy_convert_from_py(pyrequest, &destroy_ros_message);
+  void * raw_ros_request = NULL;
+  if (PyBytes_Check(pyrequest)) {
+    if (!pyrequest_type) {
+      PyErr_Format(PyExc_TypeError, "Request type is required to send a serialized request");
+      return NULL;
+    }
+    raw_ros_request = _rclpy_deserialize_from_bytes(
+      pyrequest, pyrequest_type, &destroy_ros_message);
+  } else {
+    raw_ros_request = rclpy_convert_from_py(pyrequest, &destroy_ros_message);
+  }
   if (!raw_ros_request) {
     return NULL;
   }
@@ -2209,8 +2332,9 @@ rclpy_create_service(PyObject * Py_UNUSED(self), PyObject * args)
  * Raises RuntimeError if the response could not be sent
  *
  * \param[in] pyservice Capsule pointing to the service
- * \param[in] pyresponse reply message to send
+ * \param[in] pyresponse reply message to send, or a bytes object with the serialized reply
  * \param[in] pyheader Capsule pointing to the rmw_request_id_t header of the request we respond to
+ * \param[in] pyresponse_type Type of the reply, only required if pyresponse is serialized
  * \return NULL
  */
 static PyObject *
@@ -2219,8 +2343,11 @@ rclpy_send_response(PyObject * Py_UNUSED(self), PyObject * args)
   PyObject * pyservice;
   PyObject * pyresponse;
   PyObject * pyheader;
+  PyObject * pyresponse_type = NULL;
 
-  if (!PyArg_ParseTuple(args, "OOO", &pyservice, &pyresponse, &pyheader)) {
+  if (!PyArg_ParseTuple(
+      args, "OOO|O", &pyservice, &pyresponse, &pyheader, &pyresponse_type))
+  {
     return NULL;
   }
   rclpy_service_t * srv = (rclpy_service_t *)PyCapsule_GetPointer(pyservice, "rclpy_service_t");
@@ -2235,7 +2362,17 @@ rclpy_send_response(PyObject * Py_UNUSED(self), PyObject * args)
   }
 
   destroy_ros_message_signature * destroy_ros_message = NULL;
-  void * raw_ros_response = rclpy_convert_from_py(pyresponse, &destroy_ros_message);
+  void * raw_ros_response = NULL;
+  if (PyBytes_Check(pyresponse)) {
+    if (!pyresponse_type) {
+      PyErr_Format(PyExc_TypeError, "Response type is required to send a serialized response");
+      return NULL;
+    }
+    raw_ros_response = _rclpy_deserialize_from_bytes(
+      pyresponse, pyresponse_type, &destroy_ros_message);
+  } else {
+    raw_ros_response = rclpy_convert_from_py(pyresponse, &destroy_ros_message);
+  }
   if (!raw_ros_response) {
     return NULL;
   }
@@ -2837,8 +2974,10 @@ rclpy_take(PyObject * Py_UNUSED(self), PyObject * args)
  *
  * \param[in] pyservice Capsule pointing to the service to process the request
  * \param[in] pyrequest_type Instance of the message type to take
+ * \param[in] pyraw If True, the request is returned serialized instead of converted
  * \return List with 2 elements:
- *            first element: a Python request message with all fields populated with received request
+ *            first element: a Python request message with all fields populated with received request,
+ *              or a bytes object with the serialized request if pyraw is True
  *            second element: a Capsule pointing to the header (rmw_request_id) of the processed request
  */
 static PyObject *
@@ -2846,8 +2985,13 @@ rclpy_take_request(PyObject * Py_UNUSED(self), PyObject * args)
 {
   PyObject * pyservice;
   PyObject * pyrequest_type;
+  PyObject * pyraw = Py_False;
 
-  if (!PyArg_ParseTuple(args, "OO", &pyservice, &pyrequest_type)) {
+  if (!PyArg_ParseTuple(args, "OO|O", &pyservice, &pyrequest_type, &pyraw)) {
+    return NULL;
+  }
+  int raw = PyObject_IsTrue(pyraw);
+  if (raw == -1) {
     return NULL;
   }
 
@@ -2880,7 +3024,15 @@ rclpy_take_request(PyObject * Py_UNUSED(self), PyObject * args)
   }
 
   if (ret != RCL_RET_SERVICE_TAKE_FAILED) {
-    PyObject * pytaken_request = rclpy_convert_to_py(taken_request, pyrequest_type);
+    PyObject * pytaken_request = NULL;
+    if (raw) {
+      const rosidl_message_type_support_t * ts = _rclpy_get_message_type_support(pyrequest_type);
+      if (ts) {
+        pytaken_request = _rclpy_serialize_to_bytes(taken_request, ts);
+      }
+    } else {
+      pytaken_request = rclpy_convert_to_py(taken_request, pyrequest_type);
+    }
     destroy_ros_message(taken_request);
     if (!pytaken_request) {
       PyMem_Free(header);
@@ -2917,6 +3069,7 @@ rclpy_take_request(PyObject * Py_UNUSED(self), PyObject * args)
  *
  * \param[in] pyclient Capsule pointing to the client to process the response
  * \param[in] pyresponse_type Instance of the message type to take
+ * \param[in] pyraw If True, the response is returned serialized instead of converted
  * \return 2-tuple sequence number and received response or None, None if there is no response
  */
 static PyObject *
@@ -2924,8 +3077,13 @@ rclpy_take_response(PyObject * Py_UNUSED(self), PyObject * args)
 {
   PyObject * pyclient;
   PyObject * pyresponse_type;
+  PyObject * pyraw = Py_False;
 
-  if (!PyArg_ParseTuple(args, "OO", &pyclient, &pyresponse_type)) {
+  if (!PyArg_ParseTuple(args, "OO|O", &pyclient, &pyresponse_type, &pyraw)) {
+    return NULL;
+  }
+  int raw = PyObject_IsTrue(pyraw);
+  if (raw == -1) {
     return NULL;
   }
   rclpy_client_t * client =
@@ -2956,7 +3114,15 @@ rclpy_take_response(PyObject * Py_UNUSED(self), PyObject * args)
   }
 
   if (ret != RCL_RET_CLIENT_TAKE_FAILED) {
-    PyObject * pytaken_response = rclpy_convert_to_py(taken_response, pyresponse_type);
+    PyObject * pytaken_response = NULL;
+    if (raw) {
+      const rosidl_message_type_support_t * ts = _rclpy_get_message_type_support(pyresponse_type);
+      if (ts) {
+        pytaken_response = _rclpy_serialize_to_bytes(taken_response, ts);
+      }
+    } else {
+      pytaken_response = rclpy_convert_to_py(taken_response, pyresponse_type);
+    }
     destroy_ros_message(taken_response);
     if (!pytaken_response) {
       // the function has set the Python error
@@ -2982,6 +3148,71 @@ rclpy_take_response(PyObject * Py_UNUSED(self), PyObject * args)
   return pytuple;
 }
 
+/// Serialize a ROS message
+/**
+ * Raises AttributeError if the Python message type is missing a required attribute
+ * Raises RuntimeError if the message cannot be serialized
+ *
+ * \param[in] pymsg Python message to serialize
+ * \return Python bytes object with the serialized message contents
+ */
+static PyObject *
+rclpy_serialize(PyObject * Py_UNUSED(self), PyObject * args)
+{
+  PyObject * pymsg;
+
+  if (!PyArg_ParseTuple(args, "O", &pymsg)) {
+    return NULL;
+  }
+
+  const rosidl_message_type_support_t * ts = _rclpy_get_message_type_support(pymsg);
+  if (!ts) {
+    return NULL;
+  }
+
+  destroy_ros_message_signature * destroy_ros_message = NULL;
+  void * raw_ros_message = rclpy_convert_from_py(pymsg, &destroy_ros_message);
+  if (!raw_ros_message) {
+    return NULL;
+  }
+
+  PyObject * python_bytes = _rclpy_serialize_to_bytes(raw_ros_message, ts);
+  destroy_ros_message(raw_ros_message);
+  return python_bytes;
+}
+
+/// Deserialize a ROS message
+/**
+ * Raises TypeError if pybytes is not a bytes object
+ * Raises AttributeError if the Python message type is missing a required attribute
+ * Raises RuntimeError if the message cannot be deserialized
+ *
+ * \param[in] pybytes Python bytes object with the serialized message contents
+ * \param[in] pymsg_type Python type of the serialized message
+ * \return Python message with all fields populated from the serialized message
+ */
+static PyObject *
+rclpy_deserialize(PyObject * Py_UNUSED(self), PyObject * args)
+{
+  PyObject * pybytes;
+  PyObject * pymsg_type;
+
+  if (!PyArg_ParseTuple(args, "OO", &pybytes, &pymsg_type)) {
+    return NULL;
+  }
+
+  destroy_ros_message_signature * destroy_ros_message = NULL;
+  void * raw_ros_message =
+    _rclpy_deserialize_from_bytes(pybytes, pymsg_type, &destroy_ros_message);
+  if (!raw_ros_message) {
+    return NULL;
+  }
+
+  PyObject * pymsg = rclpy_convert_to_py(raw_ros_message, pymsg_type);
+  destroy_ros_message(raw_ros_message);
+  return pymsg;
+}
+
 /// Status of the the client library
 /**
  * \return True if rcl is running properly, False otherwise
@@ -3828,6 +4059,45 @@ rclpy_clock_get_now(PyObject * Py_UNUSED(self), PyObject * args)
   return PyCapsule_New(time_point, "rcl_time_point_t", _rclpy_destroy_time_point);
 }
 
+/// Returns the current value of the clock in nanoseconds
+/**
+ * Unlike rclpy_clock_get_now() this doesn't allocate a time point.
+ *
+ * On failure, an exception is raised and NULL is returned if:
+ *
+ * Raises ValueError if pyclock is not a clock capsule
+ * Raises RuntimeError if the clock's value cannot be retrieved
+ *
+ * \param[in] pyclock Capsule pointing to the clock
+ * \return NULL on failure:
+ *         PyLong integer in nanoseconds on success
+ */
+static PyObject *
+rclpy_clock_get_now_nanoseconds(PyObject * Py_UNUSED(self), PyObject * args)
+{
+  PyObject * pyclock;
+  if (!PyArg_ParseTuple(args, "O", &pyclock)) {
+    return NULL;
+  }
+
+  rcl_clock_t * clock = (rcl_clock_t *)PyCapsule_GetPointer(
+    pyclock, "rcl_clock_t");
+  if (!clock) {
+    return NULL;
+  }
+
+  rcl_time_point_value_t nanoseconds;
+  rcl_ret_t ret = rcl_clock_get_now(clock, &nanoseconds);
+  if (ret != RCL_RET_OK) {
+    PyErr_Format(PyExc_RuntimeError,
+      "Failed to get current value of clock: %s", rcl_get_error_string().str);
+    rcl_reset_error();
+    return NULL;
+  }
+
+  return PyLong_FromLongLong(nanoseconds);
+}
+
 /// Returns if a clock using ROS time has the ROS time override enabled.
 /**
  * On failure, an exception is raised and NULL is returned if:
@@ -4355,27 +4625,22 @@ _populate_node_parameters_from_rcl_params(
   return true;
 }
 
-/// Populate a Python dict with node parameters parsed from arguments files
+/// Append the paths of the parameter files in parsed arguments to a Python list
 /**
  * On failure a Python exception is raised and false is returned if:
  *
  * Raises RuntimeError if param_files cannot be extracted from arguments.
- * Raises RuntimeError if yaml files do not parse succesfully.
  *
- * \param[in] args The arguments to parse for parameter files
+ * \param[in] args The arguments to get the parameter files of
  * \param[in] allocator Allocator to use for allocating and deallocating within the function.
- * \param[in] parameter_cls The PythonObject for the Parameter class.
- * \param[in] parameter_type_cls The PythonObject for the Parameter.Type class.
- * \param[out] params_by_node_name A Python dict object to place parsed parameters into.
- *
- * Returns true when parameters are parsed successfully (including the trivial case)
- *         false when there was an error during parsing and a Python exception was raised.
+ * \param[out] param_files_list A Python list to append the paths to.
  *
+ * Returns true when the paths are appended successfully (including the trivial case)
+ *         false when there was an error and a Python exception was raised.
  */
 static bool
-_parse_param_files(
-  const rcl_arguments_t * args, rcl_allocator_t allocator, PyObject * parameter_cls,
-  PyObject * parameter_type_cls, PyObject * params_by_node_name)
+_append_param_files(
+  const rcl_arguments_t * args, rcl_allocator_t allocator, PyObject * param_files_list)
 {
   char ** param_files;
   int param_files_count = rcl_arguments_get_param_files_count(args);
@@ -4386,25 +4651,16 @@ _parse_param_files(
   if (RCL_RET_OK != rcl_arguments_get_param_files(args, allocator, &param_files)) {
     PyErr_Format(PyExc_RuntimeError, "Failed to get initial parameters: %s",
       rcl_get_error_string().str);
+    rcl_reset_error();
     return false;
   }
   for (int i = 0; i < param_files_count; ++i) {
     if (successful) {
-      rcl_params_t * params = rcl_yaml_node_struct_init(allocator);
-      if (!rcl_parse_yaml_file(param_files[i], params)) {
-        // failure to parse will automatically fini the params struct
-        PyErr_Format(PyExc_RuntimeError, "Failed to parse yaml params file '%s': %s",
-          param_files[i], rcl_get_error_string().str);
-        rcl_reset_error();
+      PyObject * py_param_file = PyUnicode_FromString(param_files[i]);
+      if (NULL == py_param_file || -1 == PyList_Append(param_files_list, py_param_file)) {
         successful = false;
-      } else {
-        if (!_populate_node_parameters_from_rcl_params(
-            params, allocator, parameter_cls, parameter_type_cls, params_by_node_name))
-        {
-          successful = false;
-        }
-        rcl_yaml_node_struct_fini(params);
       }
+      Py_XDECREF(py_param_file);
     }
     allocator.deallocate(param_files[i], allocator.state);
   }
@@ -4412,24 +4668,24 @@ _parse_param_files(
   return successful;
 }
 
-/// Get a list of parameters for the current node from rcl_yaml_param_parser
+/// Get the paths of the parameter files given to a node on the command line
 /**
+ * Global parameter files come first, unless the node ignores global arguments.
+ *
  * On failure, an exception is raised and NULL is returned if:
  *
  * Raises ValueError if the argument is not a node handle.
- * Raises RuntimeError if the parameters file fails to parse
+ * Raises RuntimeError if the parameter files cannot be extracted from the arguments.
  *
- * \param[in] parameter_cls The rclpy.parameter.Parameter class object.
  * \param[in] node_capsule Capsule pointing to the node handle
  * \return NULL on failure
- *         A dict mapping parameter names to rclpy.parameter.Parameter on success (may be empty).
+ *         A list of paths on success (may be empty).
  */
 static PyObject *
-rclpy_get_node_parameters(PyObject * Py_UNUSED(self), PyObject * args)
+rclpy_get_node_parameter_files(PyObject * Py_UNUSED(self), PyObject * args)
 {
-  PyObject * parameter_cls;
   PyObject * node_capsule;
-  if (!PyArg_ParseTuple(args, "OO", &parameter_cls, &node_capsule)) {
+  if (!PyArg_ParseTuple(args, "O", &node_capsule)) {
     return NULL;
   }
 
@@ -4438,20 +4694,8 @@ rclpy_get_node_parameters(PyObject * Py_UNUSED(self), PyObject * args)
     return NULL;
   }
 
-  PyObject * params_by_node_name = PyDict_New();
-  if (NULL == params_by_node_name) {
-    return NULL;
-  }
-
-  if (!PyObject_HasAttrString(parameter_cls, "Type")) {
-    PyErr_Format(PyExc_RuntimeError, "Parameter class is missing 'Type' attribute");
-    Py_DECREF(params_by_node_name);
-    return NULL;
-  }
-  PyObject * parameter_type_cls = PyObject_GetAttrString(parameter_cls, "Type");
-  if (NULL == parameter_type_cls) {
-    // PyObject_GetAttrString raises AttributeError on failure.
-    Py_DECREF(params_by_node_name);
+  PyObject * param_files_list = PyList_New(0);
+  if (NULL == param_files_list) {
     return NULL;
   }
 
@@ -4459,58 +4703,77 @@ rclpy_get_node_parameters(PyObject * Py_UNUSED(self), PyObject * args)
   const rcl_allocator_t allocator = node_options->allocator;
 
   if (node_options->use_global_arguments) {
-    if (!_parse_param_files(
-        &(node->context->global_arguments), allocator, parameter_cls,
-        parameter_type_cls, params_by_node_name))
-    {
-      Py_DECREF(parameter_type_cls);
-      Py_DECREF(params_by_node_name);
+    if (!_append_param_files(&(node->context->global_arguments), allocator, param_files_list)) {
+      Py_DECREF(param_files_list);
       return NULL;
     }
   }
 
-  if (!_parse_param_files(&(node_options->arguments), allocator, parameter_cls,
-    parameter_type_cls, params_by_node_name))
-  {
-    Py_DECREF(parameter_type_cls);
-    Py_DECREF(params_by_node_name);
+  if (!_append_param_files(&(node_options->arguments), allocator, param_files_list)) {
+    Py_DECREF(param_files_list);
     return NULL;
   }
-  Py_DECREF(parameter_type_cls);
+  return param_files_list;
+}
 
-  const char * node_namespace = rcl_node_get_namespace(node);
-  char * node_name_with_namespace;
-  if ('/' == node_namespace[strlen(node_namespace) - 1]) {
-    node_name_with_namespace = rcutils_format_string(allocator, "%s%s",
-        node_namespace, rcl_node_get_name(node));
-  } else {
-    node_name_with_namespace = rcutils_format_string(allocator, "%s/%s",
-        node_namespace, rcl_node_get_name(node));
+/// Parse a parameter file with rcl_yaml_param_parser
+/**
+ * On failure, an exception is raised and NULL is returned if:
+ *
+ * Raises RuntimeError if the parameters file fails to parse
+ *
+ * \param[in] parameter_cls The rclpy.parameter.Parameter class object.
+ * \param[in] path The path of the parameter file.
+ * \return NULL on failure
+ *         A dict mapping fully qualified node names to dicts mapping parameter names to
+ *         rclpy.parameter.Parameter on success (may be empty).
+ */
+static PyObject *
+rclpy_parse_parameter_file(PyObject * Py_UNUSED(self), PyObject * args)
+{
+  PyObject * parameter_cls;
+  const char * path;
+  if (!PyArg_ParseTuple(args, "Os", &parameter_cls, &path)) {
+    return NULL;
   }
 
-  PyObject * py_node_name_with_namespace = PyUnicode_FromString(node_name_with_namespace);
-  allocator.deallocate(node_name_with_namespace, allocator.state);
-  if (NULL == py_node_name_with_namespace) {
-    Py_DECREF(params_by_node_name);
+  PyObject * parameter_type_cls = PyObject_GetAttrString(parameter_cls, "Type");
+  if (NULL == parameter_type_cls) {
+    // PyObject_GetAttrString raises AttributeError on failure.
     return NULL;
   }
 
-  if (!PyDict_Contains(params_by_node_name, py_node_name_with_namespace)) {
-    // No parameters for current node.
-    Py_DECREF(params_by_node_name);
-    Py_DECREF(py_node_name_with_namespace);
-    return PyDict_New();
+  rcl_allocator_t allocator = rcl_get_default_allocator();
+  rcl_params_t * params = rcl_yaml_node_struct_init(allocator);
+  if (NULL == params) {
+    Py_DECREF(parameter_type_cls);
+    PyErr_Format(PyExc_MemoryError, "Failed to allocate parameters struct");
+    return NULL;
   }
-  PyObject * node_params = PyDict_GetItem(params_by_node_name, py_node_name_with_namespace);
-  Py_DECREF(py_node_name_with_namespace);
-  if (NULL == node_params) {
-    Py_DECREF(params_by_node_name);
+
+  bool parsed;
+  Py_BEGIN_ALLOW_THREADS;
+  parsed = rcl_parse_yaml_file(path, params);
+  Py_END_ALLOW_THREADS;
+  if (!parsed) {
+    // failure to parse will automatically fini the params struct
+    PyErr_Format(PyExc_RuntimeError, "Failed to parse yaml params file '%s': %s",
+      path, rcl_get_error_string().str);
+    rcl_reset_error();
+    Py_DECREF(parameter_type_cls);
     return NULL;
   }
-  // PyDict_GetItem is a borrowed reference. INCREF so we can return a new one.
-  Py_INCREF(node_params);
-  Py_DECREF(params_by_node_name);
-  return node_params;
+
+  PyObject * params_by_node_name = PyDict_New();
+  if (NULL != params_by_node_name &&
+    !_populate_node_parameters_from_rcl_params(
+      params, allocator, parameter_cls, parameter_type_cls, params_by_node_name))
+  {
+    Py_CLEAR(params_by_node_name);
+  }
+  rcl_yaml_node_struct_fini(params);
+  Py_DECREF(parameter_type_cls);
+  return params_by_node_name;
 }
 
 
@@ -4723,6 +4986,16 @@ static PyMethodDef rclpy_methods[] = {
     "rclpy_take_response."
   },
 
+  {
+    "rclpy_serialize", rclpy_serialize, METH_VARARGS,
+    "Serialize a ROS message."
+  },
+
+  {
+    "rclpy_deserialize", rclpy_deserialize, METH_VARARGS,
+    "Deserialize a ROS message."
+  },
+
   {
     "rclpy_ok", rclpy_ok, METH_VARARGS,
     "rclpy_ok."
@@ -4738,8 +5011,12 @@ static PyMethodDef rclpy_methods[] = {
     "Get node names and namespaces list from graph API."
   },
   {
-    "rclpy_get_node_parameters", rclpy_get_node_parameters, METH_VARARGS,
-    "Get the initial parameters for a node from the command line."
+    "rclpy_get_node_parameter_files", rclpy_get_node_parameter_files, METH_VARARGS,
+    "Get the paths of the parameter files for a node from the command line."
+  },
+  {
+    "rclpy_parse_parameter_file", rclpy_parse_parameter_file, METH_VARARGS,
+    "Parse a parameter file into parameters by node name."
   },
   {
     "rclpy_get_subscriber_names_and_types_by_node", rclpy_get_subscriber_names_and_types_by_node,
@@ -4813,6 +5090,11 @@ static PyMethodDef rclpy_methods[] = {
     "Get the current value of a clock."
   },
 
+  {
+    "rclpy_clock_get_now_nanoseconds", rclpy_clock_get_now_nanoseconds, METH_VARARGS,
+    "Get the current value of a clock in nanoseconds."
+  },
+
   {
     "rclpy_clock_get_ros_time_override_is_enabled", rclpy_clock_get_ros_time_override_is_enabled,
     METH_VARARGS, "Get if a clock using ROS time has the ROS time override enabled."
@@ -14,6 +14,8 @@
 
 #include <Python.h>
 
+#include <stdarg.h>
+
 #include <rcutils/error_handling.h>
 #include <rcutils/logging.h>
 #include <rcutils/time.h>
@@ -137,8 +139,26 @@ rclpy_logging_logger_is_enabled_for(PyObject * Py_UNUSED(self), PyObject * args)
   }
 }
 
+/// Pass a message to the rcutils output handler.
+static void
+_rclpy_logging_output(
+  const rcutils_log_location_t * location, int severity, const char * name,
+  rcutils_time_point_value_t timestamp, const char * format, ...)
+{
+  rcutils_logging_output_handler_t output_handler = rcutils_logging_get_output_handler();
+  if (NULL == output_handler) {
+    return;
+  }
+  va_list args;
+  va_start(args, format);
+  output_handler(location, severity, name, timestamp, format, &args);
+  va_end(args);
+}
+
 /// Log a message through rcutils with the specified severity.
 /**
+ * The GIL is held while the message is output, since it serializes all access to the
+ * global state of rcutils logging, e.g. the severity levels and the output handler.
  *
  * \param[in] severity Enum of type RCUTILS_LOG_SEVERITY.
  * \param[in] name Name of logger.
@@ -146,6 +166,9 @@ rclpy_logging_logger_is_enabled_for(PyObject * Py_UNUSED(self), PyObject * args)
  * \param[in] function_name String with the function name of the caller.
  * \param[in] file_name String with the file name of the caller.
  * \param[in] line_number Line number of the calling function.
+ * \param[in] timestamp Optional system time in nanoseconds at which the message was logged.
+ *   If given the message is passed to the output handler directly with this timestamp,
+ *   e.g. because it was logged earlier and queued, otherwise it is logged with rcutils_log().
  * \return None
  */
 static PyObject *
@@ -157,15 +180,24 @@ rclpy_logging_rcutils_log(PyObject * Py_UNUSED(self), PyObject * args)
   const char * function_name;
   const char * file_name;
   unsigned PY_LONG_LONG line_number;
-  if (!PyArg_ParseTuple(args, "issssK",
-    &severity, &name, &message, &function_name, &file_name, &line_number))
+  PyObject * pytimestamp = Py_None;
+  if (!PyArg_ParseTuple(args, "issssK|O",
+    &severity, &name, &message, &function_name, &file_name, &line_number, &pytimestamp))
   {
     return NULL;
   }
 
   RCUTILS_LOGGING_AUTOINIT
   rcutils_log_location_t logging_location = {function_name, file_name, line_number};
-  rcutils_log(&logging_location, severity, name, "%s", message);
+  if (Py_None == pytimestamp) {
+    rcutils_log(&logging_location, severity, name, "%s", message);
+  } else {
+    rcutils_time_point_value_t timestamp = PyLong_AsLongLong(pytimestamp);
+    if (PyErr_Occurred()) {
+      return NULL;
+    }
+    _rclpy_logging_output(&logging_location, severity, name, timestamp, "%s", message);
+  }
   Py_RETURN_NONE;
 }
 
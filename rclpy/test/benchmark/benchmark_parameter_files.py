@@ -0,0 +1,86 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark creating many nodes from one large parameter file.
+
+This is not run as part of the tests. Run it with::
+
+    python3 benchmark_parameter_files.py [--nodes N] [--parameters N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import rclpy
+from rclpy.parameter_file_cache import get_parameter_file_cache
+
+
+def write_parameter_file(path, num_nodes, num_parameters):
+    with open(path, 'w') as f:
+        for i in range(num_nodes):
+            f.write('node_{0}:\n  ros__parameters:\n'.format(i))
+            for group in range(10):
+                f.write('    group_{0}:\n'.format(group))
+                for j in range(group, num_parameters, 10):
+                    f.write('      param_{0}: {0}\n'.format(j))
+
+
+def create_nodes(context, path, num_nodes, *, cached):
+    cache = get_parameter_file_cache(context)
+    cache.clear()
+    nodes = []
+    start = time.monotonic()
+    for i in range(num_nodes):
+        if not cached:
+            cache.clear()
+        nodes.append(rclpy.create_node(
+            'node_{0}'.format(i), cli_args=['__params:=' + path], context=context,
+            start_parameter_services=False))
+    elapsed = time.monotonic() - start
+    for node in nodes:
+        node.destroy_node()
+    return elapsed
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        '--nodes', type=int, default=60, help='Number of nodes in the file and to create')
+    parser.add_argument(
+        '--parameters', type=int, default=100, help='Number of parameters per node')
+    parser.add_argument(
+        '--repeat', type=int, default=3, help='Number of repetitions, the best one is reported')
+    args = parser.parse_args(args)
+
+    context = rclpy.context.Context()
+    rclpy.init(context=context)
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'params.yaml')
+            write_parameter_file(path, args.nodes, args.parameters)
+            for cached in (False, True):
+                best = min(
+                    create_nodes(context, path, args.nodes, cached=cached)
+                    for _ in range(args.repeat))
+                print('{0:<24} {1:8.1f} ms'.format(
+                    'parse once' if cached else 'parse for every node', best * 1e3))
+    finally:
+        rclpy.shutdown(context=context)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Microbenchmarks for rclpy.time.Time and rclpy.duration.Duration.
+
+These are not run as part of the tests. Run them with::
+
+    python3 benchmark_time.py [--number N]
+"""
+
+import argparse
+import timeit
+
+from builtin_interfaces.msg import Time as TimeMsg
+from rclpy.clock import ClockType
+from rclpy.duration import Duration
+from rclpy.time import Time
+
+
+SETUP_GLOBALS = {
+    'ClockType': ClockType,
+    'Duration': Duration,
+    'Time': Time,
+    'TimeMsg': TimeMsg,
+    'time1': Time(seconds=1, nanoseconds=5, clock_type=ClockType.ROS_TIME),
+    'time2': Time(seconds=2, nanoseconds=7, clock_type=ClockType.ROS_TIME),
+    'duration': Duration(seconds=0, nanoseconds=1000),
+    'time_msg': TimeMsg(sec=1, nanosec=5),
+}
+
+BENCHMARKS = (
+    ('Time()', 'Time(seconds=1, nanoseconds=5, clock_type=ClockType.ROS_TIME)'),
+    ('Duration()', 'Duration(seconds=1, nanoseconds=5)'),
+    ('Time.nanoseconds', 'time1.nanoseconds'),
+    ('Time + Duration', 'time1 + duration'),
+    ('Time - Time', 'time2 - time1'),
+    ('Time < Time', 'time1 < time2'),
+    ('Time == Time', 'time1 == time2'),
+    ('Time.to_msg()', 'time1.to_msg()'),
+    ('Time.from_msg()', 'Time.from_msg(time_msg)'),
+    ('Duration.to_msg()', 'duration.to_msg()'),
+)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        '--number', type=int, default=100000, help='Number of executions per repetition')
+    parser.add_argument(
+        '--repeat', type=int, default=5, help='Number of repetitions, the best one is reported')
+    args = parser.parse_args(args)
+
+    for name, statement in BENCHMARKS:
+        best = min(timeit.repeat(
+            statement, globals=SETUP_GLOBALS, number=args.number, repeat=args.repeat))
+        print('{0:<20} {1:8.1f} ns'.format(name, best / args.number * 1e9))
+
+
+if __name__ == '__main__':
+    main()
@@ -30,6 +30,50 @@ from unique_identifier_msgs.msg import UUID
 TIME_FUDGE = 0.3
 
 
+class CountingDict(dict):
+    """A dict that counts the entries looked up or visited."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.num_visits = 0
+
+    def pop(self, *args):
+        self.num_visits += 1
+        return super().pop(*args)
+
+    def get(self, *args):
+        self.num_visits += 1
+        return super().get(*args)
+
+    def __getitem__(self, key):
+        self.num_visits += 1
+        return super().__getitem__(key)
+
+    def __iter__(self):
+        self.num_visits += len(self)
+        return super().__iter__()
+
+    def items(self):
+        self.num_visits += len(self)
+        return super().items()
+
+    def values(self):
+        self.num_visits += len(self)
+        return super().values()
+
+
+class CountingSet(set):
+    """A set that counts the entries visited."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.num_visits = 0
+
+    def __iter__(self):
+        self.num_visits += len(self)
+        return super().__iter__()
+
+
 class MockActionServer():
 
     def __init__(self, node):
@@ -279,6 +323,60 @@ class TestActionClient(unittest.TestCase):
         finally:
             ac.destroy()
 
+    def test_send_goals_async(self):
+        ac = ActionClient(self.node, Fibonacci, 'fibonacci')
+        try:
+            self.assertTrue(ac.wait_for_server(timeout_sec=2.0))
+            with self.assertRaises(TypeError):
+                ac.send_goals_async([Fibonacci.Goal(), Fibonacci.Result()])
+            futures = ac.send_goals_async(Fibonacci.Goal() for _ in range(3))
+            self.assertEqual(3, len(futures))
+            for future in futures:
+                rclpy.spin_until_future_complete(self.node, future, self.executor)
+                self.assertTrue(future.done())
+                self.assertTrue(future.result().accepted)
+            goal_ids = {bytes(future.result().goal_id.uuid) for future in futures}
+            self.assertEqual(3, len(goal_ids))
+        finally:
+            ac.destroy()
+
+    def test_pending_goal_bookkeeping_scales(self):
+        ac = ActionClient(self.node, Fibonacci, 'not_fibonacci')
+        try:
+            num_goals = 1000
+            futures = ac.send_goals_async(Fibonacci.Goal() for _ in range(num_goals))
+            self.assertEqual(num_goals, len(ac._pending_goal_requests))
+            ac._pending_goal_requests = CountingDict(ac._pending_goal_requests)
+            ac._pending_request_sequence_numbers = CountingDict(
+                ac._pending_request_sequence_numbers)
+            for future in futures:
+                ac._remove_pending_goal_request(future)
+            self.assertEqual(0, len(ac._pending_goal_requests))
+            self.assertEqual(0, len(ac._sequence_number_to_goal_id))
+            self.assertEqual(0, len(ac._futures))
+            # Each removal looks up one entry instead of scanning all pending requests
+            self.assertEqual(num_goals, ac._pending_goal_requests.num_visits)
+            self.assertEqual(num_goals, ac._pending_request_sequence_numbers.num_visits)
+        finally:
+            ac.destroy()
+
+    def test_execute_does_not_visit_pending_futures(self):
+        ac = ActionClient(self.node, Fibonacci, 'fibonacci')
+        try:
+            self.assertTrue(ac.wait_for_server(timeout_sec=2.0))
+            ac.send_goals_async(Fibonacci.Goal() for _ in range(100))
+            future = ac.send_goal_async(Fibonacci.Goal())
+            rclpy.spin_until_future_complete(self.node, future, self.executor)
+
+            # Once bound to the executor, futures aren't visited again on every wake up
+            ac._futures = CountingSet(ac._futures)
+            future = ac.send_goal_async(Fibonacci.Goal())
+            self.assertIs(self.executor, future._executor())
+            rclpy.spin_until_future_complete(self.node, future, self.executor)
+            self.assertEqual(0, ac._futures.num_visits)
+        finally:
+            ac.destroy()
+
     def test_send_goal_async_no_server(self):
         ac = ActionClient(self.node, Fibonacci, 'not_fibonacci')
         try:
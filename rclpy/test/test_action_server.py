@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
 import time
 import unittest
 import uuid
@@ -20,9 +21,12 @@ from action_msgs.msg import GoalStatus
 from action_msgs.srv import CancelGoal
 
 import rclpy
-from rclpy.action import ActionServer, CancelResponse, GoalResponse
+from rclpy.action import ActionServer, AdmissionPolicy, CancelResponse, GoalResponse
+from rclpy.action import ResultStore
+from rclpy.action.server import GoalEvent
 from rclpy.callback_groups import ReentrantCallbackGroup
 from rclpy.executors import MultiThreadedExecutor, SingleThreadedExecutor
+from rclpy.task import Future
 
 from test_msgs.action import Fibonacci
 
@@ -47,12 +51,16 @@ class MockActionClient():
     def reset(self):
         self.feedback_msg = None
         self.status_msg = None
+        self.num_status_msgs = 0
+        self.num_feedback_msgs = 0
 
     def feedback_callback(self, feedback_msg):
         self.feedback_msg = feedback_msg
+        self.num_feedback_msgs += 1
 
     def status_callback(self, status_msg):
         self.status_msg = status_msg
+        self.num_status_msgs += 1
 
     def send_goal(self, goal_msg):
         return self.goal_srv.call_async(goal_msg)
@@ -66,6 +74,62 @@ class MockActionClient():
         return self.result_srv.call_async(result_request)
 
 
+class TestResultStore(unittest.TestCase):
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            ResultStore(max_results=0)
+        with self.assertRaises(ValueError):
+            ResultStore(max_bytes=0)
+
+    def test_unbounded(self):
+        store = ResultStore()
+        for i in range(10):
+            self.assertEqual([], store.add(bytes([i]), Fibonacci.Impl.GetResultService.Response()))
+        self.assertEqual(10, len(store))
+        self.assertEqual(0, store.evictions)
+
+    def test_max_results(self):
+        store = ResultStore(max_results=2)
+        store.add(b'a', Fibonacci.Impl.GetResultService.Response())
+        store.add(b'b', Fibonacci.Impl.GetResultService.Response())
+        # Touch 'a' so that 'b' is the least recently used result
+        self.assertIsNotNone(store.get(b'a'))
+        self.assertEqual([b'b'], store.add(b'c', Fibonacci.Impl.GetResultService.Response()))
+        self.assertEqual(2, len(store))
+        self.assertNotIn(b'b', store)
+        self.assertIsNone(store.get(b'b'))
+        self.assertEqual(1, store.evictions)
+
+    def test_max_bytes(self):
+        small = Fibonacci.Impl.GetResultService.Response()
+        large = Fibonacci.Impl.GetResultService.Response()
+        large.result.sequence = list(range(1000))
+        store = ResultStore(max_bytes=1000)
+        store.add(b'a', small)
+        store.add(b'b', small)
+        self.assertEqual(2, len(store))
+        # The large result does not fit together with any other
+        self.assertEqual([b'a', b'b'], store.add(b'c', large))
+        self.assertIn(b'c', store)
+        self.assertGreater(store.num_bytes, 1000)
+        store.add(b'd', small)
+        self.assertNotIn(b'c', store)
+        self.assertLessEqual(store.num_bytes, 1000)
+
+    def test_expire(self):
+        store = ResultStore()
+        store.mark_completed(b'a')
+        store.mark_completed(b'b')
+        store.add(b'a', Fibonacci.Impl.GetResultService.Response())
+        self.assertEqual(2, store.num_completed)
+        store.expire(b'a')
+        store.expire(b'b')
+        self.assertEqual(0, store.num_completed)
+        self.assertEqual(0, len(store))
+        self.assertEqual(1, store.expirations)
+
+
 class TestActionServer(unittest.TestCase):
 
     def setUp(self):
@@ -115,9 +179,21 @@ class TestActionServer(unittest.TestCase):
             feedback_pub_qos_profile=rclpy.qos.qos_profile_default,
             status_pub_qos_profile=rclpy.qos.qos_profile_default,
             result_timeout=300,
+            take_batch_size=8,
+            status_publish_period=0.1,
         )
         action_server.destroy()
 
+    def test_constructor_invalid_take_batch_size(self):
+        with self.assertRaises(ValueError):
+            ActionServer(
+                self.node,
+                Fibonacci,
+                'fibonacci',
+                execute_callback=self.execute_goal_callback,
+                take_batch_size=0,
+            )
+
     def test_get_num_entities(self):
         action_server = ActionServer(
             self.node,
@@ -250,6 +326,74 @@ class TestActionServer(unittest.TestCase):
         self.assertTrue(future2.result().accepted)
         action_server.destroy()
 
+    def test_goal_burst_taken_in_batches(self):
+        action_server = ActionServer(
+            self.node,
+            Fibonacci,
+            'fibonacci',
+            execute_callback=self.execute_goal_callback,
+            handle_accepted_callback=lambda gh: None,
+            take_batch_size=4,
+        )
+
+        # Record how many goal requests are taken per wakeup
+        batch_sizes = []
+        take_data = action_server.take_data
+
+        def recording_take_data():
+            data = take_data()
+            batch_sizes.append(len(data.get('goal', ())))
+            return data
+        action_server.take_data = recording_take_data
+
+        self.assertTrue(self.mock_action_client.goal_srv.wait_for_service(timeout_sec=2.0))
+        futures = []
+        for _ in range(10):
+            goal_msg = Fibonacci.Impl.SendGoalService.Request()
+            goal_msg.goal_id = UUID(uuid=list(uuid.uuid4().bytes))
+            futures.append(self.mock_action_client.send_goal(goal_msg))
+        # Give the requests time to arrive so that they are queued together
+        time.sleep(0.5)
+
+        for future in futures:
+            rclpy.spin_until_future_complete(self.node, future, self.executor, timeout_sec=5.0)
+            self.assertTrue(future.result().accepted)
+        self.assertEqual(10, sum(batch_sizes))
+        self.assertGreater(max(batch_sizes), 1)
+        self.assertLessEqual(max(batch_sizes), 4)
+        action_server.destroy()
+
+    def test_coalesced_status(self):
+        action_server = ActionServer(
+            self.node,
+            Fibonacci,
+            'fibonacci',
+            execute_callback=self.execute_goal_callback,
+            status_publish_period=0.5,
+        )
+
+        goal_ids = []
+        futures = []
+        for _ in range(3):
+            goal_msg = Fibonacci.Impl.SendGoalService.Request()
+            goal_msg.goal_id = UUID(uuid=list(uuid.uuid4().bytes))
+            goal_ids.append(goal_msg.goal_id)
+            futures.append(self.mock_action_client.send_goal(goal_msg))
+        for future in futures:
+            rclpy.spin_until_future_complete(self.node, future, self.executor)
+            self.assertTrue(future.result().accepted)
+        self.timed_spin(1.0)
+
+        # Each goal went through two transitions, which are published together
+        self.assertIsNotNone(self.mock_action_client.status_msg)
+        self.assertLess(self.mock_action_client.num_status_msgs, 6)
+        status_list = self.mock_action_client.status_msg.status_list
+        self.assertEqual(3, len(status_list))
+        for status in status_list:
+            self.assertIn(status.goal_info.goal_id, goal_ids)
+            self.assertEqual(GoalStatus.STATUS_SUCCEEDED, status.status)
+        action_server.destroy()
+
     def test_duplicate_goal(self):
         executor = MultiThreadedExecutor(context=self.context)
         action_server = ActionServer(
@@ -455,6 +599,282 @@ class TestActionServer(unittest.TestCase):
         self.assertEqual(result_response.result.sequence.tolist(), [1, 1, 2, 3, 5])
         action_server.destroy()
 
+    def test_result_store_eviction(self):
+        action_server = ActionServer(
+            self.node,
+            Fibonacci,
+            'fibonacci',
+            execute_callback=self.execute_goal_callback,
+            result_store=ResultStore(max_results=2),
+        )
+
+        goal_uuids = []
+        for _ in range(3):
+            goal_uuid = UUID(uuid=list(uuid.uuid4().bytes))
+            goal_uuids.append(goal_uuid)
+            goal_msg = Fibonacci.Impl.SendGoalService.Request()
+            goal_msg.goal_id = goal_uuid
+            goal_future = self.mock_action_client.send_goal(goal_msg)
+            rclpy.spin_until_future_complete(self.node, goal_future, self.executor)
+            self.assertTrue(goal_future.result().accepted)
+        self.timed_spin(0.5)
+
+        self.assertEqual(2, len(action_server.result_store))
+        self.assertEqual(1, action_server.result_store.evictions)
+        self.assertEqual(2, len(action_server._goal_handles))
+        # The result future of the evicted goal is released too
+        self.assertEqual(2, len(action_server._futures))
+
+        # The oldest result was evicted
+        get_result_future = self.mock_action_client.get_result(goal_uuids[0])
+        rclpy.spin_until_future_complete(self.node, get_result_future, self.executor)
+        self.assertEqual(GoalStatus.STATUS_UNKNOWN, get_result_future.result().status)
+
+        get_result_future = self.mock_action_client.get_result(goal_uuids[2])
+        rclpy.spin_until_future_complete(self.node, get_result_future, self.executor)
+        self.assertEqual(GoalStatus.STATUS_SUCCEEDED, get_result_future.result().status)
+        action_server.destroy()
+
+    def test_result_store_eviction_keeps_goals_in_rcl(self):
+        action_server = ActionServer(
+            self.node,
+            Fibonacci,
+            'fibonacci',
+            execute_callback=self.execute_goal_callback,
+            result_timeout=1,
+            result_store=ResultStore(max_results=1),
+        )
+
+        goal_ids = []
+        for _ in range(2):
+            goal_id, accepted = self._send_goal()
+            goal_ids.append(goal_id)
+            self.assertTrue(accepted)
+        self.timed_spin(0.5)
+        self.assertEqual(1, action_server.result_store.evictions)
+
+        # The evicted goal is still known to rcl, so status is still published for it
+        self.mock_action_client.reset()
+        goal_id, accepted = self._send_goal()
+        goal_ids.append(goal_id)
+        self.assertTrue(accepted)
+        self.timed_spin(0.5)
+        self.assertIsNotNone(self.mock_action_client.status_msg)
+        status_goal_ids = [
+            status.goal_info.goal_id for status in self.mock_action_client.status_msg.status_list]
+        for goal_id in goal_ids:
+            self.assertIn(goal_id, status_goal_ids)
+
+        # All goals, including the evicted one, expire
+        self.timed_spin(2.1)
+        self.assertEqual(0, len(action_server._goal_handles))
+        self.assertEqual(0, len(action_server.result_store))
+        self.assertEqual(0, action_server.result_store.num_completed)
+        action_server.destroy()
+
+    def _send_goal(self):
+        goal_msg = Fibonacci.Impl.SendGoalService.Request()
+        goal_msg.goal_id = UUID(uuid=list(uuid.uuid4().bytes))
+        goal_future = self.mock_action_client.send_goal(goal_msg)
+        rclpy.spin_until_future_complete(self.node, goal_future, self.executor)
+        return goal_msg.goal_id, goal_future.result().accepted
+
+    def test_worker_pool_reject_when_busy(self):
+        release = threading.Event()
+        executing_threads = []
+
+        def execute_callback(goal_handle):
+            executing_threads.append(threading.current_thread())
+            release.wait(5.0)
+            goal_handle.succeed()
+            return Fibonacci.Result()
+
+        action_server = ActionServer(
+            self.node,
+            Fibonacci,
+            'fibonacci',
+            execute_callback=execute_callback,
+            max_concurrent_goals=1,
+            goal_queue_size=1,
+        )
+
+        # One goal executes, one is queued and the next one is rejected
+        _, accepted = self._send_goal()
+        self.assertTrue(accepted)
+        _, accepted = self._send_goal()
+        self.assertTrue(accepted)
+        _, accepted = self._send_goal()
+        self.assertFalse(accepted)
+
+        release.set()
+        self.timed_spin(0.5)
+        self.assertEqual(2, len(executing_threads))
+        self.assertNotIn(threading.main_thread(), executing_threads)
+
+        # Once the workers are free new goals are accepted again
+        _, accepted = self._send_goal()
+        self.assertTrue(accepted)
+        action_server.destroy()
+
+    def test_worker_pool_destroy_does_not_wait(self):
+        release = threading.Event()
+        finished = threading.Event()
+
+        def execute_callback(goal_handle):
+            release.wait(5.0)
+            goal_handle.succeed()
+            finished.set()
+            return Fibonacci.Result()
+
+        action_server = ActionServer(
+            self.node,
+            Fibonacci,
+            'fibonacci',
+            execute_callback=execute_callback,
+            max_concurrent_goals=1,
+        )
+
+        _, accepted = self._send_goal()
+        self.assertTrue(accepted)
+        self.timed_spin(0.2)
+
+        start_time = time.monotonic()
+        action_server.destroy()
+        self.assertLess(time.monotonic() - start_time, 1.0)
+
+        # The goal still executing can no longer change its state
+        release.set()
+        self.assertTrue(finished.wait(5.0))
+
+    def test_worker_pool_preempt_oldest(self):
+
+        def execute_callback(goal_handle):
+            start_time = time.monotonic()
+            while not goal_handle.is_cancel_requested and time.monotonic() - start_time < 5.0:
+                time.sleep(0.01)
+            if goal_handle.is_cancel_requested:
+                goal_handle.canceled()
+            else:
+                goal_handle.succeed()
+            return Fibonacci.Result()
+
+        action_server = ActionServer(
+            self.node,
+            Fibonacci,
+            'fibonacci',
+            execute_callback=execute_callback,
+            max_concurrent_goals=1,
+            admission_policy=AdmissionPolicy.PREEMPT_OLDEST,
+        )
+
+        first_goal_id, accepted = self._send_goal()
+        self.assertTrue(accepted)
+        self.timed_spin(0.2)
+        second_goal_id, accepted = self._send_goal()
+        self.assertTrue(accepted)
+
+        get_result_future = self.mock_action_client.get_result(first_goal_id)
+        rclpy.spin_until_future_complete(
+            self.node, get_result_future, self.executor, timeout_sec=5.0)
+        self.assertEqual(GoalStatus.STATUS_CANCELED, get_result_future.result().status)
+
+        # The new goal runs once the preempted goal is done
+        self.timed_spin(0.5)
+        second_goal_handle = action_server._goal_handles[bytes(second_goal_id.uuid)]
+        self.assertEqual(GoalStatus.STATUS_EXECUTING, second_goal_handle.status)
+        action_server.destroy()
+
+    def test_worker_pool_preempt_oldest_rejects_when_all_canceling(self):
+        release = threading.Event()
+
+        def execute_callback(goal_handle):
+            release.wait(5.0)
+            goal_handle.succeed()
+            return Fibonacci.Result()
+
+        action_server = ActionServer(
+            self.node,
+            Fibonacci,
+            'fibonacci',
+            execute_callback=execute_callback,
+            max_concurrent_goals=1,
+            admission_policy=AdmissionPolicy.PREEMPT_OLDEST,
+        )
+
+        _, accepted = self._send_goal()
+        self.assertTrue(accepted)
+        self.timed_spin(0.2)
+        # The first goal is preempted, and the second waits for its worker
+        _, accepted = self._send_goal()
+        self.assertTrue(accepted)
+        # The first goal is already canceling, so there is nothing left to preempt
+        _, accepted = self._send_goal()
+        self.assertFalse(accepted)
+        self.assertEqual(1, len(action_server._queued_goals))
+
+        release.set()
+        self.timed_spin(0.5)
+        action_server.destroy()
+
+    def test_worker_pool_counts_goals_not_executed(self):
+        accepted_goal_handles = []
+
+        action_server = ActionServer(
+            self.node,
+            Fibonacci,
+            'fibonacci',
+            execute_callback=self.execute_goal_callback,
+            handle_accepted_callback=accepted_goal_handles.append,
+            max_concurrent_goals=1,
+            goal_queue_size=1,
+        )
+
+        # Goals that were accepted but not executed take a worker or a place in the queue
+        _, accepted = self._send_goal()
+        self.assertTrue(accepted)
+        _, accepted = self._send_goal()
+        self.assertTrue(accepted)
+        _, accepted = self._send_goal()
+        self.assertFalse(accepted)
+
+        # A goal that finishes without being executed frees its place
+        accepted_goal_handles[0]._update_state(GoalEvent.CANCEL_GOAL)
+        accepted_goal_handles[0].canceled()
+        _, accepted = self._send_goal()
+        self.assertTrue(accepted)
+        action_server.destroy()
+
+    def test_worker_pool_coroutine_execute_callback(self):
+        executing_threads = []
+
+        async def execute_callback(goal_handle):
+            executing_threads.append(threading.current_thread())
+            future = Future()
+            threading.Timer(0.1, future.set_result, (None,)).start()
+            await future
+            goal_handle.succeed()
+            return Fibonacci.Result()
+
+        action_server = ActionServer(
+            self.node,
+            Fibonacci,
+            'fibonacci',
+            execute_callback=execute_callback,
+            max_concurrent_goals=1,
+        )
+
+        goal_id, accepted = self._send_goal()
+        self.assertTrue(accepted)
+        get_result_future = self.mock_action_client.get_result(goal_id)
+        rclpy.spin_until_future_complete(
+            self.node, get_result_future, self.executor, timeout_sec=5.0)
+        self.assertEqual(GoalStatus.STATUS_SUCCEEDED, get_result_future.result().status)
+        # Coroutines run as tasks of the executor instead of in a worker thread
+        self.assertEqual([threading.main_thread()], executing_threads)
+        self.timed_spin(0.2)
+        self.assertEqual(0, len(action_server._executing_goals))
+        action_server.destroy()
+
     def test_execute_abort(self):
 
         def execute_callback(goal_handle):
@@ -618,6 +1038,36 @@ class TestActionServer(unittest.TestCase):
             self.mock_action_client.feedback_msg.feedback.sequence.tolist())
         action_server.destroy()
 
+    def test_feedback_rate_limited(self):
+
+        def execute_with_feedback(goal_handle):
+            feedback = Fibonacci.Feedback()
+            for i in range(100):
+                feedback.sequence = [i]
+                goal_handle.publish_feedback(feedback)
+            goal_handle.succeed()
+            return Fibonacci.Result()
+
+        action_server = ActionServer(
+            self.node,
+            Fibonacci,
+            'fibonacci',
+            execute_callback=execute_with_feedback,
+            feedback_publish_period=10.0,
+        )
+
+        goal_msg = Fibonacci.Impl.SendGoalService.Request()
+        goal_msg.goal_id = UUID(uuid=list(uuid.uuid4().bytes))
+        goal_future = self.mock_action_client.send_goal(goal_msg)
+
+        rclpy.spin_until_future_complete(self.node, goal_future, self.executor)
+        self.timed_spin(0.5)
+
+        # The first feedback is published right away and the newest one when the goal succeeds
+        self.assertEqual(2, self.mock_action_client.num_feedback_msgs)
+        self.assertEqual([99], self.mock_action_client.feedback_msg.feedback.sequence.tolist())
+        action_server.destroy()
+
     def test_different_feedback_type_raises(self):
 
         def execute_with_feedback(goal_handle):
@@ -90,6 +90,51 @@ class TestClient(unittest.TestCase):
             self.node.destroy_client(cli)
             self.node.destroy_service(srv)
 
+    def test_coalesce_requests(self):
+        num_calls = 0
+
+        def callback(request, response):
+            nonlocal num_calls
+            num_calls += 1
+            return response
+
+        cli = self.node.create_client(
+            GetParameters, 'test_coalesce_requests', coalesce_requests=True)
+        srv = self.node.create_service(GetParameters, 'test_coalesce_requests', callback)
+        try:
+            self.assertTrue(cli.wait_for_service(timeout_sec=20))
+            future1 = cli.call_async(GetParameters.Request(names=['foo']))
+            future2 = cli.call_async(GetParameters.Request(names=['foo']))
+            future3 = cli.call_async(GetParameters.Request(names=['bar']))
+            self.assertIsNot(future1, future2)
+            # Cancelling one caller's future doesn't affect the others
+            future1.cancel()
+            executor = rclpy.executors.SingleThreadedExecutor(context=self.context)
+            rclpy.spin_until_future_complete(self.node, future2, executor=executor)
+            rclpy.spin_until_future_complete(self.node, future3, executor=executor)
+            self.assertTrue(future1.cancelled())
+            self.assertIsNone(future1.result())
+            self.assertIsNotNone(future2.result())
+            self.assertIsNotNone(future3.result())
+            self.assertEqual(2, num_calls)
+            # Once the response arrived an identical request is sent again
+            future4 = cli.call_async(GetParameters.Request(names=['foo']))
+            rclpy.spin_until_future_complete(self.node, future4, executor=executor)
+            self.assertEqual(3, num_calls)
+            # Removing one caller's future keeps the request for the others
+            future5 = cli.call_async(GetParameters.Request(names=['foo']))
+            future6 = cli.call_async(GetParameters.Request(names=['foo']))
+            cli.remove_pending_request(future5)
+            rclpy.spin_until_future_complete(self.node, future6, executor=executor)
+            self.assertFalse(future5.done())
+            self.assertIsNotNone(future6.result())
+            self.assertEqual(4, num_calls)
+            self.assertFalse(cli._inflight_requests)
+            self.assertFalse(cli._coalesced_requests)
+        finally:
+            self.node.destroy_client(cli)
+            self.node.destroy_service(srv)
+
     def test_different_type_raises(self):
         cli = self.node.create_client(GetParameters, 'get/parameters')
         srv = self.node.create_service(
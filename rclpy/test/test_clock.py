@@ -12,10 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
 import time
 import unittest
 from unittest.mock import Mock
 
+import builtin_interfaces.msg
+import rclpy
 from rclpy.clock import Clock
 from rclpy.clock import ClockType
 from rclpy.clock import JumpThreshold
@@ -70,6 +73,81 @@ class TestClock(unittest.TestCase):
             assert now2 > now
             now = now2
 
+    def test_clock_now_ns_and_msg(self):
+        clock = Clock(clock_type=ClockType.STEADY_TIME)
+        now = clock.now()
+        now_ns = clock.now_ns()
+        assert isinstance(now_ns, int)
+        assert now_ns >= now.nanoseconds
+        now_msg = clock.now_msg()
+        assert isinstance(now_msg, builtin_interfaces.msg.Time)
+        assert Time.from_msg(now_msg, clock_type=ClockType.STEADY_TIME).nanoseconds >= now_ns
+
+        clock = ROSClock()
+        clock._set_ros_time_is_active(True)
+        clock.set_ros_time_override(
+            Time(seconds=5, nanoseconds=42, clock_type=ClockType.ROS_TIME))
+        assert clock.now_ns() == 5 * 1000 * 1000 * 1000 + 42
+        now_msg = clock.now_msg()
+        assert now_msg.sec == 5
+        assert now_msg.nanosec == 42
+
+    def test_sleep_for(self):
+        context = rclpy.context.Context()
+        rclpy.init(context=context)
+        try:
+            clock = Clock(clock_type=ClockType.STEADY_TIME)
+            start = clock.now()
+            assert clock.sleep_for(Duration(seconds=0.1), context=context)
+            assert clock.now() - start >= Duration(seconds=0.1)
+
+            # Sleeping until a time in the past returns immediately
+            assert clock.sleep_until(start, context=context)
+
+            with self.assertRaises(ValueError):
+                clock.sleep_until(Time(clock_type=ClockType.SYSTEM_TIME), context=context)
+        finally:
+            rclpy.shutdown(context=context)
+
+    def test_sleep_until_ros_time(self):
+        context = rclpy.context.Context()
+        rclpy.init(context=context)
+        try:
+            clock = ROSClock()
+            clock._set_ros_time_is_active(True)
+            clock.set_ros_time_override(Time(seconds=1, clock_type=ClockType.ROS_TIME))
+
+            def advance_time():
+                for seconds in range(2, 12):
+                    time.sleep(0.01)
+                    clock.set_ros_time_override(
+                        Time(seconds=seconds, clock_type=ClockType.ROS_TIME))
+
+            thread = threading.Thread(target=advance_time)
+            thread.start()
+            try:
+                assert clock.sleep_until(
+                    Time(seconds=10, clock_type=ClockType.ROS_TIME), context=context)
+                assert clock.now() >= Time(seconds=10, clock_type=ClockType.ROS_TIME)
+            finally:
+                thread.join()
+        finally:
+            rclpy.shutdown(context=context)
+
+    def test_sleep_interrupted_by_shutdown(self):
+        context = rclpy.context.Context()
+        rclpy.init(context=context)
+        clock = ROSClock()
+        clock._set_ros_time_is_active(True)
+        thread = threading.Timer(0.1, lambda: rclpy.shutdown(context=context))
+        thread.start()
+        try:
+            # Simulated time never advances, so only the shutdown can end the sleep
+            assert not clock.sleep_for(Duration(seconds=1), context=context)
+        finally:
+            thread.join()
+        assert not clock.sleep_for(Duration(seconds=1), context=context)
+
     def test_ros_time_is_active(self):
         clock = ROSClock()
         clock._set_ros_time_is_active(True)
@@ -13,10 +13,20 @@
 # limitations under the License.
 
 import inspect
+import io
+import os
+import tempfile
+import threading
 import time
 import unittest
+from unittest.mock import patch
 
 import rclpy
+from rclpy.flight_recorder import _FILE_HEADER_SIZE
+from rclpy.flight_recorder import _LOG_RECORD
+from rclpy.flight_recorder import main as flight_recorder_main
+from rclpy.flight_recorder import read_flight_recorder
+import rclpy.impl.rcutils_logger
 from rclpy.logging import LoggingSeverity
 
 
@@ -78,6 +88,243 @@ class TestLogging(unittest.TestCase):
         self.assertTrue(rclpy.logging._root_logger.error('message_error'))
         self.assertTrue(rclpy.logging._root_logger.fatal('message_fatal'))
 
+    def test_log_disabled_is_short_circuited(self):
+        rclpy.logging._root_logger.set_level(LoggingSeverity.INFO)
+        with patch('rclpy.impl.rcutils_logger._get_caller_id') as get_caller_id:
+            self.assertFalse(rclpy.logging._root_logger.debug('message_debug', once=True))
+            get_caller_id.assert_not_called()
+
+    def test_caller_id(self):
+        def get_caller_id():
+            return rclpy.impl.rcutils_logger._get_caller_id(inspect.currentframe().f_back)
+
+        caller_ids = []
+        for _ in range(2):
+            caller_ids.append(get_caller_id())
+        caller_ids.append(get_caller_id())
+        # The same call site gets the same id, another call site gets a different one
+        self.assertEqual(caller_ids[0], caller_ids[1])
+        self.assertNotEqual(caller_ids[0], caller_ids[2])
+        self.assertEqual('test_caller_id', caller_ids[0].function_name)
+        self.assertEqual(__file__.rpartition('.')[0], caller_ids[0].file_path.rpartition('.')[0])
+
+        # Resolved caller ids are bounded
+        max_caller_ids = rclpy.impl.rcutils_logger._MAX_CALLER_IDS
+        for i in range(max_caller_ids + 1):
+            eval('get_caller_id()', {'get_caller_id': get_caller_id})
+        self.assertLessEqual(len(rclpy.impl.rcutils_logger._caller_ids), max_caller_ids)
+
+    def test_effective_level_is_cached(self):
+        logger = rclpy.logging.get_logger('test_cached_level')
+        logger.set_level(LoggingSeverity.WARN)
+        impl = rclpy.impl.rcutils_logger._rclpy_logging
+        with patch.object(
+            impl, 'rclpy_logging_get_logger_effective_level',
+            wraps=impl.rclpy_logging_get_logger_effective_level
+        ) as get_effective_level:
+            for _ in range(10):
+                self.assertFalse(logger.info('message_info'))
+            self.assertEqual(1, get_effective_level.call_count)
+
+            # Changing the level of any logger invalidates the cached level
+            rclpy.logging.set_logger_level('test_cached_level', LoggingSeverity.INFO)
+            self.assertTrue(logger.is_enabled_for(LoggingSeverity.INFO))
+            self.assertEqual(2, get_effective_level.call_count)
+            rclpy.logging.clear_config()
+            self.assertEqual(
+                rclpy.logging._root_logger.get_effective_level(), logger.get_effective_level())
+            self.assertEqual(4, get_effective_level.call_count)
+
+    def test_lazy_formatting(self):
+        logger = rclpy.logging.get_logger('test_lazy_formatting')
+        logger.set_level(LoggingSeverity.INFO)
+        impl = rclpy.impl.rcutils_logger._rclpy_logging
+        with patch.object(
+            impl, 'rclpy_logging_rcutils_log', wraps=impl.rclpy_logging_rcutils_log
+        ) as rcutils_log:
+            self.assertTrue(logger.info('message {0} {1}', 1, 'foo'))
+            self.assertEqual('message 1 foo', rcutils_log.call_args[0][2])
+            self.assertTrue(logger.warning(lambda: 'message from callable'))
+            self.assertEqual('message from callable', rcutils_log.call_args[0][2])
+            # Braces are left alone if there is nothing to format
+            self.assertTrue(logger.error('message {0}'))
+            self.assertEqual('message {0}', rcutils_log.call_args[0][2])
+
+        num_renders = 0
+
+        class Argument:
+
+            def __format__(self, format_spec):
+                nonlocal num_renders
+                num_renders += 1
+                return 'argument'
+
+        def render_message():
+            nonlocal num_renders
+            num_renders += 1
+            return 'message'
+
+        # Messages aren't rendered if logging is disabled for their severity
+        self.assertFalse(logger.debug('message {0}', Argument()))
+        self.assertFalse(logger.debug(render_message))
+        self.assertEqual(0, num_renders)
+        # or if a filter skips them
+        for i in range(2):
+            self.assertEqual(i == 1, logger.info('message {0}', Argument(), skip_first=True))
+        self.assertEqual(1, num_renders)
+
+    def test_async_logging_drop(self):
+        logger = rclpy.logging.get_logger('test_async_logging_drop')
+        logger.set_level(LoggingSeverity.INFO)
+        impl = rclpy.impl.rcutils_logger._rclpy_logging
+        output_allowed = threading.Event()
+        with patch.object(
+            impl, 'rclpy_logging_rcutils_log', side_effect=lambda *args: output_allowed.wait()
+        ) as rcutils_log:
+            sink = rclpy.logging.enable_async_logging(capacity=4)
+            try:
+                logged = []
+                for i in range(10):
+                    logged.append(logger.info('message {0}', i))
+                # The background thread may have taken one record out of the buffer already
+                self.assertIn(logged.count(True), (4, 5))
+                self.assertEqual(logged.count(False), sink.num_dropped)
+
+                output_allowed.set()
+                self.assertTrue(sink.flush(timeout_sec=5))
+                self.assertEqual(logged.count(True), rcutils_log.call_count)
+                # Records are output with the time at which they were logged
+                self.assertEqual(7, len(rcutils_log.call_args[0]))
+            finally:
+                rclpy.logging.disable_async_logging()
+            self.assertTrue(logger.info('message'))
+            self.assertEqual(6, len(rcutils_log.call_args[0]))
+
+    def test_async_logging_block(self):
+        logger = rclpy.logging.get_logger('test_async_logging_block')
+        logger.set_level(LoggingSeverity.INFO)
+        impl = rclpy.impl.rcutils_logger._rclpy_logging
+        output_allowed = threading.Event()
+        with patch.object(
+            impl, 'rclpy_logging_rcutils_log', side_effect=lambda *args: output_allowed.wait()
+        ) as rcutils_log:
+            rclpy.logging.enable_async_logging(
+                capacity=1, overflow_policy=rclpy.logging.LogOverflowPolicy.BLOCK)
+            timer = threading.Timer(0.2, output_allowed.set)
+            timer.start()
+            try:
+                start = time.monotonic()
+                for i in range(3):
+                    self.assertTrue(logger.info('message {0}', i))
+                # Logging blocked until the background thread made space
+                self.assertGreater(time.monotonic() - start, 0.1)
+            finally:
+                rclpy.logging.disable_async_logging()
+                timer.join()
+            self.assertEqual(3, rcutils_log.call_count)
+
+    def test_flight_recorder(self):
+        logger = rclpy.logging.get_logger('test_flight_recorder')
+        logger.set_level(LoggingSeverity.INFO)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'ring')
+            rclpy.logging.enable_flight_recorder(path, level=LoggingSeverity.DEBUG)
+            try:
+                # Recorded, but not output since the logger is not enabled for DEBUG
+                self.assertFalse(logger.debug('debug {0}', 1))
+                self.assertTrue(logger.info('info'))
+                # Records survive the process crashing, so they can be read while recording
+                records = read_flight_recorder(path)
+            finally:
+                rclpy.logging.disable_flight_recorder()
+            self.assertEqual(records, read_flight_recorder(path))
+            self.assertEqual(['debug 1', 'info'], [r.message for r in records])
+            self.assertEqual(
+                [LoggingSeverity.DEBUG, LoggingSeverity.INFO], [r.severity for r in records])
+            self.assertEqual({'test_flight_recorder'}, {r.name for r in records})
+            self.assertEqual({'test_flight_recorder'}, {r.function_name for r in records})
+            self.assertEqual(__file__, records[0].file_path)
+            self.assertLessEqual(records[0].timestamp, records[1].timestamp)
+
+            with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+                self.assertEqual(0, flight_recorder_main([path, '--locations']))
+            lines = stdout.getvalue().splitlines()
+            self.assertEqual(2, len(lines))
+            self.assertTrue(lines[0].startswith('[DEBUG] ['))
+            self.assertIn('[test_flight_recorder]: debug 1 (test_flight_recorder() at ', lines[0])
+
+    def test_flight_recorder_wraparound(self):
+        logger = rclpy.logging.get_logger('test_flight_recorder_wraparound')
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'ring')
+            rclpy.logging.enable_flight_recorder(path, size=4096)
+            try:
+                for i in range(1000):
+                    logger.debug('message {0}', i)
+            finally:
+                rclpy.logging.disable_flight_recorder()
+            records = read_flight_recorder(path)
+            # Only the most recent records are kept
+            self.assertLess(len(records), 1000)
+            self.assertEqual(
+                ['message {0}'.format(i) for i in range(1000 - len(records), 1000)],
+                [r.message for r in records])
+            # Names and call sites outlive the records that introduced them
+            self.assertEqual(
+                {'test_flight_recorder_wraparound'}, {r.function_name for r in records})
+
+    def test_flight_recorder_crash_while_writing(self):
+        logger = rclpy.logging.get_logger('test_flight_recorder_crash_while_writing')
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'ring')
+            recorder = rclpy.logging.enable_flight_recorder(path, size=4096)
+            try:
+                for i in range(1000):
+                    logger.debug('message {0}', i)
+
+                # Crash after the header is written, while the next record overwrites the
+                # oldest ones in the ring
+                write_header = recorder._write_header
+
+                def crash():
+                    write_header()
+                    offset = recorder._write_position % recorder.size
+                    end = min(offset + _LOG_RECORD.size + len('message 1000'), recorder.size)
+                    recorder._mmap[_FILE_HEADER_SIZE + offset:_FILE_HEADER_SIZE + end] = \
+                        b'\xff' * (end - offset)
+                    raise RuntimeError('crash')
+
+                with patch.object(recorder, '_write_header', side_effect=crash):
+                    with self.assertRaises(RuntimeError):
+                        logger.debug('message {0}', 1000)
+                records = read_flight_recorder(path)
+            finally:
+                rclpy.logging.disable_flight_recorder()
+            # The records left in the ring are intact
+            self.assertGreater(len(records), 0)
+            self.assertEqual(
+                ['message {0}'.format(i) for i in range(1000 - len(records), 1000)],
+                [r.message for r in records])
+
+    def test_flight_recorder_corrupted(self):
+        logger = rclpy.logging.get_logger('test_flight_recorder_corrupted')
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'ring')
+            rclpy.logging.enable_flight_recorder(path, size=4096)
+            try:
+                for i in range(3):
+                    logger.debug('message {0}', i)
+            finally:
+                rclpy.logging.disable_flight_recorder()
+            records = read_flight_recorder(path)
+            self.assertEqual(3, len(records))
+
+            # Damage the size of the second record
+            with open(path, 'r+b') as f:
+                f.seek(_FILE_HEADER_SIZE + _LOG_RECORD.size + len(records[0].message))
+                f.write(b'\0\0\0\0')
+            self.assertEqual(['message 0'], [r.message for r in read_flight_recorder(path)])
+
     def test_log_once(self):
         message_was_logged = []
         for i in range(5):
@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import tempfile
 import unittest
 from unittest.mock import Mock
+from unittest.mock import patch
 
 from rcl_interfaces.msg import SetParametersResult
 from rcl_interfaces.srv import GetParameters
@@ -23,11 +26,22 @@ from rclpy.exceptions import InvalidServiceNameException
 from rclpy.exceptions import InvalidTopicNameException
 from rclpy.executors import SingleThreadedExecutor
 from rclpy.parameter import Parameter
+from rclpy.parameter_file_cache import get_parameter_file_cache
 from test_msgs.msg import BasicTypes
 
 TEST_NODE = 'my_node'
 TEST_NAMESPACE = '/my_ns'
 
+PARAMETER_FILE = """
+node_a:
+  ros__parameters:
+    foo: {value}
+    bar: [1, 2]
+node_b:
+  ros__parameters:
+    foo: 2
+"""
+
 
 class TestNode(unittest.TestCase):
 
@@ -48,6 +62,8 @@ class TestNode(unittest.TestCase):
             self.node.handle = 'garbage'
         self.assertEqual(self.node.get_name(), TEST_NODE)
         self.assertEqual(self.node.get_namespace(), TEST_NAMESPACE)
+        self.assertEqual(
+            self.node.get_fully_qualified_name(), TEST_NAMESPACE + '/' + TEST_NODE)
         self.assertEqual(self.node.get_clock().clock_type, ClockType.ROS_TIME)
 
     def test_create_publisher(self):
@@ -224,6 +240,86 @@ class TestNode(unittest.TestCase):
         self.assertEqual(self.node.get_parameter('bar').value, 'hello')
         self.assertEqual(self.node.get_parameter('baz').value, 2.41)
 
+    def test_node_set_parameters_publishes_one_event(self):
+        self.node.set_parameters([Parameter('foo', Parameter.Type.INTEGER, 1)])
+        with patch.object(self.node._parameter_event_publisher, 'publish') as publish:
+            results = self.node.set_parameters([
+                Parameter('foo', Parameter.Type.INTEGER, 2),
+                Parameter('new', Parameter.Type.INTEGER, 3),
+                Parameter('foo', Parameter.Type.NOT_SET),
+            ])
+            self.assertTrue(all(result.successful for result in results))
+            publish.assert_called_once()
+            event = publish.call_args[0][0]
+            self.assertEqual(TEST_NAMESPACE + '/' + TEST_NODE, event.node)
+            self.assertEqual(['new'], [p.name for p in event.new_parameters])
+            self.assertEqual(['foo'], [p.name for p in event.changed_parameters])
+            self.assertEqual(['foo'], [p.name for p in event.deleted_parameters])
+
+            # Rejected parameters are left out of the event
+            publish.reset_mock()
+            self.node.set_parameters_callback(
+                lambda parameter_list: SetParametersResult(
+                    successful=all(p.name != 'rejected' for p in parameter_list)))
+            try:
+                results = self.node.set_parameters([
+                    Parameter('rejected', Parameter.Type.INTEGER, 4),
+                    Parameter('accepted', Parameter.Type.INTEGER, 5),
+                ])
+            finally:
+                self.node.set_parameters_callback(None)
+            self.assertEqual([False, True], [result.successful for result in results])
+            publish.assert_called_once()
+            event = publish.call_args[0][0]
+            self.assertEqual(['accepted'], [p.name for p in event.new_parameters])
+
+            publish.reset_mock()
+            self.node.set_parameters([])
+            publish.assert_not_called()
+
+    def test_node_parameter_event_coalescing(self):
+        executor = SingleThreadedExecutor(context=self.context)
+        with self.assertRaises(ValueError):
+            self.node.set_parameter_event_coalescing(0)
+        self.node.set_parameters([Parameter('coalesced', Parameter.Type.INTEGER, 1)])
+        with patch.object(self.node._parameter_event_publisher, 'publish') as publish:
+            self.node.set_parameter_event_coalescing(0.1)
+            try:
+                for i in range(10):
+                    self.node.set_parameters([Parameter('coalesced', Parameter.Type.INTEGER, i)])
+                self.node.set_parameters([Parameter('temporary', Parameter.Type.INTEGER, 1)])
+                self.node.set_parameters_atomically([
+                    Parameter('temporary', Parameter.Type.NOT_SET),
+                    Parameter('added', Parameter.Type.INTEGER, 1),
+                ])
+                publish.assert_not_called()
+                # The parameters are set right away
+                self.assertEqual(9, self.node.get_parameter('coalesced').value)
+
+                for _ in range(10):
+                    if publish.called:
+                        break
+                    rclpy.spin_once(self.node, executor=executor, timeout_sec=0.5)
+                publish.assert_called_once()
+                event = publish.call_args[0][0]
+                self.assertEqual(['added'], [p.name for p in event.new_parameters])
+                self.assertEqual(['coalesced'], [p.name for p in event.changed_parameters])
+                self.assertEqual(9, event.changed_parameters[0].value.integer_value)
+                self.assertEqual([], event.deleted_parameters)
+
+                # Disabling coalescing publishes pending changes
+                publish.reset_mock()
+                self.node.set_parameters([Parameter('added', Parameter.Type.NOT_SET)])
+                publish.assert_not_called()
+            finally:
+                self.node.set_parameter_event_coalescing(None)
+            publish.assert_called_once()
+            self.assertEqual(
+                ['added'], [p.name for p in publish.call_args[0][0].deleted_parameters])
+            publish.reset_mock()
+            self.node.set_parameters([Parameter('coalesced', Parameter.Type.INTEGER, 0)])
+            publish.assert_called_once()
+
     def test_node_cannot_set_invalid_parameters(self):
         with self.assertRaises(TypeError):
             self.node.set_parameters([42])
@@ -243,6 +339,22 @@ class TestNode(unittest.TestCase):
         self.assertIsInstance(self.node.get_parameter('foo'), Parameter)
         self.assertEqual(self.node.get_parameter('foo').value, 42)
 
+    def test_node_get_parameters_by_prefix(self):
+        self.node.set_parameters([
+            Parameter('foo', Parameter.Type.INTEGER, 1),
+            Parameter('foo.ping', Parameter.Type.INTEGER, 2),
+            Parameter('foo.pong.x', Parameter.Type.INTEGER, 3),
+            Parameter('foobar', Parameter.Type.INTEGER, 4),
+        ])
+        parameters = self.node.get_parameters_by_prefix('foo')
+        self.assertEqual({'ping', 'pong.x'}, set(parameters))
+        self.assertEqual(2, parameters['ping'].value)
+        self.assertEqual(3, parameters['pong.x'].value)
+        self.assertEqual({}, self.node.get_parameters_by_prefix('missing'))
+        self.node.set_parameters([Parameter('foo.ping', Parameter.Type.NOT_SET)])
+        self.assertEqual({'pong.x'}, set(self.node.get_parameters_by_prefix('foo')))
+        self.assertIn('foo.pong.x', self.node.get_parameters_by_prefix(''))
+
     def test_node_get_parameter_returns_parameter_not_set(self):
         self.assertIsInstance(self.node.get_parameter('unset'), Parameter)
         self.assertEqual(self.node.get_parameter('unset').type_, Parameter.Type.NOT_SET)
@@ -305,6 +417,47 @@ class TestCreateNode(unittest.TestCase):
         finally:
             rclpy.shutdown(context=context)
 
+    def test_node_parameter_file_cache(self):
+        context = rclpy.context.Context()
+        rclpy.init(context=context)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'params.yaml')
+            with open(path, 'w') as f:
+                f.write(PARAMETER_FILE.format(value=1))
+            cache = get_parameter_file_cache(context)
+            nodes = []
+            try:
+                for name in ('node_a', 'node_b'):
+                    nodes.append(rclpy.create_node(
+                        name, cli_args=['__params:=' + path], context=context))
+                # The file was parsed once for both nodes
+                self.assertEqual(1, cache.num_parses)
+                self.assertEqual(1, nodes[0].get_parameter('foo').value)
+                self.assertEqual(2, nodes[1].get_parameter('foo').value)
+                self.assertEqual([1, 2], nodes[0].get_parameter('bar').value)
+                # Another node given the same file doesn't see the first node's changes
+                nodes[0].get_parameter('bar').value.append(3)
+                nodes.append(rclpy.create_node(
+                    'node_a', cli_args=['__params:=' + path], context=context))
+                self.assertEqual(1, cache.num_parses)
+                self.assertEqual([1, 2], nodes[2].get_parameter('bar').value)
+
+                # A modified file is parsed again
+                with open(path, 'w') as f:
+                    f.write(PARAMETER_FILE.format(value=10))
+                stat = os.stat(path)
+                os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+                nodes.append(rclpy.create_node(
+                    'node_a', cli_args=['__params:=' + path], context=context))
+                self.assertEqual(2, cache.num_parses)
+                self.assertEqual(10, nodes[3].get_parameter('foo').value)
+            finally:
+                for node in nodes:
+                    node.destroy_node()
+                rclpy.shutdown(context=context)
+        # Other contexts have their own cache
+        self.assertIsNot(cache, get_parameter_file_cache(rclpy.context.Context()))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -12,10 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import array
 import unittest
 
+from rcl_interfaces.msg import Parameter as ParameterMsg
 from rclpy.parameter import Parameter
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class TestParameter(unittest.TestCase):
 
@@ -70,6 +77,54 @@ class TestParameter(unittest.TestCase):
         with self.assertRaises(ValueError):
             Parameter('myparam', Parameter.Type.BOOL_ARRAY, 42)
 
+    def test_create_array_parameter_from_array(self):
+        p = Parameter('myparam', Parameter.Type.INTEGER_ARRAY, array.array('i', [1, 2, 3]))
+        self.assertEqual(p.value, array.array('i', [1, 2, 3]))
+        p = Parameter('myparam', Parameter.Type.DOUBLE_ARRAY, array.array('f', [0.5, 1.5]))
+        self.assertEqual(p.value, array.array('f', [0.5, 1.5]))
+        with self.assertRaises(ValueError):
+            Parameter('myparam', Parameter.Type.INTEGER_ARRAY, array.array('d', [1.0]))
+        with self.assertRaises(ValueError):
+            Parameter('myparam', Parameter.Type.INTEGER_ARRAY, array.array('Q', [1]))
+        with self.assertRaises(ValueError):
+            Parameter('myparam', Parameter.Type.DOUBLE_ARRAY, array.array('q', [1]))
+
+    def test_array_parameter_round_trip(self):
+        for type_, value in (
+            (Parameter.Type.INTEGER_ARRAY, array.array('h', [-1, 0, 1])),
+            (Parameter.Type.INTEGER_ARRAY, [1, 2, 3]),
+            (Parameter.Type.DOUBLE_ARRAY, array.array('d', [0.5, 1.5])),
+            (Parameter.Type.DOUBLE_ARRAY, [2.41, 6.28]),
+        ):
+            msg = ParameterMsg(
+                name='myparam', value=Parameter('myparam', type_, value).get_parameter_value())
+            p = Parameter.from_parameter_msg(msg)
+            self.assertEqual(p.type_, type_)
+            self.assertEqual(list(p.value), list(value))
+
+    @unittest.skipIf(numpy is None, 'NumPy is not available')
+    def test_create_array_parameter_from_numpy(self):
+        p = Parameter('myparam', Parameter.Type.INTEGER_ARRAY, numpy.arange(3, dtype=numpy.int32))
+        self.assertEqual(list(p.get_parameter_value().integer_array_value), [0, 1, 2])
+        p = Parameter('myparam', Parameter.Type.INTEGER_ARRAY, numpy.arange(3, dtype=numpy.uint8))
+        self.assertEqual(list(p.get_parameter_value().integer_array_value), [0, 1, 2])
+        p = Parameter('myparam', Parameter.Type.DOUBLE_ARRAY, numpy.linspace(0.0, 1.0, 3))
+        self.assertEqual(list(p.get_parameter_value().double_array_value), [0.0, 0.5, 1.0])
+        p = Parameter('myparam', Parameter.Type.BOOL_ARRAY, numpy.array([True, False]))
+        self.assertEqual(list(p.get_parameter_value().bool_array_value), [True, False])
+        # Strided arrays are copied as well
+        p = Parameter('myparam', Parameter.Type.INTEGER_ARRAY, numpy.arange(6)[::2])
+        self.assertEqual(list(p.get_parameter_value().integer_array_value), [0, 2, 4])
+
+        with self.assertRaises(ValueError):
+            Parameter('myparam', Parameter.Type.INTEGER_ARRAY, numpy.zeros(3))
+        with self.assertRaises(ValueError):
+            Parameter('myparam', Parameter.Type.INTEGER_ARRAY, numpy.zeros(3, dtype=numpy.uint64))
+        with self.assertRaises(ValueError):
+            Parameter('myparam', Parameter.Type.DOUBLE_ARRAY, numpy.zeros(3, dtype=numpy.int64))
+        with self.assertRaises(ValueError):
+            Parameter('myparam', Parameter.Type.DOUBLE_ARRAY, numpy.zeros((2, 2)))
+
     def test_error_on_illegal_value_type(self):
         with self.assertRaises(TypeError):
             Parameter('illegaltype', 'mytype', 'myvalue')
@@ -0,0 +1,177 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+from unittest.mock import patch
+
+import rclpy
+from rclpy.executors import SingleThreadedExecutor
+from rclpy.parameter import Parameter
+from rclpy.parameter_client import ParameterClient
+
+
+class TestParameterClient(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.context = rclpy.context.Context()
+        rclpy.init(context=cls.context)
+
+    @classmethod
+    def tearDownClass(cls):
+        rclpy.shutdown(context=cls.context)
+
+    def setUp(self):
+        self.remote_node = rclpy.create_node(
+            'remote_node', namespace='/test_parameter_client', context=self.context,
+            initial_parameters=[
+                Parameter('foo', Parameter.Type.INTEGER, 42),
+                Parameter('bar.baz', Parameter.Type.STRING, 'hello'),
+            ])
+        self.node = rclpy.create_node('client_node', context=self.context)
+        self.executor = SingleThreadedExecutor(context=self.context)
+        self.executor.add_node(self.remote_node)
+        self.executor.add_node(self.node)
+        self.client = ParameterClient(self.node, '/test_parameter_client/remote_node')
+        self.assertTrue(self.client.wait_for_services(timeout_sec=20))
+
+    def tearDown(self):
+        self.client.destroy()
+        self.executor.shutdown()
+        self.node.destroy_node()
+        self.remote_node.destroy_node()
+
+    def _spin_until(self, condition, timeout_sec=5.0):
+        end = time.monotonic() + timeout_sec
+        while not condition() and time.monotonic() < end:
+            self.executor.spin_once(timeout_sec=0.1)
+        self.assertTrue(condition())
+
+    def test_get_parameters(self):
+        with patch.object(
+            self.client._get_client, 'call_async', wraps=self.client._get_client.call_async
+        ) as call_async:
+            # Calls made in the same executor cycle share a request
+            future1 = self.client.get_parameters_async(['foo', 'unset'])
+            future2 = self.client.get_parameters_async(['bar.baz', 'foo'])
+            self._spin_until(lambda: future1.done() and future2.done())
+            self.assertEqual(1, call_async.call_count)
+            self.assertEqual(
+                ['foo', 'unset', 'bar.baz'], call_async.call_args[0][0].names)
+
+            self.assertEqual([42, None], [p.value for p in future1.result()])
+            self.assertEqual(Parameter.Type.NOT_SET, future1.result()[1].type_)
+            self.assertEqual(['hello', 42], [p.value for p in future2.result()])
+
+            # Cached parameters don't need a request
+            future = self.client.get_parameters_async(['foo', 'unset'])
+            self.assertTrue(future.done())
+            self.assertEqual([42, None], [p.value for p in future.result()])
+            self.client.invalidate_cache()
+            future = self.client.get_parameters_async(['foo'])
+            self.assertFalse(future.done())
+            self._spin_until(future.done)
+            self.assertEqual(2, call_async.call_count)
+
+    def test_done_callbacks_of_node_added_to_executor_later(self):
+        node = rclpy.create_node('late_client_node', context=self.context)
+        client = ParameterClient(node, '/test_parameter_client/remote_node')
+        try:
+            self.assertTrue(client.wait_for_services(timeout_sec=20))
+            results = []
+            future = client.get_parameters_async(['foo'])
+            future.add_done_callback(lambda future: results.append(future.result()))
+            # The node is only added to an executor once the call was made
+            self.executor.add_node(node)
+            self._spin_until(lambda: len(results) == 1)
+            self.assertEqual([42], [p.value for p in results[0]])
+
+            # Calls answered from the cache run their done callbacks as well
+            node.executor = None
+            future = client.get_parameters_async(['foo'])
+            self.assertFalse(future.done())
+            future.add_done_callback(lambda future: results.append(future.result()))
+            self.executor.add_node(node)
+            self._spin_until(lambda: len(results) == 2)
+            self.assertEqual([42], [p.value for p in results[1]])
+        finally:
+            client.destroy()
+            self.executor.remove_node(node)
+            node.destroy_node()
+
+    def test_cache_follows_parameter_events(self):
+        future = self.client.get_parameters_async(['foo'])
+        self._spin_until(future.done)
+        self._spin_until(
+            lambda: self.remote_node.count_subscribers(
+                '/test_parameter_client/parameter_events') > 0)
+        self.remote_node.set_parameters([
+            Parameter('foo', Parameter.Type.INTEGER, 43),
+            Parameter('new', Parameter.Type.BOOL, True),
+            Parameter('bar.baz', Parameter.Type.NOT_SET),
+        ])
+        self._spin_until(lambda: self.client._generation > 0)
+
+        # The event updated the cache, so no request is needed
+        future = self.client.get_parameters_async(['foo', 'new', 'bar.baz'])
+        self.assertTrue(future.done())
+        self.assertEqual([43, True, None], [p.value for p in future.result()])
+
+    def test_set_parameters(self):
+        with patch.object(
+            self.client._set_client, 'call_async', wraps=self.client._set_client.call_async
+        ) as call_async:
+            future1 = self.client.set_parameters_async(
+                [Parameter('foo', Parameter.Type.INTEGER, 1)])
+            future2 = self.client.set_parameters_async([
+                Parameter('other', Parameter.Type.DOUBLE, 2.0),
+                Parameter('bar.baz', Parameter.Type.NOT_SET),
+            ])
+            self._spin_until(lambda: future1.done() and future2.done())
+            self.assertEqual(1, call_async.call_count)
+        self.assertEqual(1, len(future1.result()))
+        self.assertEqual(2, len(future2.result()))
+        self.assertTrue(all(r.successful for r in future1.result() + future2.result()))
+        self.assertEqual(1, self.remote_node.get_parameter('foo').value)
+        self.assertEqual(2.0, self.remote_node.get_parameter('other').value)
+        self.assertEqual(
+            Parameter.Type.NOT_SET, self.remote_node.get_parameter('bar.baz').type_)
+
+        # Parameters that were set are cached
+        future = self.client.get_parameters_async(['foo', 'other', 'bar.baz'])
+        self.assertTrue(future.done())
+        self.assertEqual([1, 2.0, None], [p.value for p in future.result()])
+
+        with self.assertRaises(TypeError):
+            self.client.set_parameters_async([42])
+
+    def test_list_parameters(self):
+        with patch.object(
+            self.client._list_client, 'call_async', wraps=self.client._list_client.call_async
+        ) as call_async:
+            future1 = self.client.list_parameters_async()
+            future2 = self.client.list_parameters_async()
+            future3 = self.client.list_parameters_async(prefixes=['bar'])
+            self._spin_until(lambda: future1.done() and future2.done() and future3.done())
+            # Identical calls share a request
+            self.assertEqual(2, call_async.call_count)
+        self.assertIn('foo', future1.result().names)
+        self.assertIn('bar.baz', future1.result().names)
+        self.assertEqual(future1.result(), future2.result())
+        self.assertEqual(['bar.baz'], future3.result().names)
+
+
+if __name__ == '__main__':
+    unittest.main()
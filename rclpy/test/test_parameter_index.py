@@ -0,0 +1,103 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from rclpy.parameter import Parameter
+from rclpy.parameter_index import ParameterIndex
+
+
+NAMES = ['foo', 'bar', 'foo.ping', 'foo.pong', 'foo.bar.baz', 'foo.bar.qux.x', 'foobar.a']
+
+
+class TestParameterIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = ParameterIndex()
+        for i, name in enumerate(NAMES):
+            self.index[name] = Parameter(name, Parameter.Type.INTEGER, i)
+
+    def test_mapping(self):
+        self.assertEqual(len(NAMES), len(self.index))
+        self.assertEqual(NAMES, list(self.index))
+        self.assertIn('foo.ping', self.index)
+        self.assertNotIn('foo.bar', self.index)
+        self.assertEqual(2, self.index['foo.ping'].value)
+        self.index['foo.ping'] = Parameter('foo.ping', Parameter.Type.INTEGER, 42)
+        self.assertEqual(42, self.index['foo.ping'].value)
+        self.assertEqual(len(NAMES), len(self.index))
+        with self.assertRaises(KeyError):
+            self.index['foo.bar']
+
+    def test_names_with_prefix(self):
+        self.assertEqual(
+            {'foo.ping', 'foo.pong', 'foo.bar.baz', 'foo.bar.qux.x'},
+            set(self.index.names_with_prefix('foo')))
+        self.assertEqual(
+            {'foo.bar.baz', 'foo.bar.qux.x'}, set(self.index.names_with_prefix('foo.bar')))
+        self.assertEqual(set(NAMES), set(self.index.names_with_prefix('')))
+        self.assertEqual([], self.index.names_with_prefix('fo'))
+        self.assertEqual([], self.index.names_with_prefix('foo.ping'))
+
+    def test_delete(self):
+        del self.index['foo.bar.qux.x']
+        self.assertNotIn('foo.bar.qux.x', self.index)
+        self.assertEqual(['foo.bar.baz'], self.index.names_with_prefix('foo.bar'))
+        # Prefixes without parameters are removed
+        self.assertEqual([], self.index.names_with_prefix('foo.bar.qux'))
+        self.assertNotIn('qux', self.index._find('foo.bar').children)
+        del self.index['foo.bar.baz']
+        self.assertIsNone(self.index._find('foo.bar'))
+        self.assertIsNotNone(self.index._find('foo'))
+        with self.assertRaises(KeyError):
+            del self.index['foo.bar.baz']
+
+    def test_list_all(self):
+        names, prefixes = self.index.list([])
+        self.assertEqual(set(NAMES), set(names))
+        self.assertEqual(len(NAMES), len(names))
+        self.assertEqual({'foo', 'foo.bar', 'foo.bar.qux', 'foobar'}, set(prefixes))
+
+    def test_list_depth(self):
+        names, prefixes = self.index.list([], depth=1)
+        self.assertEqual({'foo', 'bar'}, set(names))
+        self.assertEqual([], prefixes)
+        names, prefixes = self.index.list([], depth=2)
+        self.assertEqual({'foo', 'bar', 'foo.ping', 'foo.pong', 'foobar.a'}, set(names))
+        self.assertEqual({'foo', 'foobar'}, set(prefixes))
+
+    def test_list_prefixes(self):
+        names, prefixes = self.index.list(['foo'])
+        self.assertEqual({'foo.ping', 'foo.pong', 'foo.bar.baz', 'foo.bar.qux.x'}, set(names))
+        self.assertEqual({'foo', 'foo.bar', 'foo.bar.qux'}, set(prefixes))
+        # The depth counts the separators of the whole name
+        names, prefixes = self.index.list(['foo'], depth=3)
+        self.assertEqual({'foo.ping', 'foo.pong', 'foo.bar.baz'}, set(names))
+        self.assertEqual({'foo', 'foo.bar'}, set(prefixes))
+        names, prefixes = self.index.list(['foo.bar'], depth=2)
+        self.assertEqual(([], []), (names, prefixes))
+        # Overlapping prefixes list each parameter once
+        names, prefixes = self.index.list(['foo.bar', 'foo', 'foo.bar.qux', 'missing'])
+        self.assertEqual(4, len(names))
+        self.assertEqual({'foo', 'foo.bar', 'foo.bar.qux'}, set(prefixes))
+        self.assertEqual(len(prefixes), len(set(prefixes)))
+        # A requested prefix is listed when parameters are found deeper under it
+        del self.index['foo.bar.baz']
+        names, prefixes = self.index.list(['foo.bar'])
+        self.assertEqual(['foo.bar.qux.x'], names)
+        self.assertEqual({'foo.bar', 'foo.bar.qux'}, set(prefixes))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import unittest
+
+import rclpy
+from rclpy.clock import ClockType
+from rclpy.clock import ROSClock
+from rclpy.constants import S_TO_NS
+from rclpy.duration import Duration
+from rclpy.rate import Rate
+from rclpy.time import Time
+
+
+class TestRate(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.context = rclpy.context.Context()
+        rclpy.init(context=cls.context)
+        cls.node = rclpy.create_node('TestRate', context=cls.context)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.node.destroy_node()
+        rclpy.shutdown(context=cls.context)
+
+    def test_invalid_frequency(self):
+        with self.assertRaises(ValueError):
+            self.node.create_rate(0)
+        with self.assertRaises(ValueError):
+            self.node.create_rate(-1.0)
+
+    def test_create_rate(self):
+        rate = self.node.create_rate(10)
+        self.assertEqual(Duration(seconds=0.1), rate.period)
+
+    def _set_time(self, clock, nanoseconds):
+        clock.set_ros_time_override(Time(nanoseconds=nanoseconds, clock_type=ClockType.ROS_TIME))
+
+    def _sleep_until_time_is(self, rate, clock, nanoseconds):
+        results = []
+        thread = threading.Thread(target=lambda: results.append(rate.sleep()))
+        thread.start()
+        try:
+            # Simulated time does not advance on its own, so the sleep can't end yet
+            thread.join(0.01)
+            self.assertTrue(thread.is_alive())
+            self._set_time(clock, nanoseconds)
+        finally:
+            thread.join(5.0)
+        self.assertFalse(thread.is_alive())
+        return results[0]
+
+    def _ros_clock(self, start_ns):
+        clock = ROSClock()
+        clock._set_ros_time_is_active(True)
+        self._set_time(clock, start_ns)
+        return clock
+
+    def test_no_drift(self):
+        start_ns = S_TO_NS
+        period_ns = S_TO_NS // 20
+        clock = self._ros_clock(start_ns)
+        rate = Rate(20, clock=clock, context=self.context)
+        for i in range(10):
+            deadline_ns = start_ns + (i + 1) * period_ns
+            # Work that takes a fraction of the period
+            self._set_time(clock, deadline_ns - period_ns + period_ns // 5)
+            self.assertEqual(deadline_ns, rate._next_deadline_ns)
+            # Waking up late does not delay the following deadlines
+            self.assertTrue(self._sleep_until_time_is(rate, clock, deadline_ns + 1000))
+        self.assertEqual(start_ns + 11 * period_ns, rate._next_deadline_ns)
+        self.assertEqual(10, rate.num_cycles)
+        self.assertEqual(0, rate.num_overruns)
+        self.assertEqual(Duration(), rate.max_overrun)
+
+    def test_overrun(self):
+        start_ns = S_TO_NS
+        period_ns = S_TO_NS // 20
+        clock = self._ros_clock(start_ns)
+        rate = Rate(20, clock=clock, context=self.context)
+        # The deadline passed already so sleep returns without time advancing
+        self._set_time(clock, start_ns + 12 * period_ns // 5)
+        self.assertTrue(rate.sleep())
+        self.assertEqual(1, rate.num_cycles)
+        self.assertEqual(1, rate.num_overruns)
+        self.assertEqual(Duration(nanoseconds=7 * period_ns // 5), rate.max_overrun)
+        # Missed deadlines are skipped instead of being caught up on
+        self.assertEqual(start_ns + 3 * period_ns, rate._next_deadline_ns)
+        self.assertTrue(self._sleep_until_time_is(rate, clock, start_ns + 3 * period_ns))
+        self.assertEqual(2, rate.num_cycles)
+        self.assertEqual(1, rate.num_overruns)
+        self.assertEqual(start_ns + 4 * period_ns, rate._next_deadline_ns)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,187 @@
+# Copyright 2019 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+
+from rcl_interfaces.srv import GetParameters
+import rclpy
+import rclpy.executors
+from rclpy.serialization import deserialize_message
+from rclpy.serialization import serialize_message
+from rclpy.service import ResponseCache
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            ResponseCache(max_entries=0)
+        with self.assertRaises(ValueError):
+            ResponseCache(ttl_sec=0)
+
+    def test_get_put(self):
+        cache = ResponseCache()
+        self.assertIsNone(cache.get(b'foo'))
+        cache.put(b'foo', 'bar')
+        self.assertEqual('bar', cache.get(b'foo'))
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(1, cache.misses)
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2)
+        cache.put(b'a', 1)
+        cache.put(b'b', 2)
+        # Touch 'a' so that 'b' is the least recently used entry
+        self.assertEqual(1, cache.get(b'a'))
+        cache.put(b'c', 3)
+        self.assertEqual(2, len(cache))
+        self.assertIsNone(cache.get(b'b'))
+        self.assertEqual(1, cache.get(b'a'))
+        self.assertEqual(3, cache.get(b'c'))
+
+    def test_ttl(self):
+        cache = ResponseCache(ttl_sec=0.1)
+        cache.put(b'a', 1)
+        self.assertEqual(1, cache.get(b'a'))
+        time.sleep(0.2)
+        self.assertIsNone(cache.get(b'a'))
+        self.assertEqual(0, len(cache))
+
+    def test_invalidate(self):
+        cache = ResponseCache()
+        cache.put(b'a', 1)
+        cache.put(b'b', 2)
+        cache.invalidate(b'a')
+        self.assertIsNone(cache.get(b'a'))
+        self.assertEqual(2, cache.get(b'b'))
+        cache.invalidate()
+        self.assertEqual(0, len(cache))
+
+
+class TestService(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.context = rclpy.context.Context()
+        rclpy.init(context=cls.context)
+        cls.node = rclpy.create_node('TestService', context=cls.context)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.node.destroy_node()
+        rclpy.shutdown(context=cls.context)
+
+    def _call(self, cli, request):
+        executor = rclpy.executors.SingleThreadedExecutor(context=self.context)
+        future = cli.call_async(request)
+        rclpy.spin_until_future_complete(self.node, future, executor=executor, timeout_sec=5.0)
+        self.assertTrue(future.done())
+        return future.result()
+
+    def test_response_cache(self):
+        num_calls = 0
+        request_types = set()
+
+        def callback(request, response):
+            nonlocal num_calls
+            num_calls += 1
+            request_types.add(type(request))
+            response.values = [p.get_parameter_value() for p in
+                               self.node.get_parameters(request.names)]
+            return response
+
+        cli = self.node.create_client(GetParameters, 'test_response_cache')
+        srv = self.node.create_service(
+            GetParameters, 'test_response_cache', callback,
+            response_cache=ResponseCache(max_entries=4))
+        try:
+            self.assertTrue(cli.wait_for_service(timeout_sec=20))
+            request = GetParameters.Request(names=['foo'])
+            self.assertIsNotNone(self._call(cli, request))
+            self.assertEqual(1, num_calls)
+            # An identical request is served from the cache
+            self.assertIsNotNone(self._call(cli, GetParameters.Request(names=['foo'])))
+            self.assertEqual(1, num_calls)
+            # A different request calls the callback
+            self.assertIsNotNone(self._call(cli, GetParameters.Request(names=['bar'])))
+            self.assertEqual(2, num_calls)
+            # Invalidating the cache causes the callback to be called again
+            srv.invalidate_cached_responses(request)
+            self.assertIsNotNone(self._call(cli, request))
+            self.assertEqual(3, num_calls)
+            srv.invalidate_cached_responses()
+            self.assertEqual(0, len(srv.response_cache))
+            # Requests taken in serialized form are converted before calling the callback
+            self.assertEqual({GetParameters.Request}, request_types)
+        finally:
+            self.node.destroy_client(cli)
+            self.node.destroy_service(srv)
+
+    def test_raw_service(self):
+        received = []
+
+        def callback(request, header):
+            received.append(request)
+            request_msg = deserialize_message(request, GetParameters.Request)
+            self.assertEqual(['foo'], request_msg.names)
+            return serialize_message(GetParameters.Response())
+
+        cli = self.node.create_client(GetParameters, 'test_raw_service')
+        srv = self.node.create_service(GetParameters, 'test_raw_service', callback, raw=True)
+        try:
+            self.assertTrue(cli.wait_for_service(timeout_sec=20))
+            response = self._call(cli, GetParameters.Request(names=['foo']))
+            self.assertIsInstance(response, GetParameters.Response)
+            self.assertEqual(1, len(received))
+            self.assertIsInstance(received[0], bytes)
+        finally:
+            self.node.destroy_client(cli)
+            self.node.destroy_service(srv)
+
+    def test_raw_service_deferred_response(self):
+        pending = []
+
+        def callback(request, header):
+            pending.append(header)
+
+        cli = self.node.create_client(GetParameters, 'test_raw_service_deferred', raw=True)
+        srv = self.node.create_service(
+            GetParameters, 'test_raw_service_deferred', callback, raw=True)
+        try:
+            self.assertTrue(cli.wait_for_service(timeout_sec=20))
+            with self.assertRaises(TypeError):
+                cli.call_async(GetParameters.Request())
+            executor = rclpy.executors.SingleThreadedExecutor(context=self.context)
+            future = cli.call_async(serialize_message(GetParameters.Request(names=['foo'])))
+            rclpy.spin_until_future_complete(
+                self.node, future, executor=executor, timeout_sec=1.0)
+            self.assertFalse(future.done())
+            self.assertEqual(1, len(pending))
+            with self.assertRaises(TypeError):
+                srv.send_response(GetParameters.Response(), pending[0])
+            srv.send_response(serialize_message(GetParameters.Response()), pending[0])
+            rclpy.spin_until_future_complete(
+                self.node, future, executor=executor, timeout_sec=5.0)
+            self.assertTrue(future.done())
+            self.assertIsInstance(future.result(), bytes)
+            response = deserialize_message(future.result(), GetParameters.Response)
+            self.assertIsInstance(response, GetParameters.Response)
+        finally:
+            self.node.destroy_client(cli)
+            self.node.destroy_service(srv)
+
+
+if __name__ == '__main__':
+    unittest.main()
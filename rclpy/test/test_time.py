@@ -14,12 +14,22 @@
 
 import unittest
 
+from builtin_interfaces.msg import Time as TimeMsg
 from rclpy.clock import ClockType
 from rclpy.duration import Duration
+from rclpy.time import nanoseconds_to_stamps
+from rclpy.time import stamp_differences
+from rclpy.time import stamps_in_range
+from rclpy.time import stamps_to_nanoseconds
 from rclpy.time import Time
 
 from test_msgs.msg import Builtins
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class TestTime(unittest.TestCase):
 
@@ -214,7 +224,56 @@ class TestTime(unittest.TestCase):
         assert isinstance(duration2, Duration)
         assert duration2.nanoseconds == 1
 
+        # Negative durations are normalized so that nanosec is positive
+        msg = Duration(seconds=-1.5).to_msg()
+        assert msg.sec == -2
+        assert msg.nanosec == 5e8
+        assert Duration.from_msg(msg).nanoseconds == -15e8
+
+    def test_large_integer_values_are_exact(self):
+        # Integer seconds are not converted to floating point
+        seconds = 2**33 + 1
+        time = Time(seconds=seconds, nanoseconds=1)
+        assert time.nanoseconds == seconds * 1000 * 1000 * 1000 + 1
+        assert (seconds, 1) == time.seconds_nanoseconds()
+        assert Duration(seconds=seconds).nanoseconds == seconds * 1000 * 1000 * 1000
+
+    def test_slots(self):
+        # Time and Duration are created in large numbers, so they don't have a __dict__
+        with self.assertRaises(AttributeError):
+            Time().foo = 1
+        with self.assertRaises(AttributeError):
+            Duration().foo = 1
+
     def test_seconds_nanoseconds(self):
         assert (1, int(5e8)) == Time(seconds=1, nanoseconds=5e8).seconds_nanoseconds()
         assert (1, int(5e8)) == Time(seconds=0, nanoseconds=15e8).seconds_nanoseconds()
         assert (0, 0) == Time().seconds_nanoseconds()
+
+    @unittest.skipIf(numpy is None, 'NumPy is not available')
+    def test_vectorized_stamp_conversions(self):
+        stamps = [TimeMsg(sec=i, nanosec=i * 1000) for i in range(1000)]
+        nanoseconds = stamps_to_nanoseconds(stamps)
+        assert nanoseconds.dtype == numpy.int64
+        assert len(stamps) == len(nanoseconds)
+        for stamp, stamp_ns in zip(stamps, nanoseconds):
+            assert Time.from_msg(stamp).nanoseconds == stamp_ns
+
+        stamps2 = nanoseconds_to_stamps(nanoseconds)
+        assert [(s.sec, s.nanosec) for s in stamps] == [(s.sec, s.nanosec) for s in stamps2]
+
+        assert 0 == len(stamps_to_nanoseconds([]))
+        assert 0 == len(nanoseconds_to_stamps(stamps_to_nanoseconds([])))
+
+    @unittest.skipIf(numpy is None, 'NumPy is not available')
+    def test_vectorized_stamp_operations(self):
+        nanoseconds = stamps_to_nanoseconds(TimeMsg(sec=i) for i in range(10))
+
+        differences = stamp_differences(nanoseconds, Time(seconds=2))
+        assert differences.tolist() == [(i - 2) * 10**9 for i in range(10)]
+        assert stamp_differences(nanoseconds, TimeMsg(sec=2)).tolist() == differences.tolist()
+        assert stamp_differences(nanoseconds[1:], nanoseconds[:-1]).tolist() == [10**9] * 9
+
+        in_range = stamps_in_range(nanoseconds, Time(seconds=2), TimeMsg(sec=5))
+        assert in_range.tolist() == [2 <= i < 5 for i in range(10)]
+        assert stamps_in_range(nanoseconds, 0, 10**9).tolist() == [True] + [False] * 9
@@ -26,6 +26,7 @@ from rclpy.duration import Duration
 from rclpy.parameter import Parameter
 from rclpy.time import Time
 from rclpy.time_source import CLOCK_TOPIC
+from rclpy.time_source import get_shared_time_source
 from rclpy.time_source import TimeSource
 import rosgraph_msgs.msg
 
@@ -160,6 +161,47 @@ class TestTimeSource(unittest.TestCase):
         assert time_source._node == node2
         assert time_source._clock_sub is None
 
+    def test_shared_time_source(self):
+        use_sim_time = [Parameter('use_sim_time', Parameter.Type.BOOL, True)]
+        nodes = [
+            rclpy.create_node(
+                'TestSharedTimeSource{}'.format(i), namespace='/rclpy', context=self.context,
+                initial_parameters=use_sim_time, shared_time_source=True)
+            for i in range(3)]
+        try:
+            shared_time_source = get_shared_time_source(self.context)
+            self.assertIs(shared_time_source, get_shared_time_source(self.context))
+            for node in nodes:
+                self.assertTrue(node.get_clock().ros_time_is_active)
+                self.assertIsNone(node._time_source._clock_sub)
+
+            # Only one of the nodes subscribes to the clock topic
+            clock_subs = [
+                sub for node in nodes for sub in node.subscriptions if sub.topic == CLOCK_TOPIC]
+            self.assertEqual(1, len(clock_subs))
+
+            msg = rosgraph_msgs.msg.Clock()
+            msg.clock.sec = 42
+            shared_time_source.clock_callback(msg)
+            for node in nodes:
+                self.assertEqual(
+                    Time(seconds=42, clock_type=ClockType.ROS_TIME), node.get_clock().now())
+
+            # Destroying the subscribed node hands the subscription over to another one
+            subscribed_node = shared_time_source._subscribed_time_source._node
+            nodes.remove(subscribed_node)
+            subscribed_node.destroy_node()
+            self.assertIsNotNone(shared_time_source._clock_sub)
+            self.assertIn(shared_time_source._subscribed_time_source._node, nodes)
+
+            # Turning sim time off on a node only affects that node
+            nodes[0].set_parameters([Parameter('use_sim_time', Parameter.Type.BOOL, False)])
+            self.assertFalse(nodes[0].get_clock().ros_time_is_active)
+            self.assertTrue(nodes[1].get_clock().ros_time_is_active)
+        finally:
+            for node in nodes:
+                node.destroy_node()
+
     def test_forwards_jump(self):
         time_source = TimeSource(node=self.node)
         clock = ROSClock()
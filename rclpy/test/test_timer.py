@@ -18,7 +18,9 @@ import time
 
 import pytest
 import rclpy
+from rclpy.clock import ClockType
 from rclpy.executors import SingleThreadedExecutor
+from rclpy.time import Time
 
 
 TEST_PERIODS = (
@@ -143,3 +145,44 @@ def test_cancel_reset(period):
             node.destroy_node()
     finally:
         rclpy.shutdown(context=context)
+
+
+def test_ros_time_timer_fast_forward():
+    context = rclpy.context.Context()
+    rclpy.init(context=context)
+    try:
+        node = rclpy.create_node('test_ros_time_timer', context=context)
+        try:
+            executor = SingleThreadedExecutor(context=context, fast_forward=True)
+            try:
+                executor.add_node(node)
+                executor.spin_once(timeout_sec=0)
+
+                clock = node.get_clock()
+                clock._set_ros_time_is_active(True)
+                clock.set_ros_time_override(Time(seconds=1, clock_type=ClockType.ROS_TIME))
+
+                callbacks = []
+                timer = node.create_timer(
+                    10.0, lambda: callbacks.append(clock.now()), clock=clock)
+                try:
+                    assert timer.clock is clock
+                    # Simulated time does not advance, so the timer does not fire
+                    executor.spin_once(timeout_sec=0.1)
+                    assert [] == callbacks
+
+                    # Jumping past the deadline fires the timer without waiting
+                    clock.set_ros_time_override(
+                        Time(seconds=11.5, clock_type=ClockType.ROS_TIME))
+                    begin_time = time.time()
+                    executor.spin_once(timeout_sec=5.0)
+                    assert time.time() - begin_time < 1.0
+                    assert [Time(seconds=11.5, clock_type=ClockType.ROS_TIME)] == callbacks
+                finally:
+                    node.destroy_timer(timer)
+            finally:
+                executor.shutdown()
+        finally:
+            node.destroy_node()
+    finally:
+        rclpy.shutdown(context=context)